@@ -1,11 +1,14 @@
 """Application layer - Use cases and orchestration."""
 
-from .container import Container, container
+from .container import Container, get_container
+from .result_cache import CacheInfo, ClassificationCache
 from .use_cases import ClassifyEmailUseCase, ListModelsUseCase
 
 __all__ = [
     "ClassifyEmailUseCase",
     "ListModelsUseCase",
+    "CacheInfo",
+    "ClassificationCache",
     "Container",
-    "container",
+    "get_container",
 ]
@@ -1,17 +1,39 @@
 """Dependency injection container."""
 
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Literal
 
-from ..config import Settings
+from ..config import Settings, get_settings
+from ..domain.entities import ModelType
+from ..domain.ports import IOutputFormatter
 from ..domain.services import EmailClassifierService
 from ..infrastructure.adapters import (
+    HashingSemanticCache,
     JoblibModelLoader,
     JsonFormatter,
     SklearnPredictor,
     TextFormatter,
 )
+from .result_cache import ClassificationCache
 from .use_cases import ClassifyEmailUseCase, ListModelsUseCase
 
+logger = logging.getLogger(__name__)
+
+# Predictor type and fallback model (used if the model's files are missing)
+_PREDICTOR_SPECS: dict[ModelType, tuple[str, ModelType | None]] = {
+    "spam_detector": ("spam", None),
+    "phishing_detector": ("phishing", "spam_detector"),
+}
+
+# Formatter class per output format (formatters are stateless, one instance per format)
+_FORMATTER_TYPES: dict[str, type[IOutputFormatter]] = {
+    "text": TextFormatter,
+    "json": JsonFormatter,
+}
+
 
 class Container:
     """
@@ -23,6 +45,10 @@ class Container:
     This implements the Composition Root pattern, centralizing
     all object creation and dependency management.
 
+    Singleton getters use double-checked locking with one lock per slot,
+    so concurrent first requests load each model exactly once while
+    later calls stay lock-free.
+
     Examples:
         >>> container = Container()
         >>> classify_use_case = container.get_classify_use_case()
@@ -36,62 +62,79 @@ class Container:
         Args:
             settings: Application settings. If None, uses global settings.
         """
-        from ..config import settings as global_settings
-
-        self._settings = settings or global_settings
+        self._settings = settings or get_settings()
         self._model_loader: JoblibModelLoader | None = None
-        self._spam_predictor: SklearnPredictor | None = None
-        self._phishing_predictor: SklearnPredictor | None = None
+        self._predictors: dict[ModelType, SklearnPredictor] = {}
         self._classifier_service: EmailClassifierService | None = None
+        self._result_cache: ClassificationCache | None = None
+        self._semantic_cache: HashingSemanticCache | None = None
+        self._formatters: dict[str, IOutputFormatter] = {}
+        self._classify_use_cases: dict[str, ClassifyEmailUseCase] = {}
+        self._list_models_use_case: ListModelsUseCase | None = None
+        self._locks = {
+            slot: threading.Lock()
+            for slot in (
+                "model_loader",
+                *_PREDICTOR_SPECS,
+                "classifier",
+                "result_cache",
+                "semantic_cache",
+            )
+        }
 
     def get_model_loader(self) -> JoblibModelLoader:
         """Get or create model loader (singleton)."""
         if self._model_loader is None:
-            self._model_loader = JoblibModelLoader(models_dir=self._settings.get_models_path())
+            with self._locks["model_loader"]:
+                if self._model_loader is None:
+                    self._model_loader = JoblibModelLoader(
+                        models_dir=self._settings.get_models_path(),
+                        mmap_mode="r" if self._settings.mmap_models else None,
+                    )
         return self._model_loader
 
     def get_spam_predictor(self) -> SklearnPredictor:
         """Get or create spam predictor (singleton)."""
-        if self._spam_predictor is None:
-            loader = self.get_model_loader()
-            vectorizer, model, metadata = loader.load("spam_detector")
-
-            self._spam_predictor = SklearnPredictor(
-                vectorizer=vectorizer, model=model, metadata=metadata, predictor_type="spam"
-            )
-        return self._spam_predictor
+        return self._get_predictor("spam_detector")
 
     def get_phishing_predictor(self) -> SklearnPredictor:
-        """Get or create phishing predictor (singleton)."""
-        if self._phishing_predictor is None:
-            loader = self.get_model_loader()
-
-            try:
-                vectorizer, model, metadata = loader.load("phishing_detector")
-
-                self._phishing_predictor = SklearnPredictor(
-                    vectorizer=vectorizer, model=model, metadata=metadata, predictor_type="phishing"
-                )
-            except FileNotFoundError:
-                # Fallback: use spam detector for both if phishing doesn't exist
-                if self._settings.verbose:
-                    print("Warning: phishing_detector not found, using spam_detector")
-                self._phishing_predictor = self.get_spam_predictor()
-
-        return self._phishing_predictor
+        """Get or create phishing predictor (singleton), falling back to spam."""
+        return self._get_predictor("phishing_detector")
 
     def get_classifier_service(self) -> EmailClassifierService:
         """Get or create classifier service (singleton)."""
         if self._classifier_service is None:
-            self._classifier_service = EmailClassifierService(
-                spam_predictor=self.get_spam_predictor(),
-                phishing_predictor=self.get_phishing_predictor(),
-            )
+            with self._locks["classifier"]:
+                if self._classifier_service is None:
+                    self._classifier_service = EmailClassifierService(
+                        spam_predictor=self.get_spam_predictor(),
+                        phishing_predictor=self.get_phishing_predictor(),
+                        phishing_skip_threshold=self._settings.phishing_skip_threshold,
+                    )
         return self._classifier_service
 
-    def get_formatter(
-        self, format_type: Literal["text", "json"] | None = None
-    ) -> TextFormatter | JsonFormatter:
+    def get_result_cache(self) -> ClassificationCache:
+        """Get or create classification result cache (singleton)."""
+        if self._result_cache is None:
+            with self._locks["result_cache"]:
+                if self._result_cache is None:
+                    self._result_cache = ClassificationCache(
+                        maxsize=self._settings.classify_cache_size
+                    )
+        return self._result_cache
+
+    def get_semantic_cache(self) -> HashingSemanticCache | None:
+        """Get or create near-duplicate result cache (singleton), or None if disabled."""
+        if self._semantic_cache is None and self._settings.semantic_cache_size > 0:
+            with self._locks["semantic_cache"]:
+                if self._semantic_cache is None:
+                    self._semantic_cache = HashingSemanticCache(
+                        maxsize=self._settings.semantic_cache_size,
+                        threshold=self._settings.semantic_cache_threshold,
+                    )
+        return self._semantic_cache
+
+    def get_formatter(self, format_type: Literal["text", "json"] | None = None) -> IOutputFormatter:
         """
         Get formatter instance.
 
@@ -99,14 +142,23 @@ class Container:
             format_type: "text" or "json". If None, uses setting default.
 
         Returns:
-            Formatter instance (not cached, creates new each time)
+            Formatter instance (cached per format, formatters are stateless)
+
+        Raises:
+            ValueError: If format_type is not a registered format
         """
         fmt = format_type or self._settings.default_format
 
-        if fmt == "json":
-            return JsonFormatter()
-        else:
-            return TextFormatter()
+        formatter = self._formatters.get(fmt)
+        if formatter is None:
+            formatter_type = _FORMATTER_TYPES.get(fmt)
+            if formatter_type is None:
+                raise ValueError(
+                    f"Unknown output format '{fmt}'. Valid formats: {', '.join(_FORMATTER_TYPES)}"
+                )
+            formatter = formatter_type()
+            self._formatters[fmt] = formatter
+        return formatter
 
     def get_classify_use_case(
         self, format_type: Literal["text", "json"] | None = None
@@ -118,26 +170,107 @@ class Container:
             format_type: Output format. If None, uses setting default.
 
         Returns:
-            Configured ClassifyEmailUseCase instance
+            Configured ClassifyEmailUseCase instance (cached per format)
         """
-        return ClassifyEmailUseCase(
-            classifier_service=self.get_classifier_service(),
-            formatter=self.get_formatter(format_type),
-        )
+        fmt = format_type or self._settings.default_format
+
+        use_case = self._classify_use_cases.get(fmt)
+        if use_case is None:
+            use_case = ClassifyEmailUseCase(
+                classifier_service=self.get_classifier_service(),
+                formatter=self.get_formatter(fmt),
+                result_cache=self.get_result_cache(),
+                semantic_cache=self.get_semantic_cache(),
+            )
+            self._classify_use_cases[fmt] = use_case
+        return use_case
 
     def get_list_models_use_case(self) -> ListModelsUseCase:
-        """Get list models use case."""
-        return ListModelsUseCase(model_loader=self.get_model_loader())
+        """Get or create list models use case (singleton)."""
+        if self._list_models_use_case is None:
+            self._list_models_use_case = ListModelsUseCase(model_loader=self.get_model_loader())
+        return self._list_models_use_case
+
+    def warmup(self) -> None:
+        """
+        Load both predictors and build the classifier service up front.
+
+        The two models are deserialized in parallel (joblib file reads
+        release the GIL), so the first classification doesn't pay for
+        sequential model loading.
+
+        Raises:
+            FileNotFoundError: If the spam model is missing
+        """
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(self.get_spam_predictor),
+                pool.submit(self.get_phishing_predictor),
+            ]
+            for future in futures:
+                future.result()
+
+        self.get_classifier_service()
+        self.get_list_models_use_case()
 
     def clear_cache(self) -> None:
         """Clear all cached instances and model cache."""
         if self._model_loader:
             self._model_loader.clear_cache()
 
-        self._spam_predictor = None
-        self._phishing_predictor = None
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+
+        self._predictors.clear()
         self._classifier_service = None
+        self._formatters.clear()
+        self._classify_use_cases.clear()
+        self._list_models_use_case = None
 
+    # === Private methods ===
 
-# Global container instance (can be overridden)
-container = Container()
+    def _get_predictor(self, model_name: ModelType) -> SklearnPredictor:
+        """Get or create the predictor for a model (singleton per model)."""
+        predictor = self._predictors.get(model_name)
+        if predictor is None:
+            with self._locks[model_name]:
+                predictor = self._predictors.get(model_name)
+                if predictor is None:
+                    predictor = self._load_predictor(model_name)
+                    self._predictors[model_name] = predictor
+        return predictor
+
+    def _load_predictor(self, model_name: ModelType) -> SklearnPredictor:
+        """Load a predictor, using its fallback model's predictor if files are missing."""
+        predictor_type, fallback = _PREDICTOR_SPECS[model_name]
+
+        try:
+            vectorizer, model, metadata = self.get_model_loader().load(model_name)
+        except FileNotFoundError:
+            if fallback is None:
+                raise
+            # e.g. use spam detector for both if phishing doesn't exist
+            logger.warning("%s not found, using %s", model_name, fallback)
+            return self._get_predictor(fallback)
+
+        return SklearnPredictor(
+            vectorizer=vectorizer, model=model, metadata=metadata, predictor_type=predictor_type
+        )
+
+
+@lru_cache(maxsize=1)
+def get_container() -> Container:
+    """
+    Get the process-wide container built from global settings.
+
+    Created on first call rather than at import, so importing the
+    application package does no wiring. Build a Container directly for
+    custom settings.
+
+    Returns:
+        Shared Container instance
+    """
+    return Container()
@@ -0,0 +1,101 @@
+"""In-memory LRU cache for classification results."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from ..domain.entities import ClassificationResult
+
+CacheKey = tuple[bytes, str | None, str | None]
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, shaped like functools.lru_cache's cache_info()."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ClassificationCache:
+    """
+    Thread-safe LRU cache of classification results keyed by email content.
+
+    Keys are a BLAKE2b digest of the email text plus subject and sender, so
+    repeated submissions of the same email (retries, duplicates, health
+    probes) skip vectorization and inference entirely.
+
+    Attributes:
+        _maxsize: Maximum number of cached results (0 disables caching)
+        _entries: Cached results, least recently used first
+        _lock: Guards concurrent access from API worker threads
+        hits: Number of cache hits
+        misses: Number of cache misses
+
+    Examples:
+        >>> cache = ClassificationCache(maxsize=1024)
+        >>> key = cache.make_key("WINNER! Click here!", None, None)
+        >>> cache.get(key) is None
+        True
+        >>> cache.put(key, result)
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached results (0 disables caching)
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, ClassificationResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(email_text: str, subject: str | None, sender: str | None) -> CacheKey:
+        """Build cache key from email content."""
+        digest = hashlib.blake2b(email_text.encode("utf-8"), digest_size=16).digest()
+        return (digest, subject, sender)
+
+    def get(self, key: CacheKey) -> ClassificationResult | None:
+        """Get cached result (marking it most recently used), or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: CacheKey, result: ClassificationResult) -> None:
+        """Store result, evicting the least recently used entry if full."""
+        if self._maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """Get hit/miss counters and current size."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """Remove all cached results and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        return len(self._entries)
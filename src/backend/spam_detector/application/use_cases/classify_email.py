@@ -1,8 +1,12 @@
 """Classify email use case."""
 
+from collections.abc import Sequence
+from dataclasses import replace
+
 from ...domain.entities import ClassificationResult, Email
-from ...domain.ports import DetailLevel, IOutputFormatter
+from ...domain.ports import DetailLevel, IOutputFormatter, ISemanticCache
 from ...domain.services import EmailClassifierService
+from ..result_cache import CacheInfo, CacheKey, ClassificationCache
 
 
 class ClassifyEmailUseCase:
@@ -19,6 +23,8 @@ class ClassifyEmailUseCase:
     Attributes:
         _classifier_service: Domain service for classification
         _formatter: Output formatter implementation
+        _result_cache: Optional cache of results keyed by email content
+        _semantic_cache: Optional cache of results for near-duplicate emails
 
     Examples:
         >>> use_case = ClassifyEmailUseCase(service, formatter)
@@ -28,7 +34,11 @@ class ClassifyEmailUseCase:
     """
 
     def __init__(
-        self, classifier_service: EmailClassifierService, formatter: IOutputFormatter
+        self,
+        classifier_service: EmailClassifierService,
+        formatter: IOutputFormatter,
+        result_cache: ClassificationCache | None = None,
+        semantic_cache: ISemanticCache | None = None,
     ) -> None:
         """
         Initialize use case with dependencies.
@@ -36,9 +46,14 @@ class ClassifyEmailUseCase:
         Args:
             classifier_service: Service for email classification
             formatter: Formatter for output rendering
+            result_cache: Cache for repeated emails. If None, always classifies.
+            semantic_cache: Cache for near-duplicate emails, consulted after
+                result_cache. If None, only exact repeats are served from cache.
         """
         self._classifier_service = classifier_service
         self._formatter = formatter
+        self._result_cache = result_cache
+        self._semantic_cache = semantic_cache
 
     def execute(
         self,
@@ -62,15 +77,44 @@ class ClassifyEmailUseCase:
         Raises:
             ValueError: If email_text is empty or invalid
         """
-        # Create email entity
         email = Email(text=email_text, subject=subject, sender=sender)
+        return self.execute_email(email, detail_level=detail_level)
 
-        # Classify
-        result = self._classifier_service.classify(email)
+    def execute_email(self, email: Email, detail_level: DetailLevel = "simple") -> str:
+        """
+        Execute email classification workflow for an already-built Email.
+
+        Args:
+            email: Validated Email entity to classify
+            detail_level: Output detail level (simple/detailed/debug)
+
+        Returns:
+            Formatted classification result as string
+        """
+        # Classify (served from cache for repeated emails)
+        result = self.execute_raw_email(email)
 
         # Format output
         return self._formatter.format(result, detail_level=detail_level)
 
+    def execute_batch(
+        self, emails: Sequence[Email], detail_level: DetailLevel = "simple"
+    ) -> list[str]:
+        """
+        Execute classification workflow for several already-built Emails.
+
+        Args:
+            emails: Validated Email entities to classify
+            detail_level: Output detail level (simple/detailed/debug)
+
+        Returns:
+            One formatted result per email, in input order
+        """
+        return [
+            self._formatter.format(result, detail_level=detail_level)
+            for result in self.execute_raw_email_batch(emails)
+        ]
+
     def execute_raw(
         self, email_text: str, subject: str | None = None, sender: str | None = None
     ) -> ClassificationResult:
@@ -78,7 +122,46 @@ class ClassifyEmailUseCase:
         Execute classification without formatting.
 
         Useful when caller wants direct access to ClassificationResult
-        for further processing.
+        for further processing. Cached results are returned with
+        execution_time_ms=0.0.
+
+        Args:
+            email_text: Email body text to classify
+            subject: Optional email subject
+            sender: Optional sender email address
+
+        Returns:
+            Raw ClassificationResult entity
+
+        Raises:
+            ValueError: If email_text is empty or invalid
+        """
+        return self.execute_raw_email(Email(text=email_text, subject=subject, sender=sender))
+
+    def execute_raw_email(self, email: Email) -> ClassificationResult:
+        """
+        Execute classification without formatting for an already-built Email.
+
+        Args:
+            email: Validated Email entity to classify
+
+        Returns:
+            Raw ClassificationResult entity
+        """
+        key = self._make_key(email)
+        cached = self._get_cached(key, email)
+        if cached is not None:
+            return cached
+
+        result = self._classifier_service.classify(email)
+        self._store(key, result)
+        return result
+
+    async def execute_raw_async(
+        self, email_text: str, subject: str | None = None, sender: str | None = None
+    ) -> ClassificationResult:
+        """
+        Execute classification without formatting, without blocking the event loop.
 
         Args:
             email_text: Email body text to classify
@@ -92,5 +175,114 @@ class ClassifyEmailUseCase:
             ValueError: If email_text is empty or invalid
         """
         email = Email(text=email_text, subject=subject, sender=sender)
+        return await self.execute_raw_email_async(email)
+
+    async def execute_raw_email_async(self, email: Email) -> ClassificationResult:
+        """
+        Execute classification for an already-built Email without blocking the event loop.
+
+        Args:
+            email: Validated Email entity to classify
+
+        Returns:
+            Raw ClassificationResult entity
+        """
+        key = self._make_key(email)
+        cached = self._get_cached(key, email)
+        if cached is not None:
+            return cached
+
+        result = await self._classifier_service.classify_async(email)
+        self._store(key, result)
+        return result
+
+    def execute_raw_batch(
+        self, emails: list[tuple[str, str | None, str | None]]
+    ) -> list[ClassificationResult]:
+        """
+        Execute classification for several emails without formatting.
+
+        All cache misses are scored with a single batched call per model,
+        amortizing vectorization and inference overhead.
+
+        Args:
+            emails: List of (email_text, subject, sender) tuples
+
+        Returns:
+            One ClassificationResult per input, in input order
+
+        Raises:
+            ValueError: If any email_text is empty or invalid
+        """
+        return self.execute_raw_email_batch(
+            [Email(text=text, subject=subject, sender=sender) for text, subject, sender in emails]
+        )
+
+    def execute_raw_email_batch(self, emails: Sequence[Email]) -> list[ClassificationResult]:
+        """
+        Execute classification for several already-built Emails without formatting.
+
+        Args:
+            emails: Validated Email entities to classify
+
+        Returns:
+            One ClassificationResult per email, in input order
+        """
+        keys = [self._make_key(email) for email in emails]
+        results = [self._get_cached(key, email) for key, email in zip(keys, emails, strict=True)]
+
+        misses = [i for i, result in enumerate(results) if result is None]
+        if misses:
+            batch = [emails[i] for i in misses]
+            for i, result in zip(
+                misses, self._classifier_service.classify_batch(batch), strict=True
+            ):
+                self._store(keys[i], result)
+                results[i] = result
+
+        return results  # type: ignore[return-value]
+
+    def cache_info(self) -> CacheInfo | None:
+        """Get exact-match result cache statistics, or None if caching is disabled."""
+        if self._result_cache is None:
+            return None
+        return self._result_cache.cache_info()
+
+    def cache_clear(self) -> None:
+        """Drop all exact-match cached results, e.g. after the models were reloaded."""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    # === Private methods ===
+
+    def _make_key(self, email: Email) -> CacheKey | None:
+        """Build exact-match cache key, or None if result caching is disabled."""
+        if self._result_cache is None:
+            return None
+        return self._result_cache.make_key(email.text, email.subject, email.sender)
+
+    def _get_cached(self, key: CacheKey | None, email: Email) -> ClassificationResult | None:
+        """
+        Look up a cached result, exact match first, then near-duplicate.
+
+        Hits are rebound to the new email so callers never see another
+        message's text, subject, sender or timestamp.
+        """
+        if key is not None:
+            cached = self._result_cache.get(key)  # type: ignore[union-attr]
+            if cached is not None:
+                return replace(cached, email=email, execution_time_ms=0.0)
+
+        if self._semantic_cache is not None:
+            similar = self._semantic_cache.lookup(email.text)
+            if similar is not None:
+                return replace(similar, email=email, execution_time_ms=0.0)
+
+        return None
 
-        return self._classifier_service.classify(email)
+    def _store(self, key: CacheKey | None, result: ClassificationResult) -> None:
+        """Store a freshly computed result in the enabled caches."""
+        if key is not None:
+            self._result_cache.put(key, result)  # type: ignore[union-attr]
+        if self._semantic_cache is not None:
+            self._semantic_cache.add(result.email.text, result)
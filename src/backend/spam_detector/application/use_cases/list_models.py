@@ -73,14 +73,11 @@ class ListModelsUseCase:
         if not models:
             return f"No models found for '{model_name}'"
 
-        lines = [f"Available models for '{model_name}':", f"Total versions: {len(models)}", ""]
-
-        for i, model in enumerate(models, 1):
-            latest_mark = " (latest)" if i == 1 else ""
-            lines.append(
-                f"{i}. {model.timestamp}{latest_mark}"
-                f" - Accuracy: {model.accuracy_percent:.2f}%"
-                f" - Size: {model.file_size_mb:.2f}MB"
-            )
-
-        return "\n".join(lines)
+        header = f"Available models for '{model_name}':\nTotal versions: {len(models)}\n\n"
+        body = "\n".join(
+            f"{i}. {model.timestamp}{' (latest)' if i == 1 else ''}"
+            f" - Accuracy: {model.accuracy_percent:.2f}%"
+            f" - Size: {model.file_size_mb:.2f}MB"
+            for i, model in enumerate(models, 1)
+        )
+        return header + body
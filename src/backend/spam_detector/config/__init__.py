@@ -1,8 +1,9 @@
 """Configuration module."""
 
-from .settings import Settings, settings
+from .settings import Settings, get_settings, settings
 
 __all__ = [
     "Settings",
+    "get_settings",
     "settings",
 ]
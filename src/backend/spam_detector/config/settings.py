@@ -1,5 +1,6 @@
 """Application settings using Pydantic."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -31,6 +32,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,
     )
 
     # Model settings
@@ -40,6 +42,22 @@ class Settings(BaseSettings):
 
     cache_models: bool = Field(default=True, description="Cache loaded models in memory")
 
+    mmap_models: bool = Field(
+        default=True,
+        description="Memory-map model arrays read-only so workers share one copy",
+    )
+
+    classify_cache_size: int = Field(
+        default=1024, ge=0, description="Max cached classification results (0 disables)"
+    )
+
+    semantic_cache_size: int = Field(
+        default=0, ge=0, description="Max near-duplicate cached results (0 disables)"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95, ge=0.0, le=1.0, description="Min cosine similarity for a near-duplicate hit"
+    )
+
     # Output settings
     default_format: Literal["text", "json"] = Field(
         default="text", description="Default output format"
@@ -54,6 +72,13 @@ class Settings(BaseSettings):
         default=0.5, ge=0.0, le=1.0, description="Minimum confidence threshold for warnings"
     )
 
+    phishing_skip_threshold: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="HAM confidence at which the phishing model is skipped (None = always run)",
+    )
+
     # Risk level thresholds
     confidence_threshold_low: float = Field(
         default=0.8, ge=0.0, le=1.0, description="Threshold for LOW risk (HAM with high confidence)"
@@ -86,6 +111,12 @@ class Settings(BaseSettings):
     api_cors_origins: list[str] = Field(
         default=["*"], description="CORS allowed origins (use ['*'] for all)"
     )
+    api_batch_max_size: int = Field(
+        default=32, ge=1, description="Max classify requests coalesced into one model call"
+    )
+    api_batch_max_wait_ms: float = Field(
+        default=2.0, ge=0.0, description="Max time to wait for more requests to join a batch"
+    )
     api_version: str = Field(default="v1", description="API version prefix")
     api_prefix: str = Field(default="/api", description="API base prefix")
     docs_path: str = Field(default="/docs", description="Swagger UI path")
@@ -107,5 +138,16 @@ class Settings(BaseSettings):
         return f"{self.api_prefix}/{self.api_version}"
 
 
-# Global settings instance (can be overridden)
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide settings, parsed from env/.env on first call only.
+
+    Returns:
+        Shared, immutable Settings instance
+    """
+    return Settings()
+
+
+# Global settings instance (pass a Settings to Container to override)
+settings = get_settings()
@@ -10,7 +10,7 @@ from .entities import (
     SinglePrediction,
     VerdictType,
 )
-from .ports import DetailLevel, IModelLoader, IOutputFormatter, IPredictor
+from .ports import DetailLevel, IModelLoader, IOutputFormatter, IPredictor, ISemanticCache
 from .services import EmailClassifierService
 
 __all__ = [
@@ -28,6 +28,7 @@ __all__ = [
     "IModelLoader",
     "IPredictor",
     "IOutputFormatter",
+    "ISemanticCache",
     # Services
     "EmailClassifierService",
     # Constants
@@ -17,6 +17,7 @@ EMAIL_PREVIEW_LENGTH = 100
 # Time conversion
 SECONDS_TO_MILLISECONDS = 1000
 MILLISECONDS_TO_SECONDS = 0.001
+NANOSECONDS_TO_MILLISECONDS = 1_000_000
 
 # Percentage conversion
 PERCENTAGE_MULTIPLIER = 100
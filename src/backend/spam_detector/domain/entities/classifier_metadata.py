@@ -1,12 +1,14 @@
 """Model metadata entity."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal
 
+from ..constants import MODEL_DISPLAY_NAMES, PERCENTAGE_MULTIPLIER
+
 ModelType = Literal["spam_detector", "phishing_detector"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelMetadata:
     """
     Metadata for a trained classifier model.
@@ -20,6 +22,7 @@ class ModelMetadata:
         train_samples: Number of samples used for training
         vocabulary_size: Size of TF-IDF vocabulary
         file_size_mb: Model file size in megabytes
+        accuracy_percent: Accuracy as percentage (derived, not an init argument)
 
     Examples:
         >>> metadata = ModelMetadata(
@@ -39,8 +42,11 @@ class ModelMetadata:
     vocabulary_size: int
     file_size_mb: float
 
+    # Accuracy as percentage, computed once at construction
+    accuracy_percent: float = field(default=0.0, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
-        """Validate metadata constraints."""
+        """Validate metadata constraints and precompute accuracy_percent."""
         if not 0.0 <= self.accuracy <= 1.0:
             raise ValueError(f"Accuracy must be between 0 and 1, got {self.accuracy}")
 
@@ -53,13 +59,9 @@ class ModelMetadata:
         if self.file_size_mb < 0:
             raise ValueError(f"File size cannot be negative, got {self.file_size_mb}")
 
-    @property
-    def accuracy_percent(self) -> float:
-        """Get accuracy as percentage."""
-        return self.accuracy * 100
+        object.__setattr__(self, "accuracy_percent", self.accuracy * PERCENTAGE_MULTIPLIER)
 
     @property
     def display_name(self) -> str:
         """Get human-readable model name."""
-        names = {"spam_detector": "SPAM Detector", "phishing_detector": "Phishing Detector"}
-        return names.get(self.name, self.name)
+        return MODEL_DISPLAY_NAMES.get(self.name, self.name)
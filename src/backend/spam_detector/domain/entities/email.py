@@ -1,17 +1,19 @@
 """Email entity - Value object inmutable."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from ..constants import EMAIL_PREVIEW_LENGTH
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Email:
     """
     Email value object for classification.
 
     Immutable entity representing an email message with its metadata.
+    Derived values (preview, word count) are computed on first access
+    and cached, since the text never changes.
 
     Attributes:
         text: Email body content (required)
@@ -36,21 +38,34 @@ class Email:
     sender: str | None = None
     timestamp: datetime | None = None
 
+    # Lazily cached derived values (excluded from init, repr and equality)
+    _preview: str | None = field(default=None, init=False, repr=False, compare=False)
+    _word_count: int | None = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Validate email text is not empty."""
-        if not self.text or not self.text.strip():
+        # isspace() stops at the first non-whitespace char and, unlike strip(), never copies
+        if not self.text or self.text.isspace():
             raise ValueError("Email text cannot be empty or whitespace-only")
 
     @property
     def preview(self) -> str:
         """Get preview of email text (first N chars)."""
-        max_len = EMAIL_PREVIEW_LENGTH
-        return self.text[:max_len] + ("..." if len(self.text) > max_len else "")
+        preview = self._preview
+        if preview is None:
+            max_len = EMAIL_PREVIEW_LENGTH
+            preview = self.text[:max_len] + ("..." if len(self.text) > max_len else "")
+            object.__setattr__(self, "_preview", preview)
+        return preview
 
     @property
     def word_count(self) -> int:
         """Count words in email text."""
-        return len(self.text.split())
+        word_count = self._word_count
+        if word_count is None:
+            word_count = len(self.text.split())
+            object.__setattr__(self, "_word_count", word_count)
+        return word_count
 
     @property
     def char_count(self) -> int:
@@ -1,8 +1,11 @@
 """Prediction result entities."""
 
-from dataclasses import dataclass
-from typing import Literal
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Literal
 
+from ..constants import PERCENTAGE_MULTIPLIER
 from .email import Email
 
 # Risk level thresholds (business rules)
@@ -11,18 +14,52 @@ RISK_THRESHOLD_HIGH_CONFIDENCE = 0.7  # Single threat >70% confidence = HIGH ris
 
 VerdictType = Literal["HAM", "SPAM", "PHISHING", "SPAM+PHISHING"]
 LabelType = Literal["HAM", "SPAM", "LEGIT", "PHISHING"]
+RiskLevelType = Literal["LOW", "MEDIUM", "HIGH", "CRITICAL"]
 
+# Labels for which a single prediction is positive (malicious)
+_POSITIVE_LABELS = frozenset({"SPAM", "PHISHING"})
 
-@dataclass(frozen=True)
+# Verdicts indexed by (spam_positive << 1) | phishing_positive
+_VERDICTS: tuple[VerdictType, ...] = ("HAM", "PHISHING", "SPAM", "SPAM+PHISHING")
+
+# Confidence above which each verdict moves to its higher risk band (same index)
+_RISK_BAND_THRESHOLDS = (
+    RISK_THRESHOLD_LOW_CONFIDENCE,
+    RISK_THRESHOLD_HIGH_CONFIDENCE,
+    RISK_THRESHOLD_HIGH_CONFIDENCE,
+    0.0,
+)
+
+# Risk levels indexed by (verdict_index << 1) | above_band_threshold
+_RISK_LEVELS: tuple[RiskLevelType, ...] = (
+    "MEDIUM", "LOW",        # HAM
+    "MEDIUM", "HIGH",       # PHISHING
+    "MEDIUM", "HIGH",       # SPAM
+    "CRITICAL", "CRITICAL", # SPAM+PHISHING
+)  # fmt: skip
+
+
+# Bound once; frozen dataclasses must bypass their own __setattr__ to assign
+_set = object.__setattr__
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class SinglePrediction:
     """
     Result of a single model prediction.
 
+    Created for every prediction (twice per email), so __init__ is written
+    by hand: it validates and assigns all six slots directly instead of going
+    through the generated __init__ plus __post_init__. Equality, hashing,
+    repr and dataclasses.replace() still come from the dataclass.
+
     Attributes:
         label: Classification label
         probability: Confidence probability (0.0 - 1.0)
         model_name: Name of model that made prediction
         model_timestamp: Timestamp of model version used
+        is_positive: Whether label is SPAM or PHISHING (derived, not an init argument)
+        probability_percent: Probability as percentage (derived, not an init argument)
     """
 
     label: LabelType
@@ -30,28 +67,33 @@ class SinglePrediction:
     model_name: str
     model_timestamp: str
 
-    def __post_init__(self) -> None:
-        """Validate probability range."""
-        if not 0.0 <= self.probability <= 1.0:
-            raise ValueError(f"Probability must be between 0 and 1, got {self.probability}")
-
-    @property
-    def probability_percent(self) -> float:
-        """Get probability as percentage."""
-        return self.probability * 100
-
-    @property
-    def is_positive(self) -> bool:
-        """Check if prediction is positive (SPAM/PHISHING)."""
-        return self.label in ("SPAM", "PHISHING")
-
-
-@dataclass(frozen=True)
+    # Whether prediction is positive (SPAM/PHISHING), computed once at construction
+    is_positive: bool = field(init=False, repr=False, compare=False)
+    # Probability as percentage, computed once at construction
+    probability_percent: float = field(init=False, repr=False, compare=False)
+
+    def __init__(
+        self, label: LabelType, probability: float, model_name: str, model_timestamp: str
+    ) -> None:
+        """Validate probability range and precompute is_positive and probability_percent."""
+        if not 0.0 <= probability <= 1.0:
+            raise ValueError(f"Probability must be between 0 and 1, got {probability}")
+        _set(self, "label", label)
+        _set(self, "probability", probability)
+        _set(self, "model_name", model_name)
+        _set(self, "model_timestamp", model_timestamp)
+        _set(self, "is_positive", label in _POSITIVE_LABELS)
+        _set(self, "probability_percent", probability * PERCENTAGE_MULTIPLIER)
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class ClassificationResult:
     """
     Complete dual classification result.
 
     Result from classifying an email with both spam and phishing detectors.
+    Like SinglePrediction, __init__ is hand-written so that init fields and
+    derived values are assigned in a single pass.
 
     Attributes:
         email: Original email that was classified
@@ -77,6 +119,48 @@ class ClassificationResult:
     phishing_prediction: SinglePrediction
     execution_time_ms: float
 
+    # Derived values computed once at construction
+    _max_confidence: float = field(init=False, repr=False, compare=False)
+    _verdict_index: int = field(init=False, repr=False, compare=False)
+    _risk_index: int = field(init=False, repr=False, compare=False)
+    _models_used: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __init__(
+        self,
+        email: Email,
+        spam_prediction: SinglePrediction,
+        phishing_prediction: SinglePrediction,
+        execution_time_ms: float,
+    ) -> None:
+        """Store predictions and precompute max confidence, verdict/risk indices and models used."""
+        max_confidence = max(spam_prediction.probability, phishing_prediction.probability)
+        verdict_index = (spam_prediction.is_positive << 1) | phishing_prediction.is_positive
+        above_band = max_confidence > _RISK_BAND_THRESHOLDS[verdict_index]
+        _set(self, "email", email)
+        _set(self, "spam_prediction", spam_prediction)
+        _set(self, "phishing_prediction", phishing_prediction)
+        _set(self, "execution_time_ms", execution_time_ms)
+        _set(self, "_max_confidence", max_confidence)
+        _set(self, "_verdict_index", verdict_index)
+        _set(self, "_risk_index", (verdict_index << 1) | above_band)
+        _set(
+            self,
+            "_models_used",
+            MappingProxyType(
+                {
+                    "spam": spam_prediction.model_timestamp,
+                    "phishing": phishing_prediction.model_timestamp,
+                }
+            ),
+        )
+
+    def __reduce__(self) -> tuple[type["ClassificationResult"], tuple[Any, ...]]:
+        """Pickle by init fields only; derived values (incl. the mappingproxy) are rebuilt."""
+        return (
+            type(self),
+            (self.email, self.spam_prediction, self.phishing_prediction, self.execution_time_ms),
+        )
+
     @property
     def final_verdict(self) -> VerdictType:
         """
@@ -88,30 +172,20 @@ class ClassificationResult:
             "PHISHING": Only phishing positive
             "SPAM+PHISHING": Both positive
         """
-        spam_positive = self.spam_prediction.is_positive
-        phishing_positive = self.phishing_prediction.is_positive
-
-        if spam_positive and phishing_positive:
-            return "SPAM+PHISHING"
-        elif spam_positive:
-            return "SPAM"
-        elif phishing_positive:
-            return "PHISHING"
-        else:
-            return "HAM"
+        return _VERDICTS[self._verdict_index]
 
     @property
     def max_confidence(self) -> float:
         """Get highest confidence from both predictions."""
-        return max(self.spam_prediction.probability, self.phishing_prediction.probability)
+        return self._max_confidence
 
     @property
     def is_malicious(self) -> bool:
         """Check if email is classified as malicious (spam or phishing)."""
-        return self.final_verdict != "HAM"
+        return self._verdict_index != 0
 
     @property
-    def risk_level(self) -> Literal["LOW", "MEDIUM", "HIGH", "CRITICAL"]:
+    def risk_level(self) -> RiskLevelType:
         """
         Assess risk level based on confidence and verdict.
 
@@ -121,19 +195,9 @@ class ClassificationResult:
             "HIGH": Single threat high confidence
             "CRITICAL": Both threats detected
         """
-        if self.final_verdict == "SPAM+PHISHING":
-            return "CRITICAL"
-
-        if self.final_verdict == "HAM":
-            return "LOW" if self.max_confidence > RISK_THRESHOLD_LOW_CONFIDENCE else "MEDIUM"
-
-        # Single threat (SPAM or PHISHING)
-        return "HIGH" if self.max_confidence > RISK_THRESHOLD_HIGH_CONFIDENCE else "MEDIUM"
+        return _RISK_LEVELS[self._risk_index]
 
     @property
-    def models_used(self) -> dict[str, str]:
-        """Get dictionary of models used with their timestamps."""
-        return {
-            "spam": self.spam_prediction.model_timestamp,
-            "phishing": self.phishing_prediction.model_timestamp,
-        }
+    def models_used(self) -> Mapping[str, str]:
+        """Get read-only mapping of models used with their timestamps."""
+        return self._models_used
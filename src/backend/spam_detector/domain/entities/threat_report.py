@@ -5,9 +5,16 @@ Domain entities for IOC (Indicators of Compromise) and threat intelligence.
 """
 
 from dataclasses import dataclass, field
+from operator import attrgetter
 
+# Sort key for trigger words (suspicious ones are all positive, so no abs())
+_BY_CONTRIBUTION = attrgetter("contribution")
 
-@dataclass(frozen=True)
+_IOC_TYPES = frozenset({"url", "keyword_urgency", "keyword_financial", "pattern", "sender"})
+_IOC_SEVERITIES = frozenset({"critical", "high", "medium", "low"})
+
+
+@dataclass(frozen=True, slots=True)
 class IOC:
     """Indicator of Compromise"""
 
@@ -19,16 +26,14 @@ class IOC:
 
     def __post_init__(self) -> None:
         """Validate IOC fields"""
-        valid_types = {"url", "keyword_urgency", "keyword_financial", "pattern", "sender"}
-        if self.type not in valid_types:
+        if self.type not in _IOC_TYPES:
             raise ValueError(f"Invalid IOC type: {self.type}")
 
-        valid_severities = {"critical", "high", "medium", "low"}
-        if self.severity not in valid_severities:
+        if self.severity not in _IOC_SEVERITIES:
             raise ValueError(f"Invalid severity: {self.severity}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThreatVector:
     """Identified threat vector/attack pattern"""
 
@@ -42,7 +47,7 @@ class ThreatVector:
             raise ValueError(f"Confidence must be between 0 and 1, got {self.confidence}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TriggerWord:
     """Word/feature that triggered classification"""
 
@@ -50,10 +55,12 @@ class TriggerWord:
     contribution: float  # Positive = pushes towards SPAM/PHISHING, Negative = towards HAM/LEGIT
     category: str  # "spam" or "phishing"
 
-    @property
-    def is_suspicious(self) -> bool:
-        """True if word pushes towards malicious classification"""
-        return self.contribution > 0
+    # True if word pushes towards malicious classification (computed once)
+    is_suspicious: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute is_suspicious"""
+        object.__setattr__(self, "is_suspicious", self.contribution > 0)
 
 
 @dataclass(frozen=True)
@@ -87,5 +94,5 @@ class ThreatReport:
         """Get top words that triggered malicious classification"""
         all_triggers = self.spam_trigger_words + self.phishing_trigger_words
         suspicious = [tw for tw in all_triggers if tw.is_suspicious]
-        suspicious.sort(key=lambda x: abs(x.contribution), reverse=True)
+        suspicious.sort(key=_BY_CONTRIBUTION, reverse=True)
         return [tw.word for tw in suspicious[:10]]
@@ -3,10 +3,12 @@
 from .model_loader import IModelLoader
 from .output_formatter import DetailLevel, IOutputFormatter
 from .predictor import IPredictor
+from .semantic_cache import ISemanticCache
 
 __all__ = [
     "IModelLoader",
     "IPredictor",
     "IOutputFormatter",
+    "ISemanticCache",
     "DetailLevel",
 ]
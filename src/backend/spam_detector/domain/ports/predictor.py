@@ -1,8 +1,9 @@
 """Predictor port - Interface for making predictions."""
 
+from collections.abc import Sequence
 from typing import Protocol
 
-from ..entities import Email, SinglePrediction
+from ..entities import Email, ModelMetadata, SinglePrediction
 
 
 class IPredictor(Protocol):
@@ -27,6 +28,11 @@ class IPredictor(Protocol):
         0.85
     """
 
+    @property
+    def metadata(self) -> ModelMetadata:
+        """Metadata of the model backing this predictor."""
+        ...
+
     def predict(self, email: Email) -> SinglePrediction:
         """
         Predict classification for an email.
@@ -41,3 +47,22 @@ class IPredictor(Protocol):
             ValueError: If email text cannot be vectorized
         """
         ...
+
+    def predict_batch(self, emails: Sequence[Email]) -> list[SinglePrediction]:
+        """
+        Predict classification for several emails in one call.
+
+        The default implementation calls ``predict`` per email; adapters
+        backed by a vectorized model should override it to score the whole
+        batch at once.
+
+        Args:
+            emails: Email entities to classify
+
+        Returns:
+            One SinglePrediction per email, in input order
+
+        Raises:
+            ValueError: If any email text cannot be vectorized
+        """
+        return [self.predict(email) for email in emails]
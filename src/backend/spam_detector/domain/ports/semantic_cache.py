@@ -0,0 +1,45 @@
+"""Semantic cache port - Interface for near-duplicate result lookup."""
+
+from typing import Protocol
+
+from ..entities import ClassificationResult
+
+
+class ISemanticCache(Protocol):
+    """
+    Port for caching classification results by content similarity.
+
+    Unlike an exact-match cache, implementations return a stored result
+    when a new email is *similar enough* to one already classified, which
+    catches templated spam waves where only a URL or name changes.
+
+    Examples:
+        >>> cache: ISemanticCache = HashingSemanticCache(maxsize=4096, threshold=0.95)
+        >>> cache.lookup("WINNER! Click http://a.tk now!") is None
+        True
+        >>> cache.add("WINNER! Click http://a.tk now!", result)
+        >>> cache.lookup("WINNER! Click http://b.tk now!") is not None
+        True
+    """
+
+    def lookup(self, email_text: str) -> ClassificationResult | None:
+        """
+        Find the result of the most similar cached email.
+
+        Args:
+            email_text: Email body text
+
+        Returns:
+            Cached ClassificationResult if similarity exceeds the threshold, else None
+        """
+        ...
+
+    def add(self, email_text: str, result: ClassificationResult) -> None:
+        """
+        Cache a classification result for an email.
+
+        Args:
+            email_text: Email body text
+            result: Classification result for the email
+        """
+        ...
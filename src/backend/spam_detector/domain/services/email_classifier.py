@@ -1,8 +1,13 @@
 """Email classifier service - Domain service orchestrating classification."""
 
+import asyncio
+import threading
 import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
-from ..entities import ClassificationResult, Email
+from ..constants import NANOSECONDS_TO_MILLISECONDS
+from ..entities import ClassificationResult, Email, SinglePrediction
 from ..ports import IPredictor
 
 
@@ -16,9 +21,21 @@ class EmailClassifierService:
     This is a pure domain service with no infrastructure dependencies.
     It coordinates the classification workflow using injected predictors.
 
+    Both predictors are independent, so they run concurrently on a small
+    thread pool (sklearn/BLAS release the GIL during inference).
+
+    When a phishing skip threshold is set, the spam predictor acts as a
+    gate instead: it runs first, and emails it calls HAM with at least
+    that confidence get a synthesized LEGIT phishing prediction without
+    running the phishing model.
+
     Attributes:
         _spam_predictor: Predictor for spam detection
         _phishing_predictor: Predictor for phishing detection
+        _phishing_skip_threshold: HAM confidence that skips phishing (None = never)
+        _pool: Thread pool used to run both predictors concurrently
+        _skipped_lock: Guards phishing_skipped against concurrent API worker threads
+        phishing_skipped: Number of phishing predictions skipped by the gate
 
     Examples:
         >>> service = EmailClassifierService(
@@ -31,16 +48,28 @@ class EmailClassifierService:
         'SPAM+PHISHING'
     """
 
-    def __init__(self, spam_predictor: IPredictor, phishing_predictor: IPredictor) -> None:
+    def __init__(
+        self,
+        spam_predictor: IPredictor,
+        phishing_predictor: IPredictor,
+        phishing_skip_threshold: float | None = None,
+    ) -> None:
         """
         Initialize classifier service with predictors.
 
         Args:
             spam_predictor: Predictor implementing spam detection
             phishing_predictor: Predictor implementing phishing detection
+            phishing_skip_threshold: Minimum HAM probability from the spam
+                predictor that skips the phishing predictor. If None, both
+                predictors always run.
         """
         self._spam_predictor = spam_predictor
         self._phishing_predictor = phishing_predictor
+        self._phishing_skip_threshold = phishing_skip_threshold
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="classifier")
+        self._skipped_lock = threading.Lock()
+        self.phishing_skipped = 0
 
     def classify(self, email: Email) -> ClassificationResult:
         """
@@ -55,14 +84,26 @@ class EmailClassifierService:
         Raises:
             ValueError: If email is invalid or cannot be processed
         """
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
 
-        # Run both predictions
-        spam_prediction = self._spam_predictor.predict(email)
-        phishing_prediction = self._phishing_predictor.predict(email)
+        if self._spam_predictor is self._phishing_predictor:
+            # Fallback wiring (same model for both): predict once and reuse
+            spam_prediction = self._spam_predictor.predict(email)
+            phishing_prediction = spam_prediction
+        elif self._phishing_skip_threshold is not None:
+            # Gated: only run phishing when spam isn't confidently HAM
+            spam_prediction = self._spam_predictor.predict(email)
+            phishing_prediction = self._skipped_phishing_prediction(spam_prediction)
+            if phishing_prediction is None:
+                phishing_prediction = self._phishing_predictor.predict(email)
+        else:
+            # Run both predictions concurrently
+            spam_future = self._pool.submit(self._spam_predictor.predict, email)
+            phishing_future = self._pool.submit(self._phishing_predictor.predict, email)
+            spam_prediction = spam_future.result()
+            phishing_prediction = phishing_future.result()
 
-        end_time = time.perf_counter()
-        execution_time_ms = (end_time - start_time) * 1000
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / NANOSECONDS_TO_MILLISECONDS
 
         return ClassificationResult(
             email=email,
@@ -70,3 +111,152 @@ class EmailClassifierService:
             phishing_prediction=phishing_prediction,
             execution_time_ms=execution_time_ms,
         )
+
+    async def classify_async(self, email: Email) -> ClassificationResult:
+        """
+        Classify email without blocking the event loop.
+
+        Both predictors run on the service's thread pool and are awaited
+        together, so async callers need no extra threadpool hop.
+
+        Args:
+            email: Email entity to classify
+
+        Returns:
+            ClassificationResult with dual predictions and metadata
+
+        Raises:
+            ValueError: If email is invalid or cannot be processed
+        """
+        loop = asyncio.get_running_loop()
+        start_ns = time.perf_counter_ns()
+
+        if self._spam_predictor is self._phishing_predictor:
+            spam_prediction = await loop.run_in_executor(
+                self._pool, self._spam_predictor.predict, email
+            )
+            phishing_prediction = spam_prediction
+        elif self._phishing_skip_threshold is not None:
+            spam_prediction = await loop.run_in_executor(
+                self._pool, self._spam_predictor.predict, email
+            )
+            phishing_prediction = self._skipped_phishing_prediction(spam_prediction)
+            if phishing_prediction is None:
+                phishing_prediction = await loop.run_in_executor(
+                    self._pool, self._phishing_predictor.predict, email
+                )
+        else:
+            spam_prediction, phishing_prediction = await asyncio.gather(
+                loop.run_in_executor(self._pool, self._spam_predictor.predict, email),
+                loop.run_in_executor(self._pool, self._phishing_predictor.predict, email),
+            )
+
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / NANOSECONDS_TO_MILLISECONDS
+
+        return ClassificationResult(
+            email=email,
+            spam_prediction=spam_prediction,
+            phishing_prediction=phishing_prediction,
+            execution_time_ms=execution_time_ms,
+        )
+
+    def classify_batch(self, emails: Sequence[Email]) -> list[ClassificationResult]:
+        """
+        Classify several emails with one batched call per predictor.
+
+        Each result reports the batch time amortized over its emails.
+
+        Args:
+            emails: Email entities to classify
+
+        Returns:
+            One ClassificationResult per email, in input order
+
+        Raises:
+            ValueError: If any email cannot be processed
+        """
+        if not emails:
+            return []
+
+        start_ns = time.perf_counter_ns()
+
+        if self._spam_predictor is self._phishing_predictor:
+            spam_predictions = self._spam_predictor.predict_batch(emails)
+            phishing_predictions = spam_predictions
+        elif self._phishing_skip_threshold is not None:
+            spam_predictions = self._spam_predictor.predict_batch(emails)
+            phishing_predictions = self._gated_phishing_batch(emails, spam_predictions)
+        else:
+            spam_future = self._pool.submit(self._spam_predictor.predict_batch, emails)
+            phishing_future = self._pool.submit(self._phishing_predictor.predict_batch, emails)
+            spam_predictions = spam_future.result()
+            phishing_predictions = phishing_future.result()
+
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        execution_time_ms = elapsed_ns / (NANOSECONDS_TO_MILLISECONDS * len(emails))
+
+        return [
+            ClassificationResult(
+                email=email,
+                spam_prediction=spam_prediction,
+                phishing_prediction=phishing_prediction,
+                execution_time_ms=execution_time_ms,
+            )
+            for email, spam_prediction, phishing_prediction in zip(
+                emails, spam_predictions, phishing_predictions, strict=True
+            )
+        ]
+
+    # === Private methods ===
+
+    def _skipped_phishing_prediction(
+        self, spam_prediction: SinglePrediction
+    ) -> SinglePrediction | None:
+        """
+        Synthesize a LEGIT phishing prediction if the gate allows skipping.
+
+        Args:
+            spam_prediction: Result from the spam predictor
+
+        Returns:
+            LEGIT prediction carrying the HAM confidence, or None if the
+            phishing predictor must run
+        """
+        if (
+            spam_prediction.label != "HAM"
+            or spam_prediction.probability < self._phishing_skip_threshold  # type: ignore[operator]
+        ):
+            return None
+
+        with self._skipped_lock:
+            self.phishing_skipped += 1
+        metadata = self._phishing_predictor.metadata
+        return SinglePrediction(
+            label="LEGIT",
+            probability=spam_prediction.probability,
+            model_name=metadata.name,
+            model_timestamp=metadata.timestamp,
+        )
+
+    def _gated_phishing_batch(
+        self, emails: Sequence[Email], spam_predictions: list[SinglePrediction]
+    ) -> list[SinglePrediction]:
+        """
+        Run the phishing predictor only on emails the gate doesn't skip.
+
+        Args:
+            emails: Email entities being classified
+            spam_predictions: Spam results aligned with emails
+
+        Returns:
+            One phishing prediction per email, in input order
+        """
+        phishing_predictions = [self._skipped_phishing_prediction(p) for p in spam_predictions]
+
+        pending = [i for i, p in enumerate(phishing_predictions) if p is None]
+        if pending:
+            predicted = self._phishing_predictor.predict_batch([emails[i] for i in pending])
+            for i, prediction in zip(pending, predicted, strict=True):
+                phishing_predictions[i] = prediction
+
+        return phishing_predictions  # type: ignore[return-value]
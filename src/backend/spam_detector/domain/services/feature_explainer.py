@@ -6,9 +6,13 @@ to the classification decision.
 """
 
 import re
+from weakref import WeakKeyDictionary
 
 import numpy as np
 
+# Runs of word characters: the units that \b...\b can match as a whole
+_WORD_PATTERN = re.compile(r"\w+")
+
 
 class FeatureExplainer:
     """
@@ -16,8 +20,22 @@ class FeatureExplainer:
 
     For Logistic Regression models, uses coefficients to determine
     which words most strongly influenced the prediction.
+
+    Attributes:
+        _feature_names: Feature-name array of each vectorizer, built once
+            per vectorizer
+        _coefficient_orders: Argsort of each model's coefficients, computed
+            once per model
+        (Both caches are weakly keyed, so unloaded models drop out.)
     """
 
+    __slots__ = ("_feature_names", "_coefficient_orders")
+
+    def __init__(self) -> None:
+        """Initialize explainer with empty per-model caches."""
+        self._feature_names: WeakKeyDictionary = WeakKeyDictionary()
+        self._coefficient_orders: WeakKeyDictionary = WeakKeyDictionary()
+
     def explain_prediction(
         self, text: str, vectorizer, model, top_n: int = 10
     ) -> list[tuple[str, float]]:
@@ -33,40 +51,28 @@ class FeatureExplainer:
         Returns:
             List of (feature_name, contribution_score) tuples, sorted by absolute contribution
         """
-        # Get feature names from vectorizer
-        try:
-            feature_names = vectorizer.get_feature_names_out()
-        except AttributeError:
-            # Fallback for older sklearn versions
-            feature_names = vectorizer.get_feature_names()
-
-        # Transform the text to get TF-IDF values
+        feature_names = self._get_feature_names(vectorizer)
+
+        # Transform the text to get TF-IDF values (sparse CSR row, never densified)
         text_vector = vectorizer.transform([text])
+        text_vector.sort_indices()
 
         # Get model coefficients (feature importance)
         # For binary classification, coef_ shape is (1, n_features)
         coefficients = model.coef_[0]
 
-        # Get indices of non-zero features in this text
-        # (only words that appear in this specific email)
-        text_features = text_vector.toarray()[0]
-        non_zero_indices = np.where(text_features > 0)[0]
+        # Only words that appear in this specific email are stored in the row
+        present = text_vector.data > 0
+        indices = text_vector.indices[present]
 
-        # Calculate contribution for each feature
         # Contribution = TF-IDF value * coefficient
-        contributions = []
-        for idx in non_zero_indices:
-            feature_name = feature_names[idx]
-            tfidf_value = text_features[idx]
-            coefficient = coefficients[idx]
-            contribution = tfidf_value * coefficient
-
-            contributions.append((feature_name, contribution))
+        contributions = text_vector.data[present] * coefficients[indices]
 
-        # Sort by absolute contribution (strongest influence, positive or negative)
-        contributions.sort(key=lambda x: abs(x[1]), reverse=True)
+        # Sort by absolute contribution (strongest influence, positive or negative);
+        # stable, so ties keep vocabulary order
+        order = np.argsort(-np.abs(contributions), kind="stable")[:top_n]
 
-        return contributions[:top_n]
+        return list(zip(feature_names[indices[order]], contributions[order], strict=True))
 
     def get_top_spam_indicators(
         self, vectorizer, model, top_n: int = 20
@@ -82,15 +88,12 @@ class FeatureExplainer:
         Returns:
             List of (word, coefficient) tuples for top SPAM indicators
         """
-        try:
-            feature_names = vectorizer.get_feature_names_out()
-        except AttributeError:
-            feature_names = vectorizer.get_feature_names()
+        feature_names = self._get_feature_names(vectorizer)
 
         coefficients = model.coef_[0]
 
         # Get indices sorted by coefficient (highest = strongest SPAM indicator)
-        top_indices = np.argsort(coefficients)[::-1][:top_n]
+        top_indices = self._coefficient_order(model)[::-1][:top_n]
 
         return [(feature_names[idx], coefficients[idx]) for idx in top_indices]
 
@@ -106,15 +109,12 @@ class FeatureExplainer:
         Returns:
             List of (word, coefficient) tuples for top HAM indicators
         """
-        try:
-            feature_names = vectorizer.get_feature_names_out()
-        except AttributeError:
-            feature_names = vectorizer.get_feature_names()
+        feature_names = self._get_feature_names(vectorizer)
 
         coefficients = model.coef_[0]
 
         # Get indices sorted by coefficient (lowest = strongest HAM indicator)
-        bottom_indices = np.argsort(coefficients)[:top_n]
+        bottom_indices = self._coefficient_order(model)[:top_n]
 
         return [(feature_names[idx], coefficients[idx]) for idx in bottom_indices]
 
@@ -131,17 +131,12 @@ class FeatureExplainer:
         Returns:
             Dict with 'positive' and 'negative' lists of features
         """
-        positive = []  # Features pushing towards SPAM/PHISHING
-        negative = []  # Features pushing towards HAM/LEGIT
+        significant = [(f, c) for f, c in contributions if abs(c) >= threshold]
 
-        for feature, contribution in contributions:
-            if abs(contribution) < threshold:
-                continue
-
-            if contribution > 0:
-                positive.append(f"{feature} (+{contribution:.3f})")
-            else:
-                negative.append(f"{feature} ({contribution:.3f})")
+        # Features pushing towards SPAM/PHISHING
+        positive = [f"{f} (+{c:.3f})" for f, c in significant if c > 0]
+        # Features pushing towards HAM/LEGIT
+        negative = [f"{f} ({c:.3f})" for f, c in significant if not c > 0]
 
         return {
             "positive": positive,  # Suspicious indicators
@@ -164,11 +159,56 @@ class FeatureExplainer:
         """
         triggered = []
         text_lower = text.lower()
+        # One scan of the text; a single-word feature matches \bfeature\b exactly
+        # when it is one of these words
+        words = set(_WORD_PATTERN.findall(text_lower))
 
         for feature, contribution in contributions:
             if abs(contribution) >= min_contribution:
-                # Check if feature appears in text (simple word boundary check)
-                if re.search(r"\b" + re.escape(feature) + r"\b", text_lower):
+                if _WORD_PATTERN.fullmatch(feature):
+                    found = feature in words
+                else:
+                    # Multi-word features (n-grams): simple word boundary check
+                    found = re.search(r"\b" + re.escape(feature) + r"\b", text_lower) is not None
+                if found:
                     triggered.append(feature)
 
         return triggered[:10]  # Limit to top 10 actual words
+
+    # === Private methods ===
+
+    def _get_feature_names(self, vectorizer) -> np.ndarray:
+        """
+        Get the vectorizer's feature names, building the array once per vectorizer.
+
+        Args:
+            vectorizer: Fitted TfidfVectorizer
+
+        Returns:
+            Feature names indexed by feature column
+        """
+        feature_names = self._feature_names.get(vectorizer)
+        if feature_names is None:
+            try:
+                feature_names = vectorizer.get_feature_names_out()
+            except AttributeError:
+                # Fallback for older sklearn versions (returns a list, not an array)
+                feature_names = np.asarray(vectorizer.get_feature_names())
+            self._feature_names[vectorizer] = feature_names
+        return feature_names
+
+    def _coefficient_order(self, model) -> np.ndarray:
+        """
+        Get coefficient indices in ascending order, sorting once per model.
+
+        Args:
+            model: Fitted LogisticRegression model
+
+        Returns:
+            Indices that sort model.coef_[0] ascending
+        """
+        order = self._coefficient_orders.get(model)
+        if order is None:
+            order = np.argsort(model.coef_[0])
+            self._coefficient_orders[model] = order
+        return order
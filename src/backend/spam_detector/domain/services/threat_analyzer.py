@@ -4,12 +4,21 @@ Threat Analysis Service
 Analyzes emails for security threats, extracts IOCs, and identifies attack vectors.
 """
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
 
 from ..entities.email import Email
 from ..entities.prediction import SinglePrediction
 from ..entities.threat_report import IOC, ThreatReport, ThreatVector, TriggerWord
 
+try:  # Optional linear-time DFA engine: pip install google-re2
+    import re2
+except ImportError:  # pragma: no cover - depends on environment
+    re2 = None
+
 # Security keyword patterns
 URGENCY_KEYWORDS = {
     "urgent",
@@ -57,14 +66,131 @@ SUSPICIOUS_PATTERNS = {
 # High-risk TLDs
 RISKY_TLDS = {".ru", ".cn", ".tk", ".ml", ".ga", ".cf", ".gq"}
 
+# str.endswith() takes a tuple and checks every suffix in one C call
+_RISKY_TLDS_TUPLE = tuple(RISKY_TLDS)
+
+# Lowercase literal that every match of a pattern contains. A C-level `in`
+# check on the lowercased text skips the regex scan when it can't match.
+_PATTERN_LITERALS: dict[str, str | None] = {
+    r"\$+[\d,]+": "$",
+    r"!{3,}": "!!!",
+    r"[A-Z]{10,}": None,  # Any long uppercase run: always scan
+    r"click\s+here": "click",
+    r"http://[^\s]+": "http://",
+}
+
+# Patterns RE2 scans much faster than `re` (unanchored runs with few matches).
+# RE2's per-match overhead makes it slower on the others, so they stay on `re`.
+_RE2_PATTERNS = {r"[A-Z]{10,}", r"click\s+here"}
+
+
+# Patterns matched against the lowercased body without IGNORECASE: `re` then
+# skips per-character case folding. The rest run on the original text and
+# are case-sensitive ([A-Z]{10,} must only see real capitals).
+_LOWERCASE_PATTERNS = {r"click\s+here", r"http://[^\s]+"}
+
+
+def _compile(pattern: str):
+    """Compile a case-sensitive pattern, on RE2 when installed and faster."""
+    if re2 is not None and pattern in _RE2_PATTERNS:
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
+
+# Compiled once at import; hot paths call methods on the compiled objects
+# re.ASCII lets IGNORECASE fold "http" with the fast ASCII tables. It also
+# narrows \s to ASCII, so the non-ASCII whitespace Unicode \s matches is
+# listed explicitly: URLs still end at e.g. a non-breaking space.
+_NON_ASCII_SPACE = r"\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+_URL_RE = re.compile(rf'https?://[^\s{_NON_ASCII_SPACE}<>"\']+', re.IGNORECASE | re.ASCII)
+_URL_LITERAL = "http"
+# Lowercase patterns also get an IGNORECASE variant for the original text,
+# used when lower() changes the body's length (e.g. "İ") and offsets shift
+_SUSPICIOUS_PATTERNS = [
+    (
+        _compile(pattern),
+        description,
+        _PATTERN_LITERALS[pattern],
+        re.compile(pattern, re.IGNORECASE) if pattern in _LOWERCASE_PATTERNS else None,
+    )
+    for pattern, description in SUSPICIOUS_PATTERNS.items()
+]
+
+# Every keyword tagged with its category, so one helper scans both sets
+_KEYWORD_SCAN = (
+    *(("urgency", keyword) for keyword in URGENCY_KEYWORDS),
+    *(("financial", keyword) for keyword in FINANCIAL_KEYWORDS),
+)
+
+
+# Default number of emails whose IOCs are memoized
+DEFAULT_IOC_CACHE_SIZE = 2048
+
+# Risk score weights: phishing is weighted higher as it's more dangerous
+PHISHING_RISK_WEIGHT = 0.7
+SPAM_RISK_WEIGHT = 0.3
+
+# Matches counted per suspicious pattern before the scan stops (bounds the
+# work a pathological email such as "!!!!..." can cause)
+MAX_PATTERN_MATCHES = 1000
+
+# Matches shown in a pattern IOC value
+_PATTERN_SAMPLE_SIZE = 3
+
+# Security recommendations, shared by every report
+REC_QUARANTINE = "🚫 Quarantine this email immediately"
+REC_BLOCK_SENDER_DOMAIN = "🔒 Block sender domain"
+REC_ALERT_SECURITY_TEAM = "⚠️  Alert security team about potential phishing"
+REC_ADD_TO_THREAT_INTEL = "📊 Add to threat intelligence database"
+REC_DO_NOT_CLICK_LINKS = "🔗 Do NOT click any links in this email"
+REC_BLOCKLIST_URLS = "🛡️  Add URLs to blocklist"
+REC_MARK_SENDER_MALICIOUS = "📧 Mark sender as malicious"
+REC_SAFE = "✅ Email appears legitimate, safe to process"
+
+# Recommendations that are always given together
+_REC_HIGH_RISK = (REC_QUARANTINE, REC_BLOCK_SENDER_DOMAIN)
+_REC_PHISHING = (REC_ALERT_SECURITY_TEAM, REC_ADD_TO_THREAT_INTEL)
+
+IOCCacheKey = tuple[bytes, str | None]
+
 
 class ThreatAnalyzer:
     """
     Analyzes emails for security threats.
 
     Pure domain service - no infrastructure dependencies.
+
+    IOC extraction depends only on the email text and sender, so its result
+    is memoized in a small thread-safe LRU cache: repeated bulk emails skip
+    every regex and keyword scan. Risk score, vectors and recommendations
+    depend on the predictions and are always recomputed.
+
+    Attributes:
+        _ioc_cache_size: Maximum number of memoized emails (0 disables)
+        _ioc_cache: Extracted IOCs by email digest and sender, LRU first
+        _lock: Guards the cache across API worker threads
+        ioc_cache_hits: Number of IOC cache hits
+        ioc_cache_misses: Number of IOC cache misses
+        TRIGGER_WORD_THRESHOLD: Minimum positive-class probability (SPAM or
+            PHISHING) for which trigger words are extracted
     """
 
+    # Below this the email is a confident negative and the explanation is noise
+    TRIGGER_WORD_THRESHOLD = 0.3
+
+    def __init__(self, ioc_cache_size: int = DEFAULT_IOC_CACHE_SIZE) -> None:
+        """
+        Initialize analyzer.
+
+        Args:
+            ioc_cache_size: Maximum number of emails whose IOCs are memoized (0 disables)
+        """
+        self._ioc_cache_size = ioc_cache_size
+        self._ioc_cache: OrderedDict[IOCCacheKey, tuple[IOC, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.ioc_cache_hits = 0
+        self.ioc_cache_misses = 0
+
     def analyze(
         self,
         email: Email,
@@ -92,9 +218,6 @@ class ThreatAnalyzer:
         Returns:
             Complete threat report with IOCs and recommendations
         """
-        iocs: list[IOC] = []
-        threat_vectors: list[ThreatVector] = []
-        recommendations: list[str] = []
         spam_trigger_words: list[TriggerWord] = []
         phishing_trigger_words: list[TriggerWord] = []
 
@@ -103,67 +226,199 @@ class ThreatAnalyzer:
             spam_prediction.probability, phishing_prediction.probability
         )
 
-        # Extract IOCs
-        iocs.extend(self._extract_urls(email.text))
-        iocs.extend(self._detect_urgency_keywords(email.text))
-        iocs.extend(self._detect_financial_keywords(email.text))
-        iocs.extend(self._detect_suspicious_patterns(email.text))
-
-        if email.sender:
-            iocs.extend(self._analyze_sender(email.sender))
-
-        # Identify threat vectors
-        threat_vectors = self._identify_threat_vectors(spam_prediction, phishing_prediction, iocs)
-
-        # Generate recommendations
-        recommendations = self._generate_recommendations(
-            risk_score, spam_prediction, phishing_prediction, iocs
-        )
-
-        # Extract trigger words (ML feature explanation)
-        if feature_explainer and spam_model and spam_vectorizer:
+        # Extract trigger words (ML feature explanation), skipped for confident negatives
+        if (
+            feature_explainer
+            and spam_model
+            and spam_vectorizer
+            and self._needs_trigger_words(spam_prediction)
+        ):
             spam_trigger_words = self._extract_trigger_words(
                 email.text, spam_model, spam_vectorizer, feature_explainer, "spam"
             )
 
-        if feature_explainer and phishing_model and phishing_vectorizer:
+        if (
+            feature_explainer
+            and phishing_model
+            and phishing_vectorizer
+            and self._needs_trigger_words(phishing_prediction)
+        ):
             phishing_trigger_words = self._extract_trigger_words(
                 email.text, phishing_model, phishing_vectorizer, feature_explainer, "phishing"
             )
 
+        return self._build_report(
+            email,
+            spam_prediction,
+            phishing_prediction,
+            risk_score,
+            spam_trigger_words,
+            phishing_trigger_words,
+        )
+
+    def analyze_batch(
+        self,
+        emails: Sequence[Email],
+        spam_predictions: Sequence[SinglePrediction],
+        phishing_predictions: Sequence[SinglePrediction],
+    ) -> list[ThreatReport]:
+        """
+        Perform threat analysis on many emails at once.
+
+        Risk scores for the whole batch are computed in a single pass before
+        any per-email work. Trigger words are not extracted (they need a
+        per-email model explanation); use analyze() when those are needed.
+
+        Args:
+            emails: Emails to analyze
+            spam_predictions: SPAM classification result per email (same order)
+            phishing_predictions: PHISHING classification result per email (same order)
+
+        Returns:
+            Threat reports in input order
+
+        Raises:
+            ValueError: If the sequences have different lengths
+        """
+        if not len(emails) == len(spam_predictions) == len(phishing_predictions):
+            raise ValueError(
+                "emails, spam_predictions and phishing_predictions must have the same length"
+            )
+
+        risk_scores = self._calculate_risk_scores(
+            [p.probability for p in spam_predictions],
+            [p.probability for p in phishing_predictions],
+        )
+
+        return [
+            self._build_report(email, spam_prediction, phishing_prediction, risk_score)
+            for email, spam_prediction, phishing_prediction, risk_score in zip(
+                emails, spam_predictions, phishing_predictions, risk_scores, strict=True
+            )
+        ]
+
+    # === Private methods ===
+
+    def _needs_trigger_words(self, prediction: SinglePrediction) -> bool:
+        """Check if a prediction's positive-class probability warrants explanation."""
+        # probability is the confidence in the predicted label, not in the positive class
+        positive_probability = (
+            prediction.probability if prediction.is_positive else 1.0 - prediction.probability
+        )
+        return positive_probability >= self.TRIGGER_WORD_THRESHOLD
+
+    def _build_report(
+        self,
+        email: Email,
+        spam_prediction: SinglePrediction,
+        phishing_prediction: SinglePrediction,
+        risk_score: int,
+        spam_trigger_words: list[TriggerWord] | None = None,
+        phishing_trigger_words: list[TriggerWord] | None = None,
+    ) -> ThreatReport:
+        """Assemble a threat report from a precomputed risk score."""
+        # Extract IOCs (memoized per email text and sender)
+        iocs = self._get_iocs(email)
+
+        # Index IOCs by type once for the rule checks below
+        iocs_by_type = self._group_by_type(iocs)
+
+        # Identify threat vectors
+        threat_vectors = self._identify_threat_vectors(
+            spam_prediction, phishing_prediction, iocs_by_type
+        )
+
+        # Generate recommendations
+        recommendations = self._generate_recommendations(
+            risk_score, spam_prediction, phishing_prediction, iocs_by_type
+        )
+
         return ThreatReport(
             risk_score=risk_score,
             iocs=iocs,
             threat_vectors=threat_vectors,
             recommendations=recommendations,
-            spam_trigger_words=spam_trigger_words,
-            phishing_trigger_words=phishing_trigger_words,
+            spam_trigger_words=spam_trigger_words or [],
+            phishing_trigger_words=phishing_trigger_words or [],
         )
 
+    def _get_iocs(self, email: Email) -> list[IOC]:
+        """Get IOCs for an email from cache, extracting them on a miss."""
+        if self._ioc_cache_size <= 0:
+            return list(self._extract_iocs(email))
+
+        digest = hashlib.blake2b(email.text.encode("utf-8"), digest_size=16).digest()
+        key = (digest, email.sender)
+
+        with self._lock:
+            cached = self._ioc_cache.get(key)
+            if cached is not None:
+                self._ioc_cache.move_to_end(key)
+                self.ioc_cache_hits += 1
+                return list(cached)
+            self.ioc_cache_misses += 1
+
+        iocs = self._extract_iocs(email)
+
+        with self._lock:
+            self._ioc_cache[key] = iocs
+            if len(self._ioc_cache) > self._ioc_cache_size:
+                self._ioc_cache.popitem(last=False)
+
+        # Fresh list per report: callers may mutate it, the cached tuple stays intact
+        return list(iocs)
+
+    def _extract_iocs(self, email: Email) -> tuple[IOC, ...]:
+        """Run every IOC scanner over an email."""
+        iocs: list[IOC] = []
+
+        # Body lowercased once, shared by all scanners
+        text_lower = email.text.lower()
+        keyword_hits = self._scan_keywords(text_lower)
+        iocs.extend(self._extract_urls(email.text, text_lower))
+        iocs.extend(self._detect_urgency_keywords(keyword_hits["urgency"]))
+        iocs.extend(self._detect_financial_keywords(keyword_hits["financial"]))
+        iocs.extend(self._detect_suspicious_patterns(email.text, text_lower))
+
+        if email.sender:
+            iocs.extend(self._analyze_sender(email.sender))
+
+        return tuple(iocs)
+
     def _calculate_risk_score(self, spam_prob: float, phishing_prob: float) -> int:
         """
         Calculate overall risk score (0-100).
 
         Phishing is weighted higher as it's more dangerous.
         """
-        # Phishing weight: 0.7, Spam weight: 0.3
-        weighted_risk = (phishing_prob * 0.7) + (spam_prob * 0.3)
+        weighted_risk = (phishing_prob * PHISHING_RISK_WEIGHT) + (spam_prob * SPAM_RISK_WEIGHT)
         return int(weighted_risk * 100)
 
-    def _extract_urls(self, text: str) -> list[IOC]:
+    def _calculate_risk_scores(
+        self, spam_probs: list[float], phishing_probs: list[float]
+    ) -> list[int]:
+        """Calculate risk scores for a batch, one _calculate_risk_score per email."""
+        return [
+            self._calculate_risk_score(spam_prob, phishing_prob)
+            for spam_prob, phishing_prob in zip(spam_probs, phishing_probs, strict=True)
+        ]
+
+    def _extract_urls(self, text: str, text_lower: str) -> list[IOC]:
         """Extract URLs and assess their risk"""
-        iocs = []
+        iocs: list[IOC] = []
+
+        if _URL_LITERAL not in text_lower:
+            return iocs
 
         # Find all URLs
-        url_pattern = r'https?://[^\s<>"\']+'
-        urls = re.findall(url_pattern, text, re.IGNORECASE)
+        urls = _URL_RE.findall(text)
 
         for url in urls:
             # Check if non-HTTPS
             is_http = url.startswith("http://")
 
             # Check for risky TLD
-            has_risky_tld = any(url.lower().endswith(tld) for tld in RISKY_TLDS)
+            has_risky_tld = url.lower().endswith(_RISKY_TLDS_TUPLE)
 
             # Determine severity
             if has_risky_tld:
@@ -180,21 +435,32 @@ class ThreatAnalyzer:
 
         return iocs
 
-    def _detect_urgency_keywords(self, text: str) -> list[IOC]:
-        """Detect urgency manipulation tactics"""
-        text_lower = text.lower()
-        found_keywords = []
+    def _scan_keywords(self, text_lower: str) -> dict[str, list[tuple[str, int]]]:
+        """
+        Count urgency and financial keyword occurrences in one helper.
 
-        for keyword in URGENCY_KEYWORDS:
+        Args:
+            text_lower: Lowercased email text
+
+        Returns:
+            (keyword, count) pairs of keywords present, by category
+        """
+        found: dict[str, list[tuple[str, int]]] = {"urgency": [], "financial": []}
+
+        for category, keyword in _KEYWORD_SCAN:
             count = text_lower.count(keyword)
-            if count > 0:
-                found_keywords.append((keyword, count))
+            if count:
+                found[category].append((keyword, count))
+
+        return found
 
+    def _detect_urgency_keywords(self, found_keywords: list[tuple[str, int]]) -> list[IOC]:
+        """Detect urgency manipulation tactics"""
         if not found_keywords:
             return []
 
         total_count = sum(count for _, count in found_keywords)
-        keywords_str = ", ".join(f"{kw} ({cnt}x)" for kw, cnt in found_keywords[:5])
+        keywords_str = ", ".join([f"{kw} ({cnt}x)" for kw, cnt in found_keywords[:5]])
 
         # More urgency keywords = higher severity
         if total_count >= 5:
@@ -214,20 +480,12 @@ class ThreatAnalyzer:
             )
         ]
 
-    def _detect_financial_keywords(self, text: str) -> list[IOC]:
+    def _detect_financial_keywords(self, found_keywords: list[tuple[str, int]]) -> list[IOC]:
         """Detect financial/credential harvesting attempts"""
-        text_lower = text.lower()
-        found_keywords = []
-
-        for keyword in FINANCIAL_KEYWORDS:
-            if keyword in text_lower:
-                count = text_lower.count(keyword)
-                found_keywords.append((keyword, count))
-
         if not found_keywords:
             return []
 
-        keywords_str = ", ".join(kw for kw, _ in found_keywords[:5])
+        keywords_str = ", ".join([kw for kw, _ in found_keywords[:5]])
 
         # Financial keywords in suspicious email = critical
         return [
@@ -240,20 +498,42 @@ class ThreatAnalyzer:
             )
         ]
 
-    def _detect_suspicious_patterns(self, text: str) -> list[IOC]:
+    def _detect_suspicious_patterns(self, text: str, text_lower: str) -> list[IOC]:
         """Detect suspicious text patterns"""
         iocs = []
 
-        for pattern, description in SUSPICIOUS_PATTERNS.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+        # lower() kept every offset, so lowercase matches map back to the original
+        same_offsets = len(text) == len(text_lower)
+
+        for regex, description, literal, folded_regex in _SUSPICIOUS_PATTERNS:
+            if literal is not None and literal not in text_lower:
+                continue
+
+            source = text
+            if folded_regex is not None:
+                if same_offsets:
+                    source = text_lower
+                else:
+                    regex = folded_regex
+
+            # Offsets always index the original text, so samples keep its case
+            samples: list[str] = []
+            count = 0
+            for match in regex.finditer(source):
+                if len(samples) < _PATTERN_SAMPLE_SIZE:
+                    samples.append(text[match.start() : match.end()])
+                count += 1
+                if count >= MAX_PATTERN_MATCHES:
+                    break
+
+            if count:
                 iocs.append(
                     IOC(
                         type="pattern",
                         severity="medium",
-                        value=", ".join(matches[:3]),  # First 3 matches
+                        value=", ".join(samples),
                         description=description,
-                        count=len(matches),
+                        count=count,
                     )
                 )
 
@@ -268,7 +548,7 @@ class ThreatAnalyzer:
             domain = sender.split("@")[1].lower()
 
             # Check for risky TLD
-            has_risky_tld = any(domain.endswith(tld) for tld in RISKY_TLDS)
+            has_risky_tld = domain.endswith(_RISKY_TLDS_TUPLE)
 
             if has_risky_tld:
                 iocs.append(
@@ -282,17 +562,24 @@ class ThreatAnalyzer:
 
         return iocs
 
+    def _group_by_type(self, iocs: list[IOC]) -> dict[str, list[IOC]]:
+        """Group IOCs by type, preserving their order within each type."""
+        iocs_by_type: dict[str, list[IOC]] = {}
+        for ioc in iocs:
+            iocs_by_type.setdefault(ioc.type, []).append(ioc)
+        return iocs_by_type
+
     def _identify_threat_vectors(
         self,
         spam_prediction: SinglePrediction,
         phishing_prediction: SinglePrediction,
-        iocs: list[IOC],
+        iocs_by_type: dict[str, list[IOC]],
     ) -> list[ThreatVector]:
         """Identify attack vectors based on predictions and IOCs"""
         vectors = []
 
         # Social engineering (urgency keywords)
-        urgency_iocs = [ioc for ioc in iocs if ioc.type == "keyword_urgency"]
+        urgency_iocs = iocs_by_type.get("keyword_urgency")
         if urgency_iocs:
             vectors.append(
                 ThreatVector(
@@ -303,8 +590,8 @@ class ThreatAnalyzer:
             )
 
         # Credential harvesting (financial keywords + URLs)
-        financial_iocs = [ioc for ioc in iocs if ioc.type == "keyword_financial"]
-        url_iocs = [ioc for ioc in iocs if ioc.type == "url"]
+        financial_iocs = iocs_by_type.get("keyword_financial")
+        url_iocs = iocs_by_type.get("url")
 
         if financial_iocs and url_iocs:
             vectors.append(
@@ -342,35 +629,32 @@ class ThreatAnalyzer:
         risk_score: int,
         spam_prediction: SinglePrediction,
         phishing_prediction: SinglePrediction,
-        iocs: list[IOC],
+        iocs_by_type: dict[str, list[IOC]],
     ) -> list[str]:
         """Generate security recommendations"""
-        recommendations = []
+        recommendations: list[str] = []
 
         # Critical recommendations
         if risk_score >= 70:
-            recommendations.append("🚫 Quarantine this email immediately")
-            recommendations.append("🔒 Block sender domain")
+            recommendations.extend(_REC_HIGH_RISK)
 
         if phishing_prediction.probability > 0.7:
-            recommendations.append("⚠️  Alert security team about potential phishing")
-            recommendations.append("📊 Add to threat intelligence database")
+            recommendations.extend(_REC_PHISHING)
 
         # URL-specific recommendations
-        url_iocs = [ioc for ioc in iocs if ioc.type == "url"]
+        url_iocs = iocs_by_type.get("url")
         if url_iocs:
-            recommendations.append("🔗 Do NOT click any links in this email")
-            if any(ioc.severity in ["critical", "high"] for ioc in url_iocs):
-                recommendations.append("🛡️  Add URLs to blocklist")
+            recommendations.append(REC_DO_NOT_CLICK_LINKS)
+            if any(ioc.severity in ("critical", "high") for ioc in url_iocs):
+                recommendations.append(REC_BLOCKLIST_URLS)
 
         # Sender recommendations
-        sender_iocs = [ioc for ioc in iocs if ioc.type == "sender"]
-        if sender_iocs:
-            recommendations.append("📧 Mark sender as malicious")
+        if "sender" in iocs_by_type:
+            recommendations.append(REC_MARK_SENDER_MALICIOUS)
 
         # If safe
         if risk_score < 30:
-            recommendations.append("✅ Email appears legitimate, safe to process")
+            recommendations.append(REC_SAFE)
 
         return recommendations
 
@@ -2,6 +2,7 @@
 
 from .joblib_model_loader import JoblibModelLoader
 from .json_formatter import JsonFormatter
+from .semantic_cache import HashingSemanticCache
 from .sklearn_predictor import SklearnPredictor
 from .text_formatter import TextFormatter
 
@@ -10,4 +11,5 @@ __all__ = [
     "SklearnPredictor",
     "TextFormatter",
     "JsonFormatter",
+    "HashingSemanticCache",
 ]
@@ -1,11 +1,16 @@
 """Joblib model loader - Loads models from .joblib files."""
 
+import os
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, get_args
 
 import joblib
 
-from ...domain.entities import ModelMetadata
+from ...domain.entities import ModelMetadata, ModelType
+
+# Supported model names, checked on every load/list call
+_MODEL_NAMES = frozenset(get_args(ModelType))
 
 
 class JoblibModelLoader:
@@ -16,9 +21,21 @@ class JoblibModelLoader:
     with joblib. Supports model versioning via timestamps and
     caches loaded models in memory for performance.
 
+    Numpy arrays inside uncompressed model files are memory-mapped
+    read-only by default, so several worker processes loading the same
+    model share its coefficient and IDF buffers through the OS page cache.
+
+    Loads use double-checked locking with one lock per cache key, so
+    concurrent first requests for a model read it from disk once while
+    different models still load in parallel.
+
     Attributes:
         _models_dir: Directory containing model files
+        _mmap_mode: joblib mmap_mode for numpy arrays (None loads into heap)
         _cache: In-memory cache of loaded models
+        _load_locks: Lock per cache key, guarding first loads
+        _listing_cache: Per model, (directory mtime, version listing newest first)
+        _timestamps_cache: Per model, (directory mtime, version timestamps newest first)
 
     Examples:
         >>> loader = JoblibModelLoader(models_dir=Path("models"))
@@ -26,21 +43,27 @@ class JoblibModelLoader:
         >>> models = loader.list_available("spam_detector")
     """
 
-    def __init__(self, models_dir: Path) -> None:
+    def __init__(self, models_dir: Path, mmap_mode: Literal["r"] | None = "r") -> None:
         """
         Initialize loader with models directory.
 
         Args:
             models_dir: Path to directory containing .joblib model files
+            mmap_mode: "r" to memory-map numpy arrays read-only, None to
+                load them fully into process memory
 
         Raises:
-            ValueError: If models_dir doesn't exist
+            ValueError: If models_dir doesn't exist or isn't a directory
         """
-        if not models_dir.exists():
+        if not os.path.isdir(models_dir):
             raise ValueError(f"Models directory does not exist: {models_dir}")
 
         self._models_dir = models_dir
+        self._mmap_mode = mmap_mode
         self._cache: dict[str, tuple[Any, Any, ModelMetadata]] = {}
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._listing_cache: dict[str, tuple[int, list[ModelMetadata]]] = {}
+        self._timestamps_cache: dict[str, tuple[int, list[str]]] = {}
 
     def load(self, model_name: str, timestamp: str | None = None) -> tuple[Any, Any, ModelMetadata]:
         """
@@ -61,30 +84,25 @@ class JoblibModelLoader:
 
         # Check cache first
         cache_key = f"{model_name}_{timestamp or 'latest'}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        # Determine timestamp
-        if timestamp is None:
-            timestamp = self._get_latest_timestamp(model_name)
-
-        # Load components
-        vectorizer = self._load_component(model_name, "vectorizer", timestamp)
-        model = self._load_component(model_name, "model", timestamp)
-        metadata_dict = self._load_component(model_name, "metadata", timestamp)
-
-        # Build metadata entity
-        metadata = self._build_metadata(model_name, metadata_dict)
-
-        # Cache and return
-        result = (vectorizer, model, metadata)
-        self._cache[cache_key] = result
+        result = self._cache.get(cache_key)
+        if result is not None:
+            return result
+
+        # dict.setdefault is atomic, so racing threads share one lock per key
+        with self._load_locks.setdefault(cache_key, threading.Lock()):
+            result = self._cache.get(cache_key)
+            if result is None:
+                result = self._load_version(model_name, timestamp)
+                self._cache[cache_key] = result
         return result
 
     def list_available(self, model_name: str) -> list[ModelMetadata]:
         """
         List all available versions of a model.
 
+        The listing is cached until the models directory's mtime changes,
+        i.e. until a model file is added, removed or renamed.
+
         Args:
             model_name: Name of model to list
 
@@ -96,20 +114,41 @@ class JoblibModelLoader:
         """
         self._validate_model_name(model_name)
 
-        # Find all model files
-        pattern = f"{model_name}_model_*.joblib"
-        model_files = sorted(
-            self._models_dir.glob(pattern),
-            reverse=True,  # Newest first
-        )
+        mtime_ns = self._models_dir.stat().st_mtime_ns
+        cached = self._listing_cache.get(model_name)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, self._scan_versions(model_name))
+            self._listing_cache[model_name] = cached
+        return list(cached[1])
+
+    def clear_cache(self) -> None:
+        """Clear the in-memory model and listing caches."""
+        self._cache.clear()
+        self._listing_cache.clear()
+        self._timestamps_cache.clear()
+
+    # === Private methods ===
 
-        if not model_files:
-            return []
+    def _load_version(
+        self, model_name: str, timestamp: str | None
+    ) -> tuple[Any, Any, ModelMetadata]:
+        """Read one model version's components from disk (latest if timestamp is None)."""
+        # Determine timestamp
+        if timestamp is None:
+            timestamp = self._get_latest_timestamp(model_name)
+
+        # Load components
+        vectorizer = self._load_component(model_name, "vectorizer", timestamp)
+        model = self._load_component(model_name, "model", timestamp)
+        metadata_dict = self._load_component(model_name, "metadata", timestamp)
+
+        # Build metadata entity
+        return vectorizer, model, self._build_metadata(model_name, metadata_dict)
 
-        # Load metadata for each version
+    def _scan_versions(self, model_name: str) -> list[ModelMetadata]:
+        """Read metadata of every version of a model from disk, newest first."""
         metadatas: list[ModelMetadata] = []
-        for model_file in model_files:
-            timestamp = self._extract_timestamp(model_file)
+        for timestamp in self._version_timestamps(model_name):
             try:
                 metadata_dict = self._load_component(model_name, "metadata", timestamp)
                 metadata = self._build_metadata(model_name, metadata_dict)
@@ -119,31 +158,48 @@ class JoblibModelLoader:
 
         return metadatas
 
-    def clear_cache(self) -> None:
-        """Clear the in-memory model cache."""
-        self._cache.clear()
-
-    # === Private methods ===
-
     def _validate_model_name(self, model_name: str) -> None:
         """Validate model name is supported."""
-        valid_names = {"spam_detector", "phishing_detector"}
-        if model_name not in valid_names:
-            raise ValueError(f"Invalid model_name '{model_name}'. Must be one of: {valid_names}")
+        if model_name not in _MODEL_NAMES:
+            raise ValueError(
+                f"Invalid model_name '{model_name}'. Must be one of: {', '.join(sorted(_MODEL_NAMES))}"
+            )
+
+    def _version_timestamps(self, model_name: str) -> list[str]:
+        """
+        Get timestamps of every model version, newest first.
+
+        The directory is globbed once and the result reused until its
+        mtime changes, so load() and list_available() share one scan.
+        """
+        mtime_ns = self._models_dir.stat().st_mtime_ns
+        cached = self._timestamps_cache.get(model_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        # YYYYMMDD_HHMMSS timestamps sort chronologically as plain strings;
+        # *_latest.joblib symlinks have no metadata of their own, so skip them
+        timestamps = sorted(
+            (
+                self._extract_timestamp(model_file)
+                for model_file in self._models_dir.glob(f"{model_name}_model_*.joblib")
+                if "_latest" not in model_file.stem
+            ),
+            reverse=True,  # Newest first
+        )
+        self._timestamps_cache[model_name] = (mtime_ns, timestamps)
+        return timestamps
 
     def _get_latest_timestamp(self, model_name: str) -> str:
         """Get timestamp of most recent model version."""
-        model_files = sorted(self._models_dir.glob(f"{model_name}_model_*.joblib"), reverse=True)
+        timestamps = self._version_timestamps(model_name)
+        if timestamps:
+            return timestamps[0]
 
-        if not model_files:
+        # Error path only: tell "nothing at all" apart from "only *_latest symlinks"
+        if not any(self._models_dir.glob(f"{model_name}_model_*.joblib")):
             raise FileNotFoundError(f"No models found for '{model_name}' in {self._models_dir}")
 
-        # Skip symlinks named *_latest.joblib
-        for model_file in model_files:
-            if "_latest" not in model_file.stem:
-                return self._extract_timestamp(model_file)
-
-        # If only _latest symlinks exist, raise error
         raise FileNotFoundError(
             f"Only symlinks found for '{model_name}'. Need timestamped model files."
         )
@@ -160,10 +216,11 @@ class JoblibModelLoader:
         filename = f"{model_name}_{component}_{timestamp}.joblib"
         filepath = self._models_dir / filename
 
-        if not filepath.exists():
-            raise FileNotFoundError(f"Component file not found: {filepath}")
-
-        return joblib.load(filepath)
+        # Let open() report a missing file instead of stat()-ing it first
+        try:
+            return joblib.load(filepath, mmap_mode=self._mmap_mode)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Component file not found: {filepath}") from None
 
     def _build_metadata(self, model_name: str, metadata_dict: dict) -> ModelMetadata:
         """Build ModelMetadata entity from loaded dict."""
@@ -1,11 +1,32 @@
 """JSON output formatter."""
 
 import json
+from collections.abc import Callable
 from typing import Any
 
 from ...domain.entities import ClassificationResult
 from ...domain.ports import DetailLevel
 
+try:  # Optional C JSON encoder: pip install orjson
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    """Serialize to pretty-printed (indent=2), non-ASCII-escaped JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+# Simple output has four fixed keys, so it is filled in directly (same text as _dumps).
+# Verdict and risk level come from closed sets of plain ASCII labels that need no
+# escaping, and float repr is exactly what json.dumps writes for finite floats.
+_SIMPLE_TEMPLATE = (
+    '{{\n  "verdict": "{}",\n  "confidence": {!r},\n  "is_malicious": {},\n  "risk_level": "{}"\n}}'
+)
+
 
 class JsonFormatter:
     """
@@ -21,6 +42,15 @@ class JsonFormatter:
         {"verdict": "SPAM+PHISHING", "confidence": 0.92, ...}
     """
 
+    __slots__ = ("_renderers",)
+
+    def __init__(self) -> None:
+        """Initialize formatter with its dict-rendering dispatch table."""
+        self._renderers: dict[str, Callable[[ClassificationResult], dict[str, Any]]] = {
+            "detailed": self._format_detailed,
+            "debug": self._format_debug,
+        }
+
     def format(self, result: ClassificationResult, detail_level: DetailLevel = "simple") -> str:
         """
         Format classification result as JSON string.
@@ -36,24 +66,20 @@ class JsonFormatter:
             JSON string (pretty-printed with indent=2)
         """
         if detail_level == "simple":
-            data = self._format_simple(result)
-        elif detail_level == "detailed":
-            data = self._format_detailed(result)
-        else:  # debug
-            data = self._format_debug(result)
-
-        return json.dumps(data, indent=2, ensure_ascii=False)
+            return self._format_simple(result)
+        render = self._renderers.get(detail_level, self._format_debug)
+        return _dumps(render(result))
 
     # === Private methods ===
 
-    def _format_simple(self, result: ClassificationResult) -> dict[str, Any]:
-        """Format simple output."""
-        return {
-            "verdict": result.final_verdict,
-            "confidence": round(result.max_confidence, 4),
-            "is_malicious": result.is_malicious,
-            "risk_level": result.risk_level,
-        }
+    def _format_simple(self, result: ClassificationResult) -> str:
+        """Format simple output straight to JSON text, without an intermediate dict."""
+        return _SIMPLE_TEMPLATE.format(
+            result.final_verdict,
+            round(result.max_confidence, 4),
+            "true" if result.is_malicious else "false",
+            result.risk_level,
+        )
 
     def _format_detailed(self, result: ClassificationResult) -> dict[str, Any]:
         """Format detailed output."""
@@ -79,40 +105,45 @@ class JsonFormatter:
 
     def _format_debug(self, result: ClassificationResult) -> dict[str, Any]:
         """Format debug output with all details."""
+        spam = result.spam_prediction
+        phishing = result.phishing_prediction
+        email = result.email
+        spam_probability = round(spam.probability, 4)
+        phishing_probability = round(phishing.probability, 4)
         return {
             "verdict": result.final_verdict,
             "risk_level": result.risk_level,
             "is_malicious": result.is_malicious,
             "confidence": {
                 "max": round(result.max_confidence, 4),
-                "spam": round(result.spam_prediction.probability, 4),
-                "phishing": round(result.phishing_prediction.probability, 4),
+                "spam": spam_probability,
+                "phishing": phishing_probability,
             },
             "predictions": {
                 "spam": {
-                    "label": result.spam_prediction.label,
-                    "probability": round(result.spam_prediction.probability, 4),
-                    "probability_percent": round(result.spam_prediction.probability_percent, 2),
-                    "is_positive": result.spam_prediction.is_positive,
-                    "model_name": result.spam_prediction.model_name,
-                    "model_timestamp": result.spam_prediction.model_timestamp,
+                    "label": spam.label,
+                    "probability": spam_probability,
+                    "probability_percent": round(spam.probability_percent, 2),
+                    "is_positive": spam.is_positive,
+                    "model_name": spam.model_name,
+                    "model_timestamp": spam.model_timestamp,
                 },
                 "phishing": {
-                    "label": result.phishing_prediction.label,
-                    "probability": round(result.phishing_prediction.probability, 4),
-                    "probability_percent": round(result.phishing_prediction.probability_percent, 2),
-                    "is_positive": result.phishing_prediction.is_positive,
-                    "model_name": result.phishing_prediction.model_name,
-                    "model_timestamp": result.phishing_prediction.model_timestamp,
+                    "label": phishing.label,
+                    "probability": phishing_probability,
+                    "probability_percent": round(phishing.probability_percent, 2),
+                    "is_positive": phishing.is_positive,
+                    "model_name": phishing.model_name,
+                    "model_timestamp": phishing.model_timestamp,
                 },
             },
             "email": {
-                "preview": result.email.preview,
-                "word_count": result.email.word_count,
-                "char_count": result.email.char_count,
-                "subject": result.email.subject,
-                "sender": result.email.sender,
+                "preview": email.preview,
+                "word_count": email.word_count,
+                "char_count": email.char_count,
+                "subject": email.subject,
+                "sender": email.sender,
             },
             "execution_time_ms": round(result.execution_time_ms, 2),
-            "models_used": result.models_used,
+            "models_used": dict(result.models_used),
         }
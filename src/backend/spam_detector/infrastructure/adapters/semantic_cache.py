@@ -0,0 +1,106 @@
+"""Semantic cache - Near-duplicate lookup of classification results."""
+
+import threading
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from ...domain.entities import ClassificationResult
+
+
+class HashingSemanticCache:
+    """
+    Cache classification results by cosine similarity of email text.
+
+    Implements ISemanticCache port. Texts are embedded with a stateless
+    HashingVectorizer (unit L2 norm, so inner product == cosine similarity)
+    and compared against a fixed-size matrix of cached embeddings by a
+    single brute-force matrix-vector product. When full, the oldest entry
+    is overwritten (FIFO).
+
+    Attributes:
+        _threshold: Minimum cosine similarity for a hit
+        _vectorizer: Stateless text embedder
+        _vectors: Cached embeddings, one row per slot
+        _results: Cached results, aligned with _vectors
+        _size: Number of occupied slots
+        _next: Slot to write next
+        _lock: Guards concurrent access from API worker threads
+        hits: Number of cache hits
+        misses: Number of cache misses
+
+    Examples:
+        >>> cache = HashingSemanticCache(maxsize=4096, threshold=0.95)
+        >>> cache.add("WINNER! Click http://a.tk now!", result)
+        >>> cache.lookup("WINNER! Click http://b.tk now!") is result
+        True
+    """
+
+    def __init__(self, maxsize: int = 4096, threshold: float = 0.95, n_features: int = 384) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached results
+            threshold: Minimum cosine similarity (0-1) for a hit
+            n_features: Embedding dimension
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+
+        self._threshold = threshold
+        self._vectorizer = HashingVectorizer(n_features=n_features, alternate_sign=False, norm="l2")
+        self._vectors = np.zeros((maxsize, n_features), dtype=np.float32)
+        self._results: list[ClassificationResult | None] = [None] * maxsize
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, email_text: str) -> ClassificationResult | None:
+        """Get result of the most similar cached email above threshold, or None."""
+        vector = self._embed(email_text)
+
+        with self._lock:
+            if self._size:
+                scores = self._vectors[: self._size] @ vector
+                best = int(scores.argmax())
+                if scores[best] >= self._threshold:
+                    self.hits += 1
+                    return self._results[best]
+
+            self.misses += 1
+            return None
+
+    def add(self, email_text: str, result: ClassificationResult) -> None:
+        """Cache result, overwriting the oldest entry if full."""
+        vector = self._embed(email_text)
+
+        with self._lock:
+            self._vectors[self._next] = vector
+            self._results[self._next] = result
+            self._next = (self._next + 1) % len(self._results)
+            self._size = min(self._size + 1, len(self._results))
+
+    def clear(self) -> None:
+        """Remove all cached results and reset counters."""
+        with self._lock:
+            self._results = [None] * len(self._results)
+            self._size = 0
+            self._next = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        return self._size
+
+    # === Private methods ===
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Embed text as a dense unit-norm vector."""
+        return self._vectorizer.transform([text]).toarray()[0].astype(np.float32)
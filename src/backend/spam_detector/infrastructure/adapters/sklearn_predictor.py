@@ -1,5 +1,6 @@
 """Sklearn predictor - Makes predictions using sklearn models."""
 
+from collections.abc import Sequence
 from typing import Any, Literal
 
 from ...domain.entities import Email, LabelType, ModelMetadata, SinglePrediction
@@ -14,11 +15,17 @@ class SklearnPredictor:
     Implements IPredictor port for making predictions with
     scikit-learn models (Logistic Regression + TF-IDF vectorizer).
 
+    The model and vectorizer may hold read-only memory-mapped arrays
+    (see JoblibModelLoader), so they are only used for inference and never
+    modified in place.
+
     Attributes:
         _vectorizer: Fitted TF-IDF vectorizer
         _model: Trained sklearn classifier
         _metadata: Model metadata
         _predictor_type: Type of prediction ("spam" or "phishing")
+        _transform: Bound vectorizer.transform, looked up once
+        _predict_proba: Bound model.predict_proba, looked up once
 
     Examples:
         >>> predictor = SklearnPredictor(
@@ -35,6 +42,15 @@ class SklearnPredictor:
         0.85
     """
 
+    __slots__ = (
+        "_vectorizer",
+        "_model",
+        "_metadata",
+        "_predictor_type",
+        "_transform",
+        "_predict_proba",
+    )
+
     def __init__(
         self, vectorizer: Any, model: Any, metadata: ModelMetadata, predictor_type: PredictorType
     ) -> None:
@@ -51,6 +67,24 @@ class SklearnPredictor:
         self._model = model
         self._metadata = metadata
         self._predictor_type = predictor_type
+        # Bind the two per-call methods once instead of on every prediction
+        self._transform = vectorizer.transform
+        self._predict_proba = model.predict_proba
+
+    @property
+    def metadata(self) -> ModelMetadata:
+        """Metadata of the model backing this predictor."""
+        return self._metadata
+
+    @property
+    def vectorizer(self) -> Any:
+        """Fitted TF-IDF vectorizer (read-only; may hold memory-mapped arrays)."""
+        return self._vectorizer
+
+    @property
+    def model(self) -> Any:
+        """Trained sklearn classifier (read-only; may hold memory-mapped arrays)."""
+        return self._model
 
     def predict(self, email: Email) -> SinglePrediction:
         """
@@ -67,11 +101,11 @@ class SklearnPredictor:
         """
         try:
             # Vectorize email text
-            text_vectorized = self._vectorizer.transform([email.text])
+            text_vectorized = self._transform([email.text])
 
-            # Get prediction and probabilities
-            prediction = self._model.predict(text_vectorized)[0]
-            probabilities = self._model.predict_proba(text_vectorized)[0]
+            # Score once; the predicted class is the most probable column
+            probabilities = self._predict_proba(text_vectorized)[0]
+            prediction = int(probabilities.argmax())
 
             # Convert prediction to label
             label = self._convert_to_label(prediction)
@@ -89,6 +123,49 @@ class SklearnPredictor:
         except Exception as e:
             raise ValueError(f"Failed to vectorize or predict email: {e}") from e
 
+    def predict_batch(self, emails: Sequence[Email]) -> list[SinglePrediction]:
+        """
+        Predict classification for several emails at once.
+
+        Vectorizes all texts in a single ``transform`` call and scores the
+        resulting matrix with one ``predict_proba`` pass, which amortizes
+        sklearn's per-call overhead across the batch.
+
+        Args:
+            emails: Email entities to classify
+
+        Returns:
+            One SinglePrediction per email, in input order
+
+        Raises:
+            ValueError: If email texts cannot be vectorized
+        """
+        if not emails:
+            return []
+
+        try:
+            texts_vectorized = self._transform([email.text for email in emails])
+
+            probabilities = self._predict_proba(texts_vectorized)
+            predictions = probabilities.argmax(axis=1)
+            best_probabilities = probabilities.max(axis=1)
+
+            # tolist() already yields Python ints/floats, no per-item conversion needed
+            return [
+                SinglePrediction(
+                    label=self._convert_to_label(prediction),
+                    probability=probability,
+                    model_name=self._metadata.name,
+                    model_timestamp=self._metadata.timestamp,
+                )
+                for prediction, probability in zip(
+                    predictions.tolist(), best_probabilities.tolist(), strict=True
+                )
+            ]
+
+        except Exception as e:
+            raise ValueError(f"Failed to vectorize or predict emails: {e}") from e
+
     # === Private methods ===
 
     def _convert_to_label(self, prediction: int) -> LabelType:
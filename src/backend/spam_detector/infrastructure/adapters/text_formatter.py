@@ -1,10 +1,18 @@
 """Text output formatter with Rich formatting."""
 
+from collections.abc import Callable
+
+from rich.cells import cell_len
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
 
+from ...domain.constants import (
+    NEGATIVE_PREDICTION_ICON,
+    POSITIVE_PREDICTION_ICON,
+    RISK_ICONS,
+    VERDICT_STYLES,
+)
 from ...domain.entities import ClassificationResult
 from ...domain.ports import DetailLevel
 
@@ -24,8 +32,13 @@ class TextFormatter:
     """
 
     def __init__(self) -> None:
-        """Initialize formatter with Rich console."""
+        """Initialize formatter with Rich console and detail-level dispatch table."""
         self._console = Console()
+        self._renderers: dict[str, Callable[[ClassificationResult], str]] = {
+            "simple": self._format_simple,
+            "detailed": self._format_detailed,
+            "debug": self._format_debug,
+        }
 
     def format(self, result: ClassificationResult, detail_level: DetailLevel = "simple") -> str:
         """
@@ -41,132 +54,92 @@ class TextFormatter:
         Returns:
             Formatted string with ANSI color codes
         """
-        if detail_level == "simple":
-            return self._format_simple(result)
-        elif detail_level == "detailed":
-            return self._format_detailed(result)
-        else:  # debug
-            return self._format_debug(result)
+        return self._renderers.get(detail_level, self._format_debug)(result)
 
     # === Private methods ===
 
     def _format_simple(self, result: ClassificationResult) -> str:
-        """Format simple one-line output."""
-        icon = self._get_risk_icon(result.risk_level)
-        verdict = result.final_verdict
+        """Format simple one-line output (plain text, no styling survives anyway)."""
+        icon = RISK_ICONS.get(result.risk_level, "❓")
         confidence = result.max_confidence * 100
-
-        text = Text()
-        text.append(f"{icon} ", style="bold")
-        text.append(verdict, style=self._get_verdict_style(verdict))
-        text.append(f" ({confidence:.1f}% confidence)", style="dim")
-
-        return text.plain
+        return f"{icon} {result.final_verdict} ({confidence:.1f}% confidence)"
 
     def _format_detailed(self, result: ClassificationResult) -> str:
-        """Format detailed output with table."""
-        # Build table
-        table = Table(show_header=False, box=None, padding=(0, 2))
-        table.add_column("Label", style="bold")
-        table.add_column("Value")
-
-        # Email preview
-        table.add_row("Email", result.email.preview)
-        table.add_section()
-
-        # Spam detection
-        spam_icon = "🔴" if result.spam_prediction.is_positive else "🟢"
-        spam_conf = result.spam_prediction.probability_percent
-        table.add_row(f"{spam_icon} SPAM", f"{result.spam_prediction.label} ({spam_conf:.1f}%)")
-
-        # Phishing detection
-        phish_icon = "🔴" if result.phishing_prediction.is_positive else "🟢"
-        phish_conf = result.phishing_prediction.probability_percent
-        table.add_row(
-            f"{phish_icon} PHISHING", f"{result.phishing_prediction.label} ({phish_conf:.1f}%)"
+        """Format detailed output as an aligned label/value block."""
+        spam = result.spam_prediction
+        phishing = result.phishing_prediction
+        spam_icon = POSITIVE_PREDICTION_ICON if spam.is_positive else NEGATIVE_PREDICTION_ICON
+        phish_icon = POSITIVE_PREDICTION_ICON if phishing.is_positive else NEGATIVE_PREDICTION_ICON
+        verdict_icon = RISK_ICONS.get(result.risk_level, "❓")
+
+        rows = (
+            ("Email", result.email.preview),
+            (f"{spam_icon} SPAM", f"{spam.label} ({spam.probability_percent:.1f}%)"),
+            (f"{phish_icon} PHISHING", f"{phishing.label} ({phishing.probability_percent:.1f}%)"),
+            (f"{verdict_icon} VERDICT", f"{result.final_verdict} ({result.risk_level})"),
         )
 
-        table.add_section()
-
-        # Final verdict
-        verdict_icon = self._get_risk_icon(result.risk_level)
-        table.add_row(f"{verdict_icon} VERDICT", f"{result.final_verdict} ({result.risk_level})")
+        # Fixed two-column layout: pad labels by display width (emoji take two
+        # cells) instead of paying for Table's measurement and wrapping passes
+        label_width = max(cell_len(label) for label, _ in rows)
+        text = Text()
+        for label, value in rows:
+            text.append(f"  {label}{' ' * (label_width - cell_len(label))}", style="bold")
+            text.append(f"    {value}\n")
 
         # Render to string
         with self._console.capture() as capture:
-            self._console.print(table)
+            self._console.print(text, end="", soft_wrap=True)
 
         return capture.get()
 
     def _format_debug(self, result: ClassificationResult) -> str:
         """Format debug output with full details."""
-        # Create panel content
-        lines = []
-
-        # Email info
-        lines.append("[bold cyan]EMAIL DETAILS:[/]")
-        lines.append(f"  Preview: {result.email.preview}")
-        lines.append(f"  Words: {result.email.word_count} | Chars: {result.email.char_count}")
-        if result.email.subject:
-            lines.append(f"  Subject: {result.email.subject}")
-        if result.email.sender:
-            lines.append(f"  Sender: {result.email.sender}")
-        lines.append("")
-
-        # Spam prediction
-        lines.append("[bold red]SPAM DETECTION:[/]")
-        lines.append(f"  Label: {result.spam_prediction.label}")
-        lines.append(
-            f"  Probability: {result.spam_prediction.probability:.4f} ({result.spam_prediction.probability_percent:.2f}%)"
-        )
-        lines.append(f"  Model: {result.spam_prediction.model_name}")
-        lines.append(f"  Version: {result.spam_prediction.model_timestamp}")
-        lines.append("")
-
-        # Phishing prediction
-        lines.append("[bold yellow]PHISHING DETECTION:[/]")
-        lines.append(f"  Label: {result.phishing_prediction.label}")
-        lines.append(
-            f"  Probability: {result.phishing_prediction.probability:.4f} ({result.phishing_prediction.probability_percent:.2f}%)"
-        )
-        lines.append(f"  Model: {result.phishing_prediction.model_name}")
-        lines.append(f"  Version: {result.phishing_prediction.model_timestamp}")
-        lines.append("")
-
-        # Final verdict
-        verdict_style = self._get_verdict_style(result.final_verdict)
-        lines.append("[bold]FINAL VERDICT:[/]")
-        lines.append(f"  Verdict: [{verdict_style}]{result.final_verdict}[/]")
-        lines.append(f"  Risk Level: {result.risk_level}")
-        lines.append(f"  Malicious: {result.is_malicious}")
-        lines.append(f"  Max Confidence: {result.max_confidence:.4f}")
-        lines.append("")
-
-        # Performance
-        lines.append("[bold dim]PERFORMANCE:[/]")
-        lines.append(f"  Execution Time: {result.execution_time_ms:.2f}ms")
-
-        content = "\n".join(lines)
+        email = result.email
+        spam = result.spam_prediction
+        phishing = result.phishing_prediction
+        verdict_style = VERDICT_STYLES.get(result.final_verdict, "white")
+
+        # Optional email fields, spliced into the template as whole lines
+        subject_line = f"\n  Subject: {email.subject}" if email.subject else ""
+        sender_line = f"\n  Sender: {email.sender}" if email.sender else ""
+
+        # Create panel content in one interpolation
+        content = f"""\
+[bold cyan]EMAIL DETAILS:[/]
+  Preview: {email.preview}
+  Words: {email.word_count} | Chars: {email.char_count}{subject_line}{sender_line}
+
+[bold red]SPAM DETECTION:[/]
+  Label: {spam.label}
+  Probability: {spam.probability:.4f} ({spam.probability_percent:.2f}%)
+  Model: {spam.model_name}
+  Version: {spam.model_timestamp}
+
+[bold yellow]PHISHING DETECTION:[/]
+  Label: {phishing.label}
+  Probability: {phishing.probability:.4f} ({phishing.probability_percent:.2f}%)
+  Model: {phishing.model_name}
+  Version: {phishing.model_timestamp}
+
+[bold]FINAL VERDICT:[/]
+  Verdict: [{verdict_style}]{result.final_verdict}[/]
+  Risk Level: {result.risk_level}
+  Malicious: {result.is_malicious}
+  Max Confidence: {result.max_confidence:.4f}
+
+[bold dim]PERFORMANCE:[/]
+  Execution Time: {result.execution_time_ms:.2f}ms"""
 
         # Render panel
-        icon = self._get_risk_icon(result.risk_level)
+        icon = RISK_ICONS.get(result.risk_level, "❓")
         panel = Panel(
             content,
             title=f"{icon} Email Classification Report",
-            border_style=self._get_verdict_style(result.final_verdict),
+            border_style=verdict_style,
         )
 
         with self._console.capture() as capture:
             self._console.print(panel)
 
         return capture.get()
-
-    def _get_risk_icon(self, risk_level: str) -> str:
-        """Get emoji icon for risk level."""
-        icons = {"LOW": "✅", "MEDIUM": "⚠️", "HIGH": "🔴", "CRITICAL": "🚨"}
-        return icons.get(risk_level, "❓")
-
-    def _get_verdict_style(self, verdict: str) -> str:
-        """Get Rich style for verdict."""
-        styles = {"HAM": "green", "SPAM": "red", "PHISHING": "yellow", "SPAM+PHISHING": "bold red"}
-        return styles.get(verdict, "white")
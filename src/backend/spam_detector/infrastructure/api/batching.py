@@ -0,0 +1,157 @@
+"""Request coalescing for the classification endpoint."""
+
+import asyncio
+import contextlib
+
+from ...application import Container
+from ...domain.constants import MILLISECONDS_TO_SECONDS
+from ...domain.entities import ClassificationResult, Email
+
+
+class ClassificationBatcher:
+    """
+    Coalesce concurrent classification requests into batched model calls.
+
+    Incoming requests are queued together with a future. A background task
+    drains up to ``max_batch_size`` queued requests (waiting at most
+    ``max_wait_ms`` for stragglers), classifies them with a single
+    ``execute_raw_email_batch`` call and resolves each future with its result.
+
+    Attributes:
+        _container: DI container providing the classify use case
+        _max_batch_size: Maximum number of requests per batch
+        _max_wait_s: Time to wait for more requests to join a batch
+        _queue: Pending (email, future) pairs
+        _task: Background task draining the queue
+        _batch: Requests taken off the queue but not yet resolved
+
+    Examples:
+        >>> batcher = ClassificationBatcher(container, max_batch_size=32, max_wait_ms=2.0)
+        >>> await batcher.start()
+        >>> result = await batcher.submit(Email(text="WINNER! Click here!"))
+        >>> await batcher.stop()
+    """
+
+    def __init__(
+        self, container: Container, max_batch_size: int = 32, max_wait_ms: float = 2.0
+    ) -> None:
+        """
+        Initialize batcher.
+
+        Args:
+            container: DI container providing the classify use case
+            max_batch_size: Maximum number of requests per batch
+            max_wait_ms: Time to wait for more requests to join a batch
+        """
+        self._container = container
+        self._max_batch_size = max_batch_size
+        self._max_wait_s = max_wait_ms * MILLISECONDS_TO_SECONDS
+        self._queue: asyncio.Queue[tuple[Email, asyncio.Future[ClassificationResult]]] = (
+            asyncio.Queue()
+        )
+        self._task: asyncio.Task[None] | None = None
+        self._batch: list[tuple[Email, asyncio.Future[ClassificationResult]]] = []
+
+    async def start(self) -> None:
+        """Start the background batching task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background batching task and fail unresolved requests."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        # In-flight and still-queued requests would otherwise wait forever
+        pending = self._batch
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._fail(pending, RuntimeError("ClassificationBatcher stopped"))
+        self._batch = []
+
+    async def submit(self, email: Email) -> ClassificationResult:
+        """
+        Queue an email for classification and wait for its result.
+
+        Args:
+            email: Validated Email entity to classify
+
+        Returns:
+            ClassificationResult for this email
+
+        Raises:
+            RuntimeError: If the batcher is not running
+        """
+        if self._task is None or self._task.done():
+            raise RuntimeError("ClassificationBatcher is not running")
+
+        future: asyncio.Future[ClassificationResult] = asyncio.get_running_loop().create_future()
+        await self._queue.put((email, future))
+        return await future
+
+    # === Private methods ===
+
+    async def _run(self) -> None:
+        """Drain the queue in batches forever."""
+        while True:
+            self._batch = batch = [await self._queue.get()]
+            self._drain(batch)
+
+            if len(batch) < self._max_batch_size and self._max_wait_s > 0:
+                # Give concurrent requests a chance to join this batch
+                await asyncio.sleep(self._max_wait_s)
+                self._drain(batch)
+
+            try:
+                await self._process(batch)
+            except Exception as e:
+                # Keep serving later batches whatever went wrong with this one
+                self._fail(batch, e)
+            self._batch = []
+
+    def _drain(self, batch: list[tuple[Email, asyncio.Future[ClassificationResult]]]) -> None:
+        """Move already-queued requests into the batch, up to the size limit."""
+        while len(batch) < self._max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    @staticmethod
+    def _fail(
+        batch: list[tuple[Email, asyncio.Future[ClassificationResult]]], error: Exception
+    ) -> None:
+        """Resolve every still-pending future in the batch with an error."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _process(
+        self, batch: list[tuple[Email, asyncio.Future[ClassificationResult]]]
+    ) -> None:
+        """Classify a batch off the event loop and resolve its futures."""
+        emails = [email for email, _ in batch]
+
+        try:
+            # Loads the predictors on first use, so it fails when models are missing
+            use_case = self._container.get_classify_use_case()
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        try:
+            results = await asyncio.to_thread(use_case.execute_raw_email_batch, emails)
+        except Exception:
+            # One failing email must not fail the whole batch: retry one by one
+            for email, future in batch:
+                if future.done():
+                    continue
+                try:
+                    future.set_result(await asyncio.to_thread(use_case.execute_raw_email, email))
+                except Exception as e:
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,41 @@
+"""Shared FastAPI dependencies."""
+
+from fastapi import HTTPException, status
+
+from ...application import Container
+
+# Set once by the app lifespan; read on every request without touching the Request
+_container: Container | None = None
+
+
+def set_container(container: Container | None) -> None:
+    """
+    Register the container served to request handlers.
+
+    Called by the app lifespan at startup (and with None at shutdown).
+
+    Args:
+        container: Initialized DI container, or None to unregister it
+    """
+    global _container
+    _container = container
+
+
+def get_container() -> Container:
+    """
+    Dependency to get the application container.
+
+    Takes no Request parameter, so FastAPI has nothing to bind per call.
+
+    Returns:
+        Container registered at startup
+
+    Raises:
+        HTTPException 503: Application has not finished starting up
+    """
+    if _container is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="DI container not initialized",
+        )
+    return _container
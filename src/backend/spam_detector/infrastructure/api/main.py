@@ -1,16 +1,54 @@
 """FastAPI application entry point."""
 
+import asyncio
+import logging
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Request, status
+from fastapi.responses import HTMLResponse, JSONResponse
 
 from ...application import Container
 from ...config import settings
+from ...domain.constants import NANOSECONDS_TO_MILLISECONDS
+from ...domain.entities import Email
+from .batching import ClassificationBatcher
+from .dependencies import set_container
+from .middleware import StaticCORSMiddleware
 from .routers import classify, models
 
+logger = logging.getLogger(__name__)
+
+# Longest origin list served by StaticCORSMiddleware instead of CORSMiddleware
+STATIC_CORS_MAX_ORIGINS = 4
+
+
+def _warm_up(container: Container) -> float | None:
+    """
+    Load both predictors and run one dummy classification.
+
+    Forces joblib deserialization and sklearn's lazy initialization so the
+    first real request doesn't pay for it.
+
+    Returns:
+        Warm-up time in milliseconds, or None if models could not be loaded
+    """
+    start_ns = time.perf_counter_ns()
+    try:
+        container.warmup()
+        container.get_classifier_service().classify(Email(text="warmup"))
+    except Exception:
+        # Requests will surface the error (e.g. 503 when models are missing)
+        logger.warning("Model warm-up failed", exc_info=True)
+        return None
+    return (time.perf_counter_ns() - start_ns) / NANOSECONDS_TO_MILLISECONDS
+
+
+def _uses_static_cors(origins: list[str]) -> bool:
+    """Whether CORS origins are few and exact enough for StaticCORSMiddleware."""
+    return 0 < len(origins) <= STATIC_CORS_MAX_ORIGINS and "*" not in origins
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -18,19 +56,34 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Manage application lifespan events.
 
     Handles startup and shutdown:
-    - Startup: Initialize DI container, load models
-    - Shutdown: Cleanup resources
+    - Startup: Initialize DI container, warm up models, start request batcher
+    - Shutdown: Stop request batcher
     """
     # Startup: Initialize container
     container = Container(settings)
 
-    # Store container in app state for dependency injection
+    # Register container for dependency injection (app state kept for health checks)
+    set_container(container)
     app.state.container = container
 
+    # Warm up models before accepting traffic (off the event loop)
+    app.state.warmup_ms = await asyncio.to_thread(_warm_up, container)
+
+    # Coalesce concurrent classify requests into batched model calls
+    batcher = ClassificationBatcher(
+        container,
+        max_batch_size=settings.api_batch_max_size,
+        max_wait_ms=settings.api_batch_max_wait_ms,
+    )
+    await batcher.start()
+    app.state.batcher = batcher
+
     yield
 
-    # Shutdown: cleanup if needed
-    # (Currently no cleanup needed, but hook is here for future)
+    # Shutdown: stop batcher
+    await batcher.stop()
+    app.state.batcher = None
+    set_container(None)
 
 
 # Create FastAPI application
@@ -72,14 +125,36 @@ app = FastAPI(
     openapi_url="/openapi.json",
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.api_cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware (skipped entirely when no origins are allowed)
+if _uses_static_cors(settings.api_cors_origins):
+    # Fixed short origin list: precomputed headers, no per-request matching
+    app.add_middleware(StaticCORSMiddleware, allow_origins=settings.api_cors_origins)
+elif settings.api_cors_origins:
+    from fastapi.middleware.cors import CORSMiddleware
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.api_cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    """
+    Answer unexpected errors with a generic 500.
+
+    Routers only translate the errors they expect (bad input, missing
+    models). Anything else ends here: the client gets no internal details,
+    and the server still logs the traceback.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error"},
+    )
+
 
 # Include routers
 app.include_router(
@@ -174,7 +249,7 @@ def root() -> str:
 
 
 @app.get("/health", tags=["Health"])
-def health() -> dict[str, str | bool | dict]:
+def health() -> dict[str, str | bool | dict | float | None]:
     """
     Enhanced health check endpoint.
 
@@ -219,6 +294,7 @@ def health() -> dict[str, str | bool | dict]:
             "status": "healthy" if all_models_loaded else "degraded",
             "models_loaded": all_models_loaded,
             "models": models_status,
+            "warmup_ms": getattr(app.state, "warmup_ms", None),
             "api_version": "1.0.0",
         }
 
@@ -0,0 +1,119 @@
+"""Lightweight ASGI middleware for the API."""
+
+from collections.abc import Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Methods advertised on preflight (same set Starlette expands "*" to)
+ALLOWED_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+PREFLIGHT_MAX_AGE_SECONDS = 600
+
+
+class StaticCORSMiddleware:
+    """
+    CORS middleware for a small, fixed list of allowed origins.
+
+    Equivalent to Starlette's CORSMiddleware configured with explicit
+    origins, credentials allowed and all methods/headers allowed, but
+    with every response header precomputed at startup. Per request it
+    only does one set lookup on the Origin header.
+
+    Attributes:
+        _app: Wrapped ASGI application
+        _allow_origins: Allowed origins as raw header bytes
+        _simple_headers: Headers appended to allowed non-preflight responses
+        _preflight_headers: Headers sent on allowed preflight responses
+
+    Examples:
+        >>> app.add_middleware(
+        ...     StaticCORSMiddleware, allow_origins=["https://app.example.com"]
+        ... )
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Sequence[str]) -> None:
+        """
+        Initialize middleware.
+
+        Args:
+            app: ASGI application to wrap
+            allow_origins: Exact origins allowed to make cross-origin requests
+        """
+        self._app = app
+        self._allow_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self._simple_headers = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        self._preflight_headers = [
+            *self._simple_headers,
+            (b"access-control-allow-methods", ", ".join(ALLOWED_METHODS).encode("latin-1")),
+            (b"access-control-max-age", str(PREFLIGHT_MAX_AGE_SECONDS).encode("latin-1")),
+            (b"content-type", b"text/plain; charset=utf-8"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request."""
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self._app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_headers, send)
+            return
+
+        if origin not in self._allow_origins:
+            await self._app(scope, receive, send)
+            return
+
+        cors_headers = [(b"access-control-allow-origin", origin), *self._simple_headers]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self._app(scope, receive, send_with_cors)
+
+    # === Private methods ===
+
+    async def _preflight(self, origin: bytes, request_headers: bytes | None, send: Send) -> None:
+        """Answer a CORS preflight request without reaching the application."""
+        if origin not in self._allow_origins:
+            body = b"Disallowed CORS origin"
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 400,
+                    "headers": [
+                        (b"content-type", b"text/plain; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode("latin-1")),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = [
+            (b"access-control-allow-origin", origin),
+            *self._preflight_headers,
+            (b"content-length", b"2"),
+        ]
+        if request_headers is not None:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"OK"})
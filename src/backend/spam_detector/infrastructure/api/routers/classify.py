@@ -1,11 +1,20 @@
 """Classification endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 
 from ....application import Container
+from ....domain.entities import ClassificationResult, Email
 from ....domain.services.feature_explainer import FeatureExplainer
 from ....domain.services.threat_analyzer import ThreatAnalyzer
-from ..schemas import ClassificationResponse, ClassifyEmailRequest
+from ..batching import ClassificationBatcher
+from ..dependencies import get_container
+from ..schemas import (
+    BatchClassificationResponse,
+    BatchClassifyEmailRequest,
+    ClassificationResponse,
+    ClassifyEmailRequest,
+)
 
 router = APIRouter()
 
@@ -14,17 +23,17 @@ threat_analyzer = ThreatAnalyzer()
 feature_explainer = FeatureExplainer()
 
 
-def get_container(request: Request) -> Container:
+def get_batcher(request: Request) -> ClassificationBatcher | None:
     """
-    Dependency to get container instance from app state.
+    Dependency to get the request batcher from app state.
 
     Args:
         request: FastAPI request object
 
     Returns:
-        Container instance from app state
+        ClassificationBatcher instance, or None if not started (no lifespan)
     """
-    return request.app.state.container
+    return getattr(request.app.state, "batcher", None)
 
 
 @router.post(
@@ -40,8 +49,10 @@ def get_container(request: Request) -> Container:
     """,
     response_description="Classification result with detailed predictions",
 )
-def classify_email(
-    request: ClassifyEmailRequest, container: Container = Depends(get_container)
+async def classify_email(
+    request: ClassifyEmailRequest,
+    container: Container = Depends(get_container),
+    batcher: ClassificationBatcher | None = Depends(get_batcher),
 ) -> ClassificationResponse:
     """
     Classify an email as SPAM/PHISHING.
@@ -49,6 +60,7 @@ def classify_email(
     Args:
         request: Email classification request with text and optional metadata
         container: DI container (injected)
+        batcher: Request batcher (injected)
 
     Returns:
         ClassificationResponse with complete classification results
@@ -58,42 +70,18 @@ def classify_email(
         HTTPException 503: Model not loaded or unavailable
     """
     try:
-        # Get use case from container
-        use_case = container.get_classify_use_case()
-
-        # Build full email text (subject + sender + body)
-        full_text = request.email_text
-        if request.subject:
-            full_text = f"Subject: {request.subject}\n{full_text}"
-        if request.sender:
-            full_text = f"From: {request.sender}\n{full_text}"
-
-        # Execute classification (use execute_raw to get domain entity)
-        result = use_case.execute_raw(email_text=full_text)
-
-        # Get model loader from container
-        model_loader = container.get_model_loader()
-
-        # Load SPAM model and vectorizer
-        spam_vectorizer, spam_model, _ = model_loader.load("spam_detector")
-
-        # Load PHISHING model and vectorizer
-        phishing_vectorizer, phishing_model, _ = model_loader.load("phishing_detector")
-
-        # Perform threat analysis (with feature explanation)
-        threat_report = threat_analyzer.analyze(
-            email=result.email,
-            spam_prediction=result.spam_prediction,
-            phishing_prediction=result.phishing_prediction,
-            spam_model=spam_model,
-            spam_vectorizer=spam_vectorizer,
-            phishing_model=phishing_model,
-            phishing_vectorizer=phishing_vectorizer,
-            feature_explainer=feature_explainer,
-        )
-
-        # Convert domain entity → API response (with threat report)
-        return ClassificationResponse.from_domain(result, threat_report)
+        # Validate once; use case and batcher take the entity as-is
+        email = _to_email(request)
+
+        # Execute classification (batched with concurrent requests when possible)
+        if batcher is not None:
+            result = await batcher.submit(email)
+        else:
+            use_case = container.get_classify_use_case()
+            result = await use_case.execute_raw_email_async(email)
+
+        # Threat analysis is CPU-bound: keep it off the event loop
+        return await run_in_threadpool(_build_response, container, result)
 
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -101,9 +89,140 @@ def classify_email(
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Model not loaded: {e}"
         ) from e
-    except Exception as e:
-        # Catch-all for unexpected errors
+
+
+@router.post(
+    "/classify/batch",
+    response_model=BatchClassificationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Classify emails in batch",
+    description="""
+    Classify several emails in one request.
+
+    All emails are scored with one batched call per model and analyzed
+    together. Batch threat reports do not include trigger words.
+    """,
+    response_description="Classification results in request order",
+)
+async def classify_emails_batch(
+    request: BatchClassifyEmailRequest,
+    container: Container = Depends(get_container),
+) -> BatchClassificationResponse:
+    """
+    Classify several emails as SPAM/PHISHING.
+
+    Args:
+        request: Batch of email classification requests
+        container: DI container (injected)
+
+    Returns:
+        BatchClassificationResponse with one result per email
+
+    Raises:
+        HTTPException 400: Invalid email text or validation error
+        HTTPException 503: Model not loaded or unavailable
+    """
+    try:
+        emails = [_to_email(item) for item in request.emails]
+
+        # Inference and threat analysis are CPU-bound: keep them off the event loop
+        return await run_in_threadpool(_classify_batch, container, emails)
+
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except FileNotFoundError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Internal server error: {str(e)}",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Model not loaded: {e}"
         ) from e
+
+
+def _to_email(request: ClassifyEmailRequest) -> Email:
+    """
+    Build the Email entity for a classification request.
+
+    Subject and sender are prepended to the body, as the models were trained
+    on full email text.
+
+    Args:
+        request: Email classification request
+
+    Returns:
+        Validated Email entity
+
+    Raises:
+        ValueError: If the resulting email text is empty
+    """
+    if not request.subject and not request.sender:
+        return Email(text=request.email_text)
+
+    # Join headers and body once rather than re-copying the body per header
+    lines = []
+    if request.sender:
+        lines.append(f"From: {request.sender}")
+    if request.subject:
+        lines.append(f"Subject: {request.subject}")
+    lines.append(request.email_text)
+    return Email(text="\n".join(lines))
+
+
+def _classify_batch(container: Container, emails: list[Email]) -> BatchClassificationResponse:
+    """
+    Classify and analyze a batch of emails and build the API response.
+
+    Args:
+        container: DI container providing the classify use case
+        emails: Validated emails to classify
+
+    Returns:
+        BatchClassificationResponse in input order
+    """
+    use_case = container.get_classify_use_case()
+    results = use_case.execute_raw_email_batch(emails)
+
+    threat_reports = threat_analyzer.analyze_batch(
+        [result.email for result in results],
+        [result.spam_prediction for result in results],
+        [result.phishing_prediction for result in results],
+    )
+
+    return BatchClassificationResponse(
+        total=len(results),
+        results=[
+            ClassificationResponse.from_domain(result, report)
+            for result, report in zip(results, threat_reports, strict=True)
+        ],
+    )
+
+
+def _build_response(container: Container, result: ClassificationResult) -> ClassificationResponse:
+    """
+    Run threat analysis on a classification result and build the API response.
+
+    The models to explain come from the container's predictor singletons
+    (loaded at startup), so they are the same ones, fallback included,
+    that produced the predictions.
+
+    Args:
+        container: DI container providing the predictors
+        result: Classification result to analyze
+
+    Returns:
+        ClassificationResponse with threat report
+    """
+    spam_predictor = container.get_spam_predictor()
+    phishing_predictor = container.get_phishing_predictor()
+
+    # Perform threat analysis (with feature explanation)
+    threat_report = threat_analyzer.analyze(
+        email=result.email,
+        spam_prediction=result.spam_prediction,
+        phishing_prediction=result.phishing_prediction,
+        spam_model=spam_predictor.model,
+        spam_vectorizer=spam_predictor.vectorizer,
+        phishing_model=phishing_predictor.model,
+        phishing_vectorizer=phishing_predictor.vectorizer,
+        feature_explainer=feature_explainer,
+    )
+
+    # Convert domain entity → API response (with threat report)
+    return ClassificationResponse.from_domain(result, threat_report)
@@ -1,27 +1,15 @@
 """Models management endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Path, status
 
 from ....application import Container
 from ....domain.entities import ModelType
+from ..dependencies import get_container
 from ..schemas import ModelInfoResponse, ModelsListResponse
 
 router = APIRouter()
 
 
-def get_container(request: Request) -> Container:
-    """
-    Dependency to get container instance from app state.
-
-    Args:
-        request: FastAPI request object
-
-    Returns:
-        Container instance from app state
-    """
-    return request.app.state.container
-
-
 @router.get(
     "/models/{model_name}",
     response_model=ModelsListResponse,
@@ -60,11 +48,6 @@ def list_models(
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Internal server error: {str(e)}",
-        ) from e
 
 
 @router.get(
@@ -107,10 +90,3 @@ def get_latest_model(
         return ModelInfoResponse.from_domain(latest)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
-    except HTTPException:
-        raise  # Re-raise HTTP exceptions as-is
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Internal server error: {str(e)}",
-        ) from e
@@ -1,10 +1,17 @@
 """API request/response schemas."""
 
-from .requests import ClassifyEmailRequest
-from .responses import ClassificationResponse, ModelInfoResponse, ModelsListResponse
+from .requests import BatchClassifyEmailRequest, ClassifyEmailRequest
+from .responses import (
+    BatchClassificationResponse,
+    ClassificationResponse,
+    ModelInfoResponse,
+    ModelsListResponse,
+)
 
 __all__ = [
+    "BatchClassifyEmailRequest",
     "ClassifyEmailRequest",
+    "BatchClassificationResponse",
     "ClassificationResponse",
     "ModelInfoResponse",
     "ModelsListResponse",
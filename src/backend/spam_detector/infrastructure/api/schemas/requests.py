@@ -2,6 +2,9 @@
 
 from pydantic import BaseModel, Field
 
+# Upper bound on emails accepted by one batch classification request
+MAX_BATCH_EMAILS = 256
+
 
 class ClassifyEmailRequest(BaseModel):
     """
@@ -42,3 +45,41 @@ class ClassifyEmailRequest(BaseModel):
             ]
         }
     }
+
+
+class BatchClassifyEmailRequest(BaseModel):
+    """
+    Request schema for batch email classification endpoint.
+
+    Attributes:
+        emails: Emails to classify (1 to MAX_BATCH_EMAILS)
+
+    Examples:
+        >>> request = BatchClassifyEmailRequest(
+        ...     emails=[ClassifyEmailRequest(email_text="WINNER! You have won $1000!")]
+        ... )
+    """
+
+    emails: list[ClassifyEmailRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_EMAILS,
+        description="Emails to classify",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "emails": [
+                        {"email_text": "WINNER! You have won $1000! Click here NOW!"},
+                        {
+                            "email_text": "Hi team, the meeting moved to 3pm.",
+                            "subject": "Meeting",
+                            "sender": "boss@company.com",
+                        },
+                    ]
+                }
+            ]
+        }
+    }
@@ -1,5 +1,6 @@
 """API response schemas (Pydantic models)."""
 
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -19,8 +20,10 @@ class TriggerWordResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, trigger: TriggerWord) -> "TriggerWordResponse":
-        """Convert domain TriggerWord to API response"""
-        return cls(word=trigger.word, contribution=trigger.contribution, category=trigger.category)
+        """Convert domain TriggerWord to API response (already validated by the entity)"""
+        return cls.model_construct(
+            word=trigger.word, contribution=trigger.contribution, category=trigger.category
+        )
 
 
 class IOCResponse(BaseModel):
@@ -36,8 +39,8 @@ class IOCResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, ioc: IOC) -> "IOCResponse":
-        """Convert domain IOC to API response"""
-        return cls(
+        """Convert domain IOC to API response (already validated by the entity)"""
+        return cls.model_construct(
             type=ioc.type,
             severity=ioc.severity,
             value=ioc.value,
@@ -55,8 +58,10 @@ class ThreatVectorResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, vector: ThreatVector) -> "ThreatVectorResponse":
-        """Convert domain ThreatVector to API response"""
-        return cls(name=vector.name, description=vector.description, confidence=vector.confidence)
+        """Convert domain ThreatVector to API response (already validated by the entity)"""
+        return cls.model_construct(
+            name=vector.name, description=vector.description, confidence=vector.confidence
+        )
 
 
 class ThreatReportResponse(BaseModel):
@@ -77,12 +82,12 @@ class ThreatReportResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, report: ThreatReport) -> "ThreatReportResponse":
-        """Convert domain ThreatReport to API response"""
-        return cls(
+        """Convert domain ThreatReport to API response (already validated by the entity)"""
+        return cls.model_construct(
             risk_score=report.risk_score,
             iocs=[IOCResponse.from_domain(ioc) for ioc in report.iocs],
             threat_vectors=[ThreatVectorResponse.from_domain(v) for v in report.threat_vectors],
-            recommendations=report.recommendations,
+            recommendations=list(report.recommendations),
             spam_trigger_words=[
                 TriggerWordResponse.from_domain(tw) for tw in report.spam_trigger_words
             ],
@@ -138,6 +143,9 @@ class ClassificationResponse(BaseModel):
         """
         Convert domain entity to API response.
 
+        Validation is skipped because the domain entities already enforce
+        these constraints; the nested threat report is built the same way.
+
         Args:
             result: ClassificationResult from domain layer
             threat_report: ThreatReport from threat analyzer
@@ -156,7 +164,7 @@ class ClassificationResponse(BaseModel):
             >>> response.verdict
             'SPAM+PHISHING'
         """
-        return cls(
+        return cls.model_construct(
             verdict=result.final_verdict,
             risk_level=result.risk_level,
             is_malicious=result.is_malicious,
@@ -221,6 +229,21 @@ class ClassificationResponse(BaseModel):
     }
 
 
+class BatchClassificationResponse(BaseModel):
+    """
+    Response schema for batch email classification.
+
+    Attributes:
+        total: Number of emails classified
+        results: One classification per email, in request order
+    """
+
+    total: int = Field(..., ge=0, description="Number of emails classified")
+    results: list[ClassificationResponse] = Field(
+        ..., description="Classification results, in request order"
+    )
+
+
 class ModelInfoResponse(BaseModel):
     """
     Response schema for model metadata information.
@@ -248,21 +271,17 @@ class ModelInfoResponse(BaseModel):
         """
         Convert domain entity to API response.
 
+        Metadata is immutable per model version, so conversions are memoized
+        per entity; validation is skipped because ModelMetadata already
+        enforces these constraints.
+
         Args:
             metadata: ModelMetadata from domain layer
 
         Returns:
             ModelInfoResponse for API
         """
-        return cls(
-            name=metadata.name,
-            timestamp=metadata.timestamp,
-            accuracy=metadata.accuracy,
-            accuracy_percent=metadata.accuracy_percent,
-            train_samples=metadata.train_samples,
-            vocabulary_size=metadata.vocabulary_size,
-            file_size_mb=metadata.file_size_mb,
-        )
+        return _model_info_from_domain(metadata)
 
     model_config = {
         "json_schema_extra": {
@@ -281,6 +300,20 @@ class ModelInfoResponse(BaseModel):
     }
 
 
+@lru_cache(maxsize=256)
+def _model_info_from_domain(metadata: ModelMetadata) -> ModelInfoResponse:
+    """Build ModelInfoResponse from trusted domain metadata without validation."""
+    return ModelInfoResponse.model_construct(
+        name=metadata.name,
+        timestamp=metadata.timestamp,
+        accuracy=metadata.accuracy,
+        accuracy_percent=metadata.accuracy_percent,
+        train_samples=metadata.train_samples,
+        vocabulary_size=metadata.vocabulary_size,
+        file_size_mb=metadata.file_size_mb,
+    )
+
+
 class ModelsListResponse(BaseModel):
     """
     Response schema for list of model versions.
@@ -1,17 +1,20 @@
 """CLI commands implementation."""
 
+import json
 import sys
+from functools import cache
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from ...application import Container
+from ...domain.entities import Email
 from ...domain.ports import DetailLevel
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ...application import Container
 
 # Models subcommand app
 models_app = typer.Typer(help="Manage and list available models")
@@ -49,6 +52,7 @@ def predict_command(
     """
     # Get container from context
     container: Container = ctx.obj
+    console = get_console()
 
     # Determine input source
     email_text = _get_email_text(text, file)
@@ -74,6 +78,9 @@ def predict_command(
         raise typer.Exit(1) from None
 
     try:
+        # Load both models in parallel rather than one after the other
+        container.warmup()
+
         # Get use case
         use_case = container.get_classify_use_case(format_type=format)  # type: ignore
 
@@ -86,7 +93,7 @@ def predict_command(
         )
 
         # Output result
-        console.print(result)
+        _print_output(result)
 
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}")
@@ -102,6 +109,68 @@ def predict_command(
         raise typer.Exit(1) from None
 
 
+def predict_batch_command(
+    ctx: typer.Context,
+    file: Annotated[
+        Path, typer.Option("--file", "-f", help="JSONL file, one email object per line")
+    ],
+    format: Annotated[str, typer.Option("--format", help="Output format (text or json)")] = "text",
+    detail: Annotated[
+        str, typer.Option("--detail", "-d", help="Detail level (simple, detailed, debug)")
+    ] = "simple",
+) -> None:
+    """
+    Classify many emails from a JSONL file in one batch.
+
+    Each line is a JSON object with "email_text" and optional "subject"
+    and "sender". Results are printed in file order.
+
+    Examples:
+        # emails.jsonl: {"email_text": "WINNER! Click here!", "sender": "a@b.tk"}
+        email-classifier predict-batch --file emails.jsonl
+
+        # JSON output
+        email-classifier predict-batch --file emails.jsonl --format json
+    """
+    container: Container = ctx.obj
+    console = get_console()
+
+    if format not in ("text", "json"):
+        console.print(f"[red]Error:[/red] Invalid format '{format}'")
+        console.print("Valid formats: text, json")
+        raise typer.Exit(1) from None
+
+    valid_details: list[DetailLevel] = ["simple", "detailed", "debug"]
+    if detail not in valid_details:
+        console.print(f"[red]Error:[/red] Invalid detail level '{detail}'")
+        console.print(f"Valid levels: {', '.join(valid_details)}")
+        raise typer.Exit(1) from None
+
+    emails = _read_email_batch(file)
+
+    if not emails:
+        console.print(f"[yellow]No emails found in '{file}'[/yellow]")
+        return
+
+    try:
+        container.warmup()
+        use_case = container.get_classify_use_case(format_type=format)  # type: ignore
+
+        # One batched call per model for the whole file
+        for output in use_case.execute_batch(emails, detail_level=detail):  # type: ignore
+            _print_output(output)
+
+    except FileNotFoundError as e:
+        console.print(f"[red]Error:[/red] Model not found: {e}")
+        console.print("\nMake sure you have trained models in the models directory.")
+        raise typer.Exit(1) from None
+    except Exception as e:
+        console.print(f"[red]Unexpected error:[/red] {e}")
+        if container._settings.verbose:
+            console.print_exception()
+        raise typer.Exit(1) from None
+
+
 @models_app.command("list")
 def models_list(
     ctx: typer.Context,
@@ -118,6 +187,7 @@ def models_list(
         email-classifier models list phishing_detector
     """
     container: Container = ctx.obj
+    console = get_console()
 
     # Validate model name
     if model not in ("spam_detector", "phishing_detector"):
@@ -134,6 +204,8 @@ def models_list(
             return
 
         # Create table
+        from rich.table import Table
+
         table = Table(title=f"Available Models: {model}")
         table.add_column("#", style="cyan", justify="right")
         table.add_column("Timestamp", style="green")
@@ -173,6 +245,7 @@ def models_info(
         email-classifier models info spam_detector
     """
     container: Container = ctx.obj
+    console = get_console()
 
     if model not in ("spam_detector", "phishing_detector"):
         console.print(f"[red]Error:[/red] Invalid model name '{model}'")
@@ -203,9 +276,30 @@ def models_info(
 # === Helper functions ===
 
 
+@cache
+def get_console() -> "Console":
+    """Get the shared rich console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _print_output(output: str) -> None:
+    """
+    Print formatter output verbatim.
+
+    The formatters have already rendered their output (including any ANSI
+    styling). A second Rich pass would highlight the escape codes themselves
+    on a terminal, and re-wrap lines at 80 columns when piped, splitting
+    long JSON strings across lines (breaking ``| jq``).
+    """
+    typer.echo(output)
+
+
 def _get_email_text(text_arg: str | None, file_path: Path | None) -> str:
     """Get email text from various sources."""
     # Priority: file > argument > stdin
+    console = get_console()
 
     if file_path:
         if not file_path.exists():
@@ -226,3 +320,36 @@ def _get_email_text(text_arg: str | None, file_path: Path | None) -> str:
         return sys.stdin.read()
 
     return ""
+
+
+def _read_email_batch(file_path: Path) -> list[Email]:
+    """Read emails from a JSONL file, one object per non-blank line."""
+    console = get_console()
+
+    if not file_path.exists():
+        console.print(f"[red]Error:[/red] File not found: {file_path}")
+        raise typer.Exit(1) from None
+
+    emails: list[Email] = []
+    try:
+        with file_path.open(encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                    emails.append(
+                        Email(
+                            text=item["email_text"],
+                            subject=item.get("subject"),
+                            sender=item.get("sender"),
+                        )
+                    )
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    console.print(f"[red]Error:[/red] Invalid email on line {line_number}: {e}")
+                    raise typer.Exit(1) from None
+    except OSError as e:
+        console.print(f"[red]Error reading file:[/red] {e}")
+        raise typer.Exit(1) from None
+
+    return emails
@@ -4,10 +4,8 @@ import sys
 from pathlib import Path
 
 import typer
-from rich.console import Console
 
-from ...config import Settings
-from .commands import models_app, predict_command
+from .commands import get_console, models_app, predict_batch_command, predict_command
 
 # Create main app
 app = typer.Typer(
@@ -19,11 +17,9 @@ app = typer.Typer(
 
 # Add subcommands
 app.command(name="predict")(predict_command)
+app.command(name="predict-batch")(predict_batch_command)
 app.add_typer(models_app, name="models")
 
-# Global console for rich output
-console = Console()
-
 
 @app.callback()
 def main_callback(
@@ -44,12 +40,14 @@ def main_callback(
     - SPAM detection (unwanted commercial emails)
     - PHISHING detection (fraudulent/malicious emails)
     """
+    # Imported here so --help never pays for pydantic-settings or the models
+    from ...application import Container
+    from ...config import Settings
+
     # Store settings in context
     settings = Settings(models_dir=models_dir, verbose=verbose)
 
-    # Re-initialize container with custom settings
-    from ...application import Container
-
+    # Initialize container with custom settings
     ctx.obj = Container(settings)
 
 
@@ -58,9 +56,11 @@ def cli_main() -> None:
     try:
         app()
     except KeyboardInterrupt:
+        console = get_console()
         console.print("\n[yellow]Interrupted by user[/yellow]")
         sys.exit(130)
     except Exception as e:
+        console = get_console()
         console.print(f"[bold red]Error:[/bold red] {e}")
         if "--verbose" in sys.argv or "-v" in sys.argv:
             console.print_exception()
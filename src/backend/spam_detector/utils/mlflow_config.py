@@ -2,9 +2,8 @@
 
 import mlflow
 
-# Set tracking URI (local)
+# Tracking URI (local), applied by setup_mlflow() rather than at import time
 MLFLOW_TRACKING_URI = "file:./mlruns"
-mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
 
 # Set default experiment
 DEFAULT_EXPERIMENT = "spam-phishing-detection"
@@ -14,8 +13,9 @@ def setup_mlflow():
     """Initialize MLflow configuration."""
     mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
 
-    # Create experiment if doesn't exist
-    try:
+    # Create experiment only if it doesn't exist yet
+    experiment = mlflow.get_experiment_by_name(DEFAULT_EXPERIMENT)
+    if experiment is None:
         experiment_id = mlflow.create_experiment(
             DEFAULT_EXPERIMENT,
             tags={
@@ -25,8 +25,7 @@ def setup_mlflow():
             },
         )
         print(f"✅ Created experiment: {DEFAULT_EXPERIMENT} (ID: {experiment_id})")
-    except Exception:
-        experiment = mlflow.get_experiment_by_name(DEFAULT_EXPERIMENT)
+    else:
         print(
             f"✅ Using existing experiment: {DEFAULT_EXPERIMENT} (ID: {experiment.experiment_id})"
         )
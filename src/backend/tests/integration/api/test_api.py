@@ -1,23 +1,30 @@
 """Integration tests for FastAPI endpoints."""
 
 from collections.abc import Generator
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
 from spam_detector.application import Container
-from spam_detector.config import settings
-from spam_detector.infrastructure.api.main import app
+from spam_detector.config import Settings
+from spam_detector.domain.entities import ClassificationResult, Email, SinglePrediction
+from spam_detector.domain.entities.threat_report import IOC, ThreatReport, ThreatVector, TriggerWord
+from spam_detector.infrastructure.api import dependencies
+from spam_detector.infrastructure.api.main import _warm_up, app
+from spam_detector.infrastructure.api.routers import classify
+from spam_detector.infrastructure.api.routers.classify import _to_email
+from spam_detector.infrastructure.api.schemas import ClassificationResponse, ClassifyEmailRequest
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client() -> Generator[TestClient, None, None]:
-    """Create FastAPI test client with initialized container."""
-    # Initialize container and attach to app state
-    container = Container(settings)
-    app.state.container = container
+    """
+    FastAPI test client shared by the module.
 
-    # Create test client with app
+    Entering the client runs the app lifespan (container, model warm-up,
+    batcher) once; tests must not replace the registered container.
+    """
     with TestClient(app) as test_client:
         yield test_client
 
@@ -31,8 +38,8 @@ class TestHealthEndpoints:
 
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
-        assert "Email Classifier" in response.text
-        assert "Launch App" in response.text
+        assert b"Email Classifier" in response.content
+        assert b"Launch App" in response.content
 
     def test_health_endpoint(self, client: TestClient) -> None:
         """Test health check endpoint."""
@@ -41,6 +48,17 @@ class TestHealthEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
+        assert data["warmup_ms"] > 0  # Models warmed up at startup
+
+    def test_failed_warm_up_is_logged(self, tmp_path: Path, caplog) -> None:
+        """Warm-up failures should be logged with their traceback, not printed."""
+        container = Container(Settings(models_dir=tmp_path))
+
+        with caplog.at_level("WARNING"):
+            assert _warm_up(container) is None
+
+        assert "Model warm-up failed" in caplog.text
+        assert caplog.records[-1].exc_info is not None
 
 
 class TestClassifyEndpoint:
@@ -59,28 +77,15 @@ class TestClassifyEndpoint:
         assert response.status_code == 200
         data = response.json()
 
-        # Check structure
-        assert "verdict" in data
-        assert "risk_level" in data
-        assert "is_malicious" in data
-        assert "spam_label" in data
-        assert "spam_probability" in data
-        assert "spam_model_version" in data
-        assert "phishing_label" in data
-        assert "phishing_probability" in data
-        assert "phishing_model_version" in data
-        assert "execution_time_ms" in data
-
-        # Check types
-        assert isinstance(data["is_malicious"], bool)
-        assert isinstance(data["spam_probability"], float)
-        assert isinstance(data["phishing_probability"], float)
-        assert isinstance(data["execution_time_ms"], float)
-
-        # Check ranges
-        assert 0.0 <= data["spam_probability"] <= 1.0
-        assert 0.0 <= data["phishing_probability"] <= 1.0
-        assert data["execution_time_ms"] >= 0.0
+        # The endpoint's own schema checks every field's presence, type and range
+        # (probabilities in 0-1, the nested threat report) in one strict pass
+        parsed = ClassificationResponse.model_validate(data, strict=True)
+        assert parsed.model_dump(mode="json") == data  # No fields beyond the schema
+        assert parsed.execution_time_ms >= 0.0
+
+        # Strict mode still accepts ints for floats; the wire values must be floats
+        float_fields = ("spam_probability", "phishing_probability", "execution_time_ms")
+        assert all(isinstance(data[field], float) for field in float_fields)
 
     def test_classify_ham(self, client: TestClient) -> None:
         """Test classification of legitimate email."""
@@ -117,6 +122,33 @@ class TestClassifyEndpoint:
 
         assert response.status_code == 422  # Validation error
 
+    def test_classify_before_startup_is_unavailable(self, monkeypatch) -> None:
+        """Without the lifespan having run, no container is registered."""
+        monkeypatch.setattr(dependencies, "_container", None)
+
+        response = TestClient(app).post("/api/v1/classify", json={"email_text": "Hello"})
+
+        assert response.status_code == 503
+        assert response.json()["detail"] == "DI container not initialized"
+
+    def test_classify_unexpected_error_is_generic(self, client: TestClient, monkeypatch) -> None:
+        """Unexpected failures should return a bare 500 without internal details."""
+
+        def failing_build_response(container, result):
+            raise RuntimeError("secret internal path")
+
+        monkeypatch.setattr(classify, "_build_response", failing_build_response)
+        # The batcher belongs to the shared client's event loop; classify directly
+        monkeypatch.setattr(app.state, "batcher", None)
+
+        # Second client on the already started app, reporting errors as responses
+        response = TestClient(app, raise_server_exceptions=False).post(
+            "/api/v1/classify", json={"email_text": "Hello"}
+        )
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Internal server error"}
+
     def test_classify_missing_email_text_fails(self, client: TestClient) -> None:
         """Test that missing email_text returns validation error."""
         payload = {"subject": "Test"}
@@ -126,66 +158,139 @@ class TestClassifyEndpoint:
         assert response.status_code == 422  # Validation error
 
 
+class TestEmailTextAssembly:
+    """Test how request fields become the classified email text."""
+
+    def test_headers_are_prepended_sender_first(self) -> None:
+        """Sender and subject lines should precede the body, in that order."""
+        request = ClassifyEmailRequest(email_text="Body", subject="Hi", sender="a@b.c")
+
+        assert _to_email(request).text == "From: a@b.c\nSubject: Hi\nBody"
+
+    def test_body_only_is_unchanged(self) -> None:
+        """Without headers the body should be used as-is."""
+        request = ClassifyEmailRequest(email_text="Body", subject="Hi")
+
+        assert _to_email(ClassifyEmailRequest(email_text="Body")).text == "Body"
+        assert _to_email(request).text == "Subject: Hi\nBody"
+
+
+class TestResponseConversion:
+    """Test building API responses from domain entities."""
+
+    def test_from_domain_matches_validated_model(self) -> None:
+        """Unvalidated construction should serialize exactly like full validation."""
+        result = ClassificationResult(
+            email=Email(text="URGENT: verify your account"),
+            spam_prediction=SinglePrediction("SPAM", 0.91, "spam_detector", "20260105_194125"),
+            phishing_prediction=SinglePrediction(
+                "PHISHING", 0.87, "phishing_detector", "20260105_195830"
+            ),
+            execution_time_ms=12.5,
+        )
+        report = ThreatReport(
+            risk_score=88,
+            iocs=[IOC("keyword_urgency", "high", "urgent (1x)", "Urgency tactics", 1)],
+            threat_vectors=[ThreatVector("Phishing Attack", "Deceptive email", 0.87)],
+            recommendations=["Quarantine this email"],
+            spam_trigger_words=[TriggerWord("urgent", 0.42, "spam")],
+        )
+
+        response = ClassificationResponse.from_domain(result, report)
+        dumped = response.model_dump()
+
+        assert ClassificationResponse.model_validate(dumped).model_dump() == dumped
+        assert response.model_dump_json() == ClassificationResponse(**dumped).model_dump_json()
+        assert response.threat_report.recommendations is not report.recommendations
+
+
+class TestClassifyBatchEndpoint:
+    """Test batch classification endpoint."""
+
+    def test_classify_batch(self, client: TestClient) -> None:
+        """Should return one result per email, matching the single endpoint's verdict."""
+        emails = [
+            {"email_text": "WINNER! You have won $1000! Click here NOW to claim!"},
+            {
+                "email_text": "Hello John, hope you're doing well. Let's catch up next week.",
+                "subject": "Catching up",
+                "sender": "friend@example.com",
+            },
+        ]
+
+        response = client.post("/api/v1/classify/batch", json={"emails": emails})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        for item, result in zip(emails, data["results"], strict=True):
+            single = client.post("/api/v1/classify", json=item).json()
+            assert result["verdict"] == single["verdict"]
+            assert result["threat_report"]["risk_score"] == single["threat_report"]["risk_score"]
+            assert result["threat_report"]["spam_trigger_words"] == []
+
+    def test_classify_batch_empty_fails(self, client: TestClient) -> None:
+        """Empty batch should be rejected by validation."""
+        response = client.post("/api/v1/classify/batch", json={"emails": []})
+
+        assert response.status_code == 422
+
+    def test_classify_batch_empty_text_fails(self, client: TestClient) -> None:
+        """Any invalid email should fail the whole batch."""
+        payload = {"emails": [{"email_text": "Valid"}, {"email_text": ""}]}
+
+        response = client.post("/api/v1/classify/batch", json=payload)
+
+        assert response.status_code == 422
+
+
 class TestModelsEndpoints:
     """Test model management endpoints."""
 
-    def test_list_spam_models(self, client: TestClient) -> None:
-        """Test listing spam detector models."""
-        response = client.get("/api/v1/models/spam_detector")
+    @pytest.mark.parametrize("model_name", ["spam_detector", "phishing_detector"])
+    def test_list_models(self, client: TestClient, model_name: str) -> None:
+        """Test listing each detector's model versions."""
+        response = client.get(f"/api/v1/models/{model_name}")
 
         assert response.status_code == 200
         data = response.json()
 
-        assert "model_name" in data
-        assert data["model_name"] == "spam_detector"
-        assert "total_versions" in data
-        assert "models" in data
+        assert data["model_name"] == model_name
         assert isinstance(data["models"], list)
         assert data["total_versions"] == len(data["models"])
 
         # Check model metadata structure if models exist
         if data["models"]:
-            model = data["models"][0]
-            assert "name" in model
-            assert "timestamp" in model
-            assert "accuracy" in model
-            assert "accuracy_percent" in model
-            assert "train_samples" in model
-            assert "vocabulary_size" in model
-            assert "file_size_mb" in model
-
-    def test_list_phishing_models(self, client: TestClient) -> None:
-        """Test listing phishing detector models."""
-        response = client.get("/api/v1/models/phishing_detector")
+            assert set(data["models"][0]) == {
+                "name",
+                "timestamp",
+                "accuracy",
+                "accuracy_percent",
+                "train_samples",
+                "vocabulary_size",
+                "file_size_mb",
+            }
+
+    @pytest.mark.parametrize("model_name", ["spam_detector", "phishing_detector"])
+    def test_get_latest_model(self, client: TestClient, model_name: str) -> None:
+        """Test getting each detector's latest model."""
+        response = client.get(f"/api/v1/models/{model_name}/latest")
 
         assert response.status_code == 200
         data = response.json()
 
-        assert data["model_name"] == "phishing_detector"
-        assert "total_versions" in data
-        assert "models" in data
-
-    def test_get_latest_spam_model(self, client: TestClient) -> None:
-        """Test getting latest spam detector model."""
-        response = client.get("/api/v1/models/spam_detector/latest")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert "name" in data
-        assert data["name"] == "spam_detector"
+        assert data["name"] == model_name
         assert "timestamp" in data
-        assert "accuracy" in data
         assert 0.0 <= data["accuracy"] <= 1.0
 
-    def test_get_latest_phishing_model(self, client: TestClient) -> None:
-        """Test getting latest phishing detector model."""
-        response = client.get("/api/v1/models/phishing_detector/latest")
-
-        assert response.status_code == 200
-        data = response.json()
+    def test_repeated_latest_model_is_identical(self, client: TestClient) -> None:
+        """Memoized model info should serialize identically on repeat calls."""
+        first = client.get("/api/v1/models/spam_detector/latest")
+        second = client.get("/api/v1/models/spam_detector/latest")
 
-        assert data["name"] == "phishing_detector"
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert first.json()["accuracy_percent"] == first.json()["accuracy"] * 100
 
     def test_invalid_model_name_fails(self, client: TestClient) -> None:
         """Test that invalid model name returns error."""
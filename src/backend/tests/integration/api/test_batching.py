@@ -0,0 +1,167 @@
+"""Integration tests for the classification request batcher."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from spam_detector.domain.entities import ClassificationResult, Email, SinglePrediction
+from spam_detector.infrastructure.api.batching import ClassificationBatcher
+
+
+def _result(text: str) -> ClassificationResult:
+    return ClassificationResult(
+        email=Email(text=text),
+        spam_prediction=SinglePrediction("HAM", 0.9, "spam_detector", "20260105_194125"),
+        phishing_prediction=SinglePrediction("LEGIT", 0.9, "phishing_detector", "20260105_195830"),
+        execution_time_ms=1.0,
+    )
+
+
+@pytest.fixture
+def use_case():
+    """Use case double that classifies batches and single emails."""
+    use_case = Mock()
+    use_case.execute_raw_email_batch.side_effect = lambda emails: [_result(e.text) for e in emails]
+    use_case.execute_raw_email.side_effect = lambda email: _result(email.text)
+    return use_case
+
+
+@pytest.fixture
+def container(use_case):
+    """Container double returning the use case."""
+    container = Mock()
+    container.get_classify_use_case.return_value = use_case
+    return container
+
+
+class TestClassificationBatcher:
+    """Test request coalescing."""
+
+    def test_concurrent_requests_share_one_batch(self, container, use_case):
+        """Concurrent submissions should be classified with a single batch call."""
+
+        async def scenario() -> list[ClassificationResult]:
+            batcher = ClassificationBatcher(container, max_batch_size=8, max_wait_ms=5.0)
+            await batcher.start()
+            try:
+                return await asyncio.gather(
+                    *(batcher.submit(Email(text=f"Email {i}")) for i in range(5))
+                )
+            finally:
+                await batcher.stop()
+
+        results = asyncio.run(scenario())
+
+        assert [r.email.text for r in results] == [f"Email {i}" for i in range(5)]
+        use_case.execute_raw_email_batch.assert_called_once()
+
+    def test_batch_respects_max_size(self, container, use_case):
+        """Should split submissions into batches of at most max_batch_size."""
+
+        async def scenario() -> None:
+            batcher = ClassificationBatcher(container, max_batch_size=2, max_wait_ms=5.0)
+            await batcher.start()
+            try:
+                await asyncio.gather(*(batcher.submit(Email(text=f"Email {i}")) for i in range(5)))
+            finally:
+                await batcher.stop()
+
+        asyncio.run(scenario())
+
+        sizes = [len(call.args[0]) for call in use_case.execute_raw_email_batch.call_args_list]
+        assert sizes == [2, 2, 1]
+
+    def test_failing_email_fails_only_its_request(self, container, use_case):
+        """A failing email should not fail the other requests in its batch."""
+        use_case.execute_raw_email_batch.side_effect = ValueError("bad batch")
+
+        def execute_raw_email(email):
+            if email.text == "bad":
+                raise ValueError("Failed to vectorize or predict email")
+            return _result(email.text)
+
+        use_case.execute_raw_email.side_effect = execute_raw_email
+
+        async def scenario() -> list:
+            batcher = ClassificationBatcher(container, max_batch_size=8, max_wait_ms=5.0)
+            await batcher.start()
+            try:
+                return await asyncio.gather(
+                    batcher.submit(Email(text="good")),
+                    batcher.submit(Email(text="bad")),
+                    return_exceptions=True,
+                )
+            finally:
+                await batcher.stop()
+
+        good, bad = asyncio.run(scenario())
+
+        assert good.email.text == "good"
+        assert isinstance(bad, ValueError)
+
+    def test_submit_before_start_raises_error(self, container):
+        """Should refuse submissions when not running."""
+        batcher = ClassificationBatcher(container)
+
+        with pytest.raises(RuntimeError, match="not running"):
+            asyncio.run(batcher.submit(Email(text="Test")))
+
+    def test_unavailable_use_case_fails_requests_and_keeps_running(self, container):
+        """Missing models should fail each request, not the batching task."""
+        container.get_classify_use_case.side_effect = FileNotFoundError("No models found")
+
+        async def scenario() -> list:
+            batcher = ClassificationBatcher(container, max_batch_size=8, max_wait_ms=1.0)
+            await batcher.start()
+            try:
+                first = await asyncio.gather(
+                    batcher.submit(Email(text="Test")), return_exceptions=True
+                )
+                second = await asyncio.wait_for(
+                    asyncio.gather(batcher.submit(Email(text="Test")), return_exceptions=True),
+                    timeout=5,
+                )
+                return first + second
+            finally:
+                await batcher.stop()
+
+        results = asyncio.run(scenario())
+
+        assert all(isinstance(result, FileNotFoundError) for result in results)
+
+    def test_stop_fails_pending_requests(self, container, use_case):
+        """Stopping should fail in-flight and queued requests instead of leaving them pending."""
+
+        async def scenario() -> list:
+            batcher = ClassificationBatcher(container, max_batch_size=8, max_wait_ms=10_000)
+            await batcher.start()
+            pending = [
+                asyncio.ensure_future(batcher.submit(Email(text=f"Email {i}"))) for i in range(3)
+            ]
+            await asyncio.sleep(0.01)  # First request is now waiting for stragglers
+            await batcher.stop()
+            return await asyncio.wait_for(
+                asyncio.gather(*pending, return_exceptions=True), timeout=5
+            )
+
+        results = asyncio.run(scenario())
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        use_case.execute_raw_email_batch.assert_not_called()
+
+    def test_submit_after_task_died_raises_error(self, container):
+        """Should refuse submissions once the background task has finished."""
+
+        async def scenario() -> None:
+            batcher = ClassificationBatcher(container)
+            await batcher.start()
+            batcher._task.cancel()
+            await asyncio.sleep(0)
+            try:
+                await batcher.submit(Email(text="Test"))
+            finally:
+                await batcher.stop()
+
+        with pytest.raises(RuntimeError, match="not running"):
+            asyncio.run(scenario())
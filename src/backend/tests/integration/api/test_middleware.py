@@ -0,0 +1,99 @@
+"""Integration tests for API middleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from spam_detector.infrastructure.api.main import _uses_static_cors
+from spam_detector.infrastructure.api.middleware import StaticCORSMiddleware
+
+ORIGIN = "https://app.example.com"
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Client for a minimal app wrapped in StaticCORSMiddleware."""
+    app = FastAPI()
+    app.add_middleware(StaticCORSMiddleware, allow_origins=[ORIGIN])
+
+    @app.get("/ping")
+    def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+class TestStaticCORSMiddleware:
+    """Test precomputed CORS headers."""
+
+    def test_allowed_origin_gets_cors_headers(self, client):
+        """Should echo the allowed origin and allow credentials."""
+        response = client.get("/ping", headers={"Origin": ORIGIN})
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.json() == {"status": "ok"}
+
+    def test_disallowed_origin_gets_no_cors_headers(self, client):
+        """Should pass the request through without CORS headers."""
+        response = client.get("/ping", headers={"Origin": "https://evil.example.com"})
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_same_origin_request_is_untouched(self, client):
+        """Requests without Origin should not get CORS headers."""
+        response = client.get("/ping")
+
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_preflight_allowed(self, client):
+        """Should answer preflight directly, echoing requested headers."""
+        response = client.options(
+            "/ping",
+            headers={
+                "Origin": ORIGIN,
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "content-type",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert response.headers["access-control-allow-headers"] == "content-type"
+
+    def test_preflight_disallowed_origin(self, client):
+        """Should reject preflight from unknown origins."""
+        response = client.options(
+            "/ping",
+            headers={
+                "Origin": "https://evil.example.com",
+                "Access-Control-Request-Method": "POST",
+            },
+        )
+
+        assert response.status_code == 400
+        assert "access-control-allow-origin" not in response.headers
+
+
+class TestStaticCORSSelection:
+    """Test when the static middleware replaces CORSMiddleware."""
+
+    @pytest.mark.parametrize(
+        ("origins", "expected"),
+        [
+            ([ORIGIN], True),
+            (["https://a.com", "https://b.com", "https://c.com", "https://d.com"], True),
+            (
+                ["https://a.com", "https://b.com", "https://c.com", "https://d.com", "https://e"],
+                False,
+            ),
+            (["*"], False),
+            ([], False),
+        ],
+    )
+    def test_uses_static_cors(self, origins, expected):
+        """Only short lists of exact origins should use the static middleware."""
+        assert _uses_static_cors(origins) is expected
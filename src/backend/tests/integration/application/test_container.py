@@ -1,14 +1,19 @@
 """Integration tests for DI Container."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
-from spam_detector.application import Container
+from spam_detector.application import Container, get_container
 from spam_detector.application.use_cases import (
     ClassifyEmailUseCase,
     ListModelsUseCase,
 )
+from spam_detector.config import Settings, get_settings, settings
+from spam_detector.infrastructure.adapters import JsonFormatter, TextFormatter
 
 
 class TestContainer:
@@ -52,3 +57,158 @@ class TestContainer:
         # Test ListModelsUseCase
         list_models_use_case = container.list_models_use_case()
         assert isinstance(list_models_use_case, ListModelsUseCase)
+
+
+class TestContainerFormatters:
+    """Test formatter caching in the container."""
+
+    def test_get_formatter_reuses_instance_per_format(self, tmp_path: Path):
+        """Should return the same formatter for the same format type."""
+        container = Container(Settings(models_dir=tmp_path))
+
+        assert container.get_formatter("json") is container.get_formatter("json")
+        assert container.get_formatter("text") is container.get_formatter("text")
+        assert isinstance(container.get_formatter("json"), JsonFormatter)
+        assert isinstance(container.get_formatter("text"), TextFormatter)
+
+    def test_clear_cache_drops_formatters(self, tmp_path: Path):
+        """Should create fresh formatters after clear_cache."""
+        container = Container(Settings(models_dir=tmp_path))
+        formatter = container.get_formatter("json")
+
+        container.clear_cache()
+
+        assert container.get_formatter("json") is not formatter
+
+    def test_unknown_format_raises(self, tmp_path: Path):
+        """Should reject formats missing from the formatter registry."""
+        container = Container(Settings(models_dir=tmp_path))
+
+        with pytest.raises(ValueError, match="Valid formats: text, json"):
+            container.get_formatter("yaml")  # type: ignore[arg-type]
+
+
+class TestContainerUseCases:
+    """Test use case caching in the container."""
+
+    def test_get_classify_use_case_reuses_instance_per_format(self):
+        """Should build one classify use case per format type."""
+        container = Container(Settings(models_dir=Path("models")))
+
+        json_use_case = container.get_classify_use_case("json")
+
+        assert container.get_classify_use_case("json") is json_use_case
+        assert container.get_classify_use_case("text") is not json_use_case
+
+    def test_get_list_models_use_case_is_singleton(self, tmp_path: Path):
+        """Should return the same list models use case."""
+        container = Container(Settings(models_dir=tmp_path))
+
+        assert container.get_list_models_use_case() is container.get_list_models_use_case()
+
+    def test_clear_cache_drops_use_cases(self, tmp_path: Path):
+        """Should rebuild use cases after clear_cache."""
+        container = Container(Settings(models_dir=tmp_path))
+        use_case = container.get_list_models_use_case()
+
+        container.clear_cache()
+
+        assert container.get_list_models_use_case() is not use_case
+
+
+class TestGetContainer:
+    """Test the shared container factory."""
+
+    def test_get_container_is_memoized(self):
+        """Should build the shared container once, on first call."""
+        assert isinstance(get_container(), Container)
+        assert get_container() is get_container()
+
+    def test_default_container_uses_shared_frozen_settings(self):
+        """Should reuse the process-wide settings, which cannot be mutated."""
+        container = Container()
+
+        assert container._settings is get_settings() is settings
+        with pytest.raises(ValidationError):
+            container._settings.verbose = True
+
+
+class TestContainerWarmup:
+    """Test eager model loading."""
+
+    def test_warmup_loads_predictors_and_service(self):
+        """Should fill every model-backed singleton."""
+        container = Container(Settings(models_dir=Path("models")))
+
+        container.warmup()
+
+        assert set(container._predictors) == {"spam_detector", "phishing_detector"}
+        assert container._classifier_service is container.get_classifier_service()
+
+    def test_warmup_with_missing_models_raises(self, tmp_path: Path):
+        """Should surface missing models instead of hiding them."""
+        container = Container(Settings(models_dir=tmp_path))
+
+        with pytest.raises(FileNotFoundError):
+            container.warmup()
+
+
+class TestContainerPhishingGate:
+    """Test wiring of the phishing skip threshold."""
+
+    def test_skip_threshold_reaches_classifier_service(self):
+        """A configured threshold should let confident HAM skip the phishing model."""
+        container = Container(Settings(models_dir=Path("models"), phishing_skip_threshold=0.0))
+        use_case = container.get_classify_use_case("json")
+
+        result = use_case.execute_raw(
+            "Hello John, hope you're doing well. Let's catch up next week."
+        )
+
+        assert result.spam_prediction.label == "HAM"
+        assert result.phishing_prediction.label == "LEGIT"
+        assert container.get_classifier_service().phishing_skipped == 1
+
+
+class TestContainerPredictors:
+    """Test predictor creation."""
+
+    def test_missing_phishing_model_falls_back_to_spam(self, tmp_path: Path, caplog):
+        """Should reuse the spam predictor when phishing model files are missing."""
+        for source in Path("models").glob("spam_detector_*"):
+            (tmp_path / source.name).symlink_to(source.resolve())
+        container = Container(Settings(models_dir=tmp_path))
+
+        assert container.get_phishing_predictor() is container.get_spam_predictor()
+        assert "phishing_detector not found, using spam_detector" in caplog.text
+
+    def test_missing_spam_model_raises(self, tmp_path: Path):
+        """Spam model has no fallback."""
+        container = Container(Settings(models_dir=tmp_path))
+
+        with pytest.raises(FileNotFoundError):
+            container.get_spam_predictor()
+
+
+class TestContainerConcurrency:
+    """Test singleton creation under concurrent first use."""
+
+    def test_concurrent_first_use_loads_models_once(self, monkeypatch):
+        """Should deserialize each model once when threads race on a cold container."""
+        container = Container(Settings(models_dir=Path("models")))
+        loader = container.get_model_loader()
+        original_load = loader.load
+        loaded: list[str] = []
+
+        def slow_load(model_name):
+            loaded.append(model_name)
+            time.sleep(0.01)  # Widen the race window
+            return original_load(model_name)
+
+        monkeypatch.setattr(loader, "load", slow_load)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            services = list(pool.map(lambda _: container.get_classifier_service(), range(8)))
+
+        assert all(service is services[0] for service in services)
+        assert sorted(loaded) == ["phishing_detector", "spam_detector"]
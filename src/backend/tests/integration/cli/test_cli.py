@@ -48,6 +48,17 @@ class TestCLIPredict:
         assert "verdict" in data
         assert "confidence" in data
 
+    def test_predict_piped_json_is_not_wrapped(self):
+        """Piped output should be written verbatim, so long values stay on one line."""
+        email_text = "Congratulations you have been selected to receive a free cruise " * 3
+        result = runner.invoke(
+            app, ["predict", email_text, "--format", "json", "--detail", "detailed"]
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data["email_preview"].startswith("Congratulations you have been selected")
+
     def test_predict_detailed_output(self):
         """Should produce detailed output."""
         result = runner.invoke(app, ["predict", "Test", "--detail", "detailed"])
@@ -97,6 +108,52 @@ class TestCLIPredict:
         assert "Invalid detail level" in result.stdout
 
 
+@pytest.mark.integration
+class TestCLIPredictBatch:
+    """Test predict-batch command."""
+
+    def test_predict_batch_json_output(self, tmp_path: Path):
+        """Should print one JSON result per line of input, in order."""
+        emails_file = tmp_path / "emails.jsonl"
+        emails_file.write_text(
+            json.dumps({"email_text": "WINNER! You have won $1000!"})
+            + "\n\n"
+            + json.dumps({"email_text": "Hi John, lunch at noon?", "sender": "a@b.com"})
+            + "\n"
+        )
+
+        result = runner.invoke(
+            app, ["predict-batch", "--file", str(emails_file), "--format", "json"]
+        )
+
+        assert result.exit_code == 0
+        decoder = json.JSONDecoder()
+        outputs, text = [], result.stdout.strip()
+        while text:
+            data, end = decoder.raw_decode(text)
+            outputs.append(data)
+            text = text[end:].strip()
+        assert len(outputs) == 2
+        assert all("verdict" in data for data in outputs)
+
+    def test_predict_batch_invalid_line_fails(self, tmp_path: Path):
+        """Should report the offending line number."""
+        emails_file = tmp_path / "emails.jsonl"
+        emails_file.write_text('{"email_text": "ok"}\n{"subject": "no body"}\n')
+
+        result = runner.invoke(app, ["predict-batch", "--file", str(emails_file)])
+
+        assert result.exit_code == 1
+        assert "line 2" in result.stdout
+
+    def test_predict_batch_missing_file_fails(self, tmp_path: Path):
+        """Should fail when the file does not exist."""
+        result = runner.invoke(app, ["predict-batch", "--file", str(tmp_path / "none.jsonl")])
+
+        assert result.exit_code == 1
+        assert "File not found" in result.stdout
+
+
 @pytest.mark.integration
 class TestCLIModels:
     """Test models commands."""
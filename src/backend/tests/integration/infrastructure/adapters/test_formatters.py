@@ -13,10 +13,11 @@ from spam_detector.domain.ports import DetailLevel
 from spam_detector.infrastructure.adapters import (
     JsonFormatter,
     TextFormatter,
+    json_formatter,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_result() -> ClassificationResult:
     """Sample classification result for testing."""
     email = Email(
@@ -47,28 +48,31 @@ def sample_result() -> ClassificationResult:
     )
 
 
+@pytest.fixture(scope="module")
+def parsed_json_outputs(sample_result) -> dict[str, dict]:
+    """JSON output for every detail level, formatted and parsed once per module."""
+    formatter = JsonFormatter()
+    levels: list[DetailLevel] = ["simple", "detailed", "debug"]
+    return {
+        level: json.loads(formatter.format(sample_result, detail_level=level)) for level in levels
+    }
+
+
 class TestJsonFormatter:
     """Test JSON formatter."""
 
-    def test_format_simple(self, sample_result):
+    def test_format_simple(self, parsed_json_outputs):
         """Should format simple JSON output."""
-        formatter = JsonFormatter()
-        output = formatter.format(sample_result, detail_level="simple")
-
-        # Parse JSON to validate
-        data = json.loads(output)
+        data = parsed_json_outputs["simple"]
 
         assert data["verdict"] == "SPAM+PHISHING"
         assert "confidence" in data
         assert data["is_malicious"] is True
         assert data["risk_level"] == "CRITICAL"
 
-    def test_format_detailed(self, sample_result):
+    def test_format_detailed(self, parsed_json_outputs):
         """Should format detailed JSON output."""
-        formatter = JsonFormatter()
-        output = formatter.format(sample_result, detail_level="detailed")
-
-        data = json.loads(output)
+        data = parsed_json_outputs["detailed"]
 
         assert data["verdict"] == "SPAM+PHISHING"
         assert "spam" in data
@@ -78,12 +82,9 @@ class TestJsonFormatter:
         assert "email_preview" in data
         assert "execution_time_ms" in data
 
-    def test_format_debug(self, sample_result):
+    def test_format_debug(self, parsed_json_outputs):
         """Should format debug JSON output."""
-        formatter = JsonFormatter()
-        output = formatter.format(sample_result, detail_level="debug")
-
-        data = json.loads(output)
+        data = parsed_json_outputs["debug"]
 
         assert "predictions" in data
         assert "email" in data
@@ -92,15 +93,35 @@ class TestJsonFormatter:
         assert data["email"]["sender"] == "scam@fake.com"
         assert data["email"]["word_count"] > 0
 
-    def test_json_is_valid(self, sample_result):
-        """Should produce valid JSON for all detail levels."""
+    def test_json_is_valid(self, parsed_json_outputs):
+        """Should produce a JSON object for all detail levels."""
+        # Parsing happened in the fixture, which would have raised on invalid JSON
+        assert set(parsed_json_outputs) == {"simple", "detailed", "debug"}
+        assert all(isinstance(data, dict) for data in parsed_json_outputs.values())
+
+    def test_output_matches_stdlib_json(self, sample_result, monkeypatch):
+        """Optional orjson encoder should produce exactly the stdlib's text."""
         formatter = JsonFormatter()
+        fast = formatter.format(sample_result, detail_level="debug")
 
-        levels: list[DetailLevel] = ["simple", "detailed", "debug"]
-        for level in levels:
-            output = formatter.format(sample_result, detail_level=level)
-            # Should not raise
-            json.loads(output)
+        monkeypatch.setattr(json_formatter, "orjson", None)
+
+        assert formatter.format(sample_result, detail_level="debug") == fast
+
+    def test_simple_output_matches_stdlib_json(self, sample_result):
+        """Templated simple output should be byte-identical to json.dumps."""
+        expected = json.dumps(
+            {
+                "verdict": sample_result.final_verdict,
+                "confidence": round(sample_result.max_confidence, 4),
+                "is_malicious": sample_result.is_malicious,
+                "risk_level": sample_result.risk_level,
+            },
+            indent=2,
+            ensure_ascii=False,
+        )
+
+        assert JsonFormatter().format(sample_result, detail_level="simple") == expected
 
 
 class TestTextFormatter:
@@ -116,6 +137,12 @@ class TestTextFormatter:
         # Should contain verdict
         assert "SPAM+PHISHING" in output or "SPAM" in output
 
+    def test_format_simple_exact_line(self, sample_result):
+        """Simple output is one plain line: icon, verdict, confidence."""
+        output = TextFormatter().format(sample_result, detail_level="simple")
+
+        assert output == "🚨 SPAM+PHISHING (92.7% confidence)"
+
     def test_format_detailed(self, sample_result):
         """Should format detailed text output."""
         formatter = TextFormatter()
@@ -124,6 +151,30 @@ class TestTextFormatter:
         assert isinstance(output, str)
         assert len(output) > 100  # Should be substantial
 
+    def test_format_detailed_aligns_labels(self, sample_result):
+        """Values should start in one column, whatever the label's icon."""
+        output = TextFormatter().format(sample_result, detail_level="detailed")
+
+        assert output.splitlines() == [
+            "  Email          WINNER! You have won $1000! Click here NOW!",
+            "  🔴 SPAM        SPAM (85.3%)",
+            "  🔴 PHISHING    PHISHING (92.7%)",
+            "  🚨 VERDICT     SPAM+PHISHING (CRITICAL)",
+        ]
+
+    def test_format_detailed_keeps_email_text_literal(self, sample_result):
+        """Brackets in the email should not be read as Rich markup."""
+        result = ClassificationResult(
+            email=Email(text="Claim [bold]now[/bold]"),
+            spam_prediction=sample_result.spam_prediction,
+            phishing_prediction=sample_result.phishing_prediction,
+            execution_time_ms=sample_result.execution_time_ms,
+        )
+
+        output = TextFormatter().format(result, detail_level="detailed")
+
+        assert "Claim [bold]now[/bold]" in output
+
     def test_format_debug(self, sample_result):
         """Should format debug text output."""
         formatter = TextFormatter()
@@ -132,6 +183,33 @@ class TestTextFormatter:
         assert isinstance(output, str)
         assert len(output) > 200  # Should be very detailed
 
+    def test_format_debug_optional_email_lines(self, sample_result):
+        """Subject and sender lines should appear only when the email has them."""
+        formatter = TextFormatter()
+        bare_result = ClassificationResult(
+            email=Email(text=sample_result.email.text),
+            spam_prediction=sample_result.spam_prediction,
+            phishing_prediction=sample_result.phishing_prediction,
+            execution_time_ms=sample_result.execution_time_ms,
+        )
+
+        full = formatter.format(sample_result, detail_level="debug")
+        bare = formatter.format(bare_result, detail_level="debug")
+
+        assert "Subject: Urgent Prize Notification" in full
+        assert "Sender: scam@fake.com" in full
+        assert "Subject:" not in bare
+        assert "Sender:" not in bare
+        assert "Execution Time: 45.30ms" in bare
+
+    def test_off_terminal_output_has_no_escape_codes(self, sample_result):
+        """Styles come from Rich markup, so non-terminal output stays plain."""
+        formatter = TextFormatter()
+
+        levels: list[DetailLevel] = ["simple", "detailed", "debug"]
+        for level in levels:
+            assert "\x1b[" not in formatter.format(sample_result, detail_level=level)
+
     def test_output_contains_verdict(self, sample_result):
         """Should include verdict in all outputs."""
         formatter = TextFormatter()
@@ -1,20 +1,26 @@
 """Integration tests for JoblibModelLoader."""
 
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import joblib
+import numpy as np
 from spam_detector.domain.entities import ModelMetadata
 from spam_detector.infrastructure.adapters import JoblibModelLoader
 import pytest
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def models_dir() -> Path:
     """Path to actual models directory."""
     return Path("models")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def loader(models_dir: Path) -> JoblibModelLoader:
-    """JoblibModelLoader instance."""
+    """JoblibModelLoader instance shared by the module (tests that clear it use their own)."""
     return JoblibModelLoader(models_dir=models_dir)
 
 
@@ -32,6 +38,14 @@ class TestJoblibModelLoaderInit:
         with pytest.raises(ValueError, match="does not exist"):
             JoblibModelLoader(models_dir=Path("/nonexistent/path"))
 
+    def test_init_with_file_path_raises_error(self, tmp_path):
+        """Should reject a path that exists but is not a directory."""
+        file_path = tmp_path / "models.joblib"
+        file_path.write_bytes(b"")
+
+        with pytest.raises(ValueError, match="does not exist"):
+            JoblibModelLoader(models_dir=file_path)
+
 
 @pytest.mark.integration
 class TestJoblibModelLoaderLoad:
@@ -86,7 +100,7 @@ class TestJoblibModelLoaderLoad:
 
     def test_load_nonexistent_timestamp_raises_error(self, loader):
         """Should raise FileNotFoundError for missing timestamp."""
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match="Component file not found"):
             loader.load("spam_detector", timestamp="99999999_999999")
 
 
@@ -120,17 +134,151 @@ class TestJoblibModelLoaderListAvailable:
         with pytest.raises(ValueError, match="Invalid model_name"):
             loader.list_available("invalid_model")
 
+    def test_list_sorts_by_timestamp_and_skips_latest_symlink(self, tmp_path, monkeypatch):
+        """Should list real versions newest first without probing *_latest files."""
+        for timestamp in ("20260101_000000", "20260105_194125", "20251231_235959"):
+            (tmp_path / f"spam_detector_model_{timestamp}.joblib").write_bytes(b"model")
+            joblib.dump(
+                {
+                    "timestamp": timestamp,
+                    "accuracy": 0.9,
+                    "train_samples": 10,
+                    "vocabulary_size": 10,
+                },
+                tmp_path / f"spam_detector_metadata_{timestamp}.joblib",
+            )
+        (tmp_path / "spam_detector_model_latest.joblib").symlink_to(
+            tmp_path / "spam_detector_model_20260105_194125.joblib"
+        )
+        loader = JoblibModelLoader(models_dir=tmp_path)
+        loaded = []
+        load_component = loader._load_component
+        monkeypatch.setattr(
+            loader,
+            "_load_component",
+            lambda *args: loaded.append(args[2]) or load_component(*args),
+        )
+
+        models = loader.list_available("spam_detector")
+
+        expected = ["20260105_194125", "20260101_000000", "20251231_235959"]
+        assert [m.timestamp for m in models] == expected
+        assert loaded == expected
+
+    def test_listing_is_cached_until_directory_changes(self, models_dir, tmp_path, monkeypatch):
+        """Should rescan only after the models directory is modified."""
+        for source in models_dir.glob("spam_detector_*"):
+            (tmp_path / source.name).symlink_to(source.resolve())
+        loader = JoblibModelLoader(models_dir=tmp_path)
+        scans = []
+        scan_versions = loader._scan_versions
+        monkeypatch.setattr(
+            loader, "_scan_versions", lambda name: scans.append(name) or scan_versions(name)
+        )
+
+        first = loader.list_available("spam_detector")
+        second = loader.list_available("spam_detector")
+        assert scans == ["spam_detector"]
+        assert first == second
+        assert first is not second  # Callers get their own list
+
+        (tmp_path / "notes.txt").write_text("new file")
+        mtime_ns = tmp_path.stat().st_mtime_ns + 1_000_000
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+        loader.list_available("spam_detector")
+        assert scans == ["spam_detector", "spam_detector"]
+        assert list(loader._listing_cache) == ["spam_detector"]  # Stale listing replaced
+
+    def test_listing_and_latest_share_one_directory_scan(self, models_dir, monkeypatch):
+        """Resolving the latest version after listing should not glob again."""
+        loader = JoblibModelLoader(models_dir=models_dir)
+        globs = []
+        glob = Path.glob
+        monkeypatch.setattr(
+            Path, "glob", lambda self, pattern: globs.append(pattern) or glob(self, pattern)
+        )
+
+        models = loader.list_available("spam_detector")
+        latest = loader._get_latest_timestamp("spam_detector")
+
+        assert latest == models[0].timestamp
+        assert globs == ["spam_detector_model_*.joblib"]
+
+    def test_latest_with_only_symlinks_raises_error(self, models_dir, tmp_path):
+        """Should distinguish a directory holding only *_latest symlinks."""
+        (tmp_path / "spam_detector_model_latest.joblib").symlink_to(
+            next(models_dir.glob("spam_detector_model_*.joblib")).resolve()
+        )
+        loader = JoblibModelLoader(models_dir=tmp_path)
+
+        with pytest.raises(FileNotFoundError, match="Only symlinks"):
+            loader.load("spam_detector")
+        with pytest.raises(FileNotFoundError, match="No models found"):
+            loader.load("phishing_detector")
+
 
 @pytest.mark.integration
 class TestJoblibModelLoaderCache:
     """Test cache functionality."""
 
-    def test_clear_cache(self, loader):
+    def test_clear_cache(self, models_dir):
         """Should clear cached models."""
+        loader = JoblibModelLoader(models_dir=models_dir)
         # Load model (caches it)
         loader.load("spam_detector")
+        loader.list_available("spam_detector")
         assert len(loader._cache) > 0
+        assert len(loader._listing_cache) > 0
 
         # Clear cache
         loader.clear_cache()
         assert len(loader._cache) == 0
+        assert len(loader._listing_cache) == 0
+
+    def test_concurrent_first_loads_read_disk_once(self, models_dir, monkeypatch):
+        """Threads racing on a cold cache should share a single load."""
+        loader = JoblibModelLoader(models_dir=models_dir)
+        barrier = threading.Barrier(4)
+        loads: list[str] = []
+        load_version = loader._load_version
+
+        def slow_load_version(model_name, timestamp):
+            loads.append(model_name)
+            time.sleep(0.05)
+            return load_version(model_name, timestamp)
+
+        monkeypatch.setattr(loader, "_load_version", slow_load_version)
+
+        def worker():
+            barrier.wait()
+            return loader.load("spam_detector")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: worker(), range(4)))
+
+        assert loads == ["spam_detector"]
+        assert all(result is results[0] for result in results)
+
+
+@pytest.mark.integration
+class TestJoblibModelLoaderMmap:
+    """Test memory-mapped loading."""
+
+    def test_mmap_and_heap_loads_predict_identically(self, models_dir):
+        """Memory-mapped arrays should give the same predictions as heap copies."""
+        mmap_loader = JoblibModelLoader(models_dir, mmap_mode="r")
+        heap_loader = JoblibModelLoader(models_dir, mmap_mode=None)
+        mmap_vec, mmap_model, _ = mmap_loader.load("spam_detector")
+        heap_vec, heap_model, _ = heap_loader.load("spam_detector")
+
+        texts = ["WINNER! Click here to claim your prize!", "Meeting at 3 PM tomorrow"]
+        mmap_proba = mmap_model.predict_proba(mmap_vec.transform(texts))
+        heap_proba = heap_model.predict_proba(heap_vec.transform(texts))
+
+        assert mmap_proba.tolist() == heap_proba.tolist()
+
+    def test_heap_load_does_not_mmap(self, models_dir):
+        """mmap_mode=None should load arrays fully into memory."""
+        _, model, _ = JoblibModelLoader(models_dir, mmap_mode=None).load("spam_detector")
+
+        assert not isinstance(model.coef_, np.memmap)
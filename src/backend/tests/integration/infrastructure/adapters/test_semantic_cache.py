@@ -0,0 +1,73 @@
+"""Integration tests for HashingSemanticCache."""
+
+import pytest
+
+from spam_detector.domain.entities import ClassificationResult, Email, SinglePrediction
+from spam_detector.infrastructure.adapters import HashingSemanticCache
+
+TEMPLATE = (
+    "URGENT: Your account has been suspended. Verify your password within 24 hours "
+    "at {url} or your bank access will be permanently closed. Act now!"
+)
+
+
+@pytest.fixture
+def result() -> ClassificationResult:
+    """Classification result to cache."""
+    return ClassificationResult(
+        email=Email(text=TEMPLATE.format(url="http://secure-login.tk")),
+        spam_prediction=SinglePrediction("SPAM", 0.91, "spam_detector", "20260105_194125"),
+        phishing_prediction=SinglePrediction(
+            "PHISHING", 0.97, "phishing_detector", "20260105_195830"
+        ),
+        execution_time_ms=12.0,
+    )
+
+
+@pytest.mark.integration
+class TestHashingSemanticCache:
+    """Test near-duplicate lookup."""
+
+    def test_near_duplicate_hits(self, result):
+        """Template with a swapped URL should hit."""
+        cache = HashingSemanticCache(maxsize=4, threshold=0.9)
+        cache.add(TEMPLATE.format(url="http://secure-login.tk"), result)
+
+        assert cache.lookup(TEMPLATE.format(url="http://account-check.ml")) is result
+        assert cache.hits == 1
+
+    def test_unrelated_email_misses(self, result):
+        """Unrelated text should miss."""
+        cache = HashingSemanticCache(maxsize=4, threshold=0.9)
+        cache.add(TEMPLATE.format(url="http://secure-login.tk"), result)
+
+        assert cache.lookup("Hi John, see you at the meeting tomorrow at 3 PM.") is None
+        assert cache.misses == 1
+
+    def test_empty_cache_misses(self):
+        """Lookup on empty cache should miss."""
+        assert HashingSemanticCache(maxsize=4).lookup("anything") is None
+
+    def test_fifo_eviction(self, result):
+        """Oldest entry should be overwritten when full."""
+        cache = HashingSemanticCache(maxsize=1, threshold=0.99)
+        cache.add("first email about invoices", result)
+        cache.add("second message regarding lunch plans", result)
+
+        assert len(cache) == 1
+        assert cache.lookup("first email about invoices") is None
+
+    def test_clear(self, result):
+        """Should drop all entries."""
+        cache = HashingSemanticCache(maxsize=4)
+        cache.add("some email", result)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.lookup("some email") is None
+
+    def test_invalid_maxsize(self):
+        """Should reject non-positive sizes."""
+        with pytest.raises(ValueError, match="maxsize"):
+            HashingSemanticCache(maxsize=0)
@@ -11,9 +11,9 @@ from spam_detector.infrastructure.adapters import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def spam_predictor() -> SklearnPredictor:
-    """Load real spam detector."""
+    """Load real spam detector (once per module; predictors are read-only)."""
     loader = JoblibModelLoader(models_dir=Path("models"))
     vectorizer, model, metadata = loader.load("spam_detector")
 
@@ -80,3 +80,54 @@ class TestSklearnPredictorMetadata:
         assert prediction.model_name == "spam_detector"
         assert len(prediction.model_timestamp) > 0
         assert "_" in prediction.model_timestamp  # Format: YYYYMMDD_HHMMSS
+
+    def test_predictor_uses_slots(self, spam_predictor):
+        """Should not carry a per-instance __dict__."""
+        assert not hasattr(spam_predictor, "__dict__")
+
+    def test_exposes_loaded_components(self, spam_predictor):
+        """Should expose the vectorizer and model it predicts with."""
+        predictor = SklearnPredictor(
+            vectorizer=spam_predictor.vectorizer,
+            model=spam_predictor.model,
+            metadata=spam_predictor.metadata,
+            predictor_type="spam",
+        )
+
+        assert predictor.vectorizer is spam_predictor._vectorizer
+        assert predictor.model is spam_predictor._model
+
+
+@pytest.mark.integration
+class TestSklearnPredictorBatch:
+    """Test batched predictions."""
+
+    def test_predict_batch_matches_single_predictions(self, spam_predictor):
+        """Should return the same predictions as predict(), in input order."""
+        emails = [
+            Email(text="WINNER! You have won $1000! Click here NOW to claim your prize!"),
+            Email(text="Hi John, I'll be at the office tomorrow at 3 PM for our meeting."),
+        ]
+
+        predictions = spam_predictor.predict_batch(emails)
+
+        assert predictions == [spam_predictor.predict(email) for email in emails]
+
+    def test_predict_batch_of_100_matches_single_predictions(self, spam_predictor):
+        """Should stay aligned with predict() for a realistic batch size."""
+        texts = [
+            "WINNER! You have won $1000! Click here NOW to claim your prize!",
+            "Hi John, I'll be at the office tomorrow at 3 PM for our meeting.",
+            "Your account has been suspended, verify your password immediately",
+            "Lunch on Friday? The usual place works for me.",
+        ]
+        emails = [Email(text=f"{texts[i % len(texts)]} #{i}") for i in range(100)]
+
+        predictions = spam_predictor.predict_batch(emails)
+
+        assert len(predictions) == 100
+        assert predictions == [spam_predictor.predict(email) for email in emails]
+
+    def test_predict_batch_empty(self, spam_predictor):
+        """Should return empty list for empty batch."""
+        assert spam_predictor.predict_batch([]) == []
@@ -0,0 +1,89 @@
+"""Unit tests for ClassificationCache."""
+
+import pytest
+
+from spam_detector.application import ClassificationCache
+from spam_detector.domain.entities import ClassificationResult, Email, SinglePrediction
+
+
+@pytest.fixture
+def result() -> ClassificationResult:
+    """Sample classification result."""
+    return ClassificationResult(
+        email=Email(text="Test email"),
+        spam_prediction=SinglePrediction("SPAM", 0.85, "spam_detector", "20260105_194125"),
+        phishing_prediction=SinglePrediction("LEGIT", 0.92, "phishing_detector", "20260105_195830"),
+        execution_time_ms=45.3,
+    )
+
+
+class TestClassificationCache:
+    """Test LRU result cache."""
+
+    def test_make_key_depends_on_all_fields(self):
+        """Should produce distinct keys for different text, subject or sender."""
+        base = ClassificationCache.make_key("Text", None, None)
+
+        assert base == ClassificationCache.make_key("Text", None, None)
+        assert base != ClassificationCache.make_key("Other", None, None)
+        assert base != ClassificationCache.make_key("Text", "Subject", None)
+        assert base != ClassificationCache.make_key("Text", None, "a@b.c")
+
+    def test_get_and_put(self, result):
+        """Should return stored result and count hits/misses."""
+        cache = ClassificationCache(maxsize=4)
+        key = cache.make_key("Test email", None, None)
+
+        assert cache.get(key) is None
+        cache.put(key, result)
+
+        assert cache.get(key) is result
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self, result):
+        """Should evict the least recently used entry when full."""
+        cache = ClassificationCache(maxsize=2)
+        keys = [cache.make_key(text, None, None) for text in ("a", "b", "c")]
+
+        cache.put(keys[0], result)
+        cache.put(keys[1], result)
+        cache.get(keys[0])  # "a" becomes most recently used
+        cache.put(keys[2], result)
+
+        assert len(cache) == 2
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is result
+
+    def test_zero_maxsize_disables_cache(self, result):
+        """Should not store anything when maxsize is 0."""
+        cache = ClassificationCache(maxsize=0)
+        key = cache.make_key("Test", None, None)
+
+        cache.put(key, result)
+
+        assert len(cache) == 0
+
+    def test_clear(self, result):
+        """Should remove entries and reset counters."""
+        cache = ClassificationCache()
+        key = cache.make_key("Test", None, None)
+        cache.put(key, result)
+        cache.get(key)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_cache_info_reports_counters(self, result):
+        """Should report hits, misses, maxsize and size like functools' cache_info()."""
+        cache = ClassificationCache(maxsize=4)
+        key = ClassificationCache.make_key("Text", None, None)
+
+        cache.get(key)
+        cache.put(key, result)
+        cache.get(key)
+
+        assert cache.cache_info() == (1, 1, 4, 1)
+        cache.clear()
+        assert cache.cache_info() == (0, 0, 4, 0)
@@ -1,9 +1,12 @@
 """Unit tests for ClassifyEmailUseCase."""
 
-from unittest.mock import Mock
+import asyncio
+from collections.abc import Sequence
+from datetime import datetime
 
 import pytest
 
+from spam_detector.application import ClassificationCache
 from spam_detector.application.use_cases import ClassifyEmailUseCase
 from spam_detector.domain.entities import (
     ClassificationResult,
@@ -12,12 +15,45 @@ from spam_detector.domain.entities import (
 )
 
 
-@pytest.fixture
-def mock_classifier_service():
-    """Mock classifier service."""
-    service = Mock()
+class StubClassifierService:
+    """Classifier service double that records the emails it is given."""
+
+    def __init__(self, result: ClassificationResult) -> None:
+        self.result = result
+        self.batch_results: list | None = None
+        self.calls: list[Email] = []
+        self.async_calls: list[Email] = []
+        self.batch_calls: list[list[Email]] = []
+
+    def classify(self, email: Email) -> ClassificationResult:
+        self.calls.append(email)
+        return self.result
+
+    async def classify_async(self, email: Email) -> ClassificationResult:
+        self.async_calls.append(email)
+        return self.result
+
+    def classify_batch(self, emails: Sequence[Email]) -> list:
+        self.batch_calls.append(list(emails))
+        if self.batch_results is not None:
+            return self.batch_results
+        return [self.result for _ in emails]
+
+
+class StubFormatter:
+    """Output formatter double that records (result, detail_level) calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[ClassificationResult, str]] = []
+
+    def format(self, result: ClassificationResult, detail_level: str = "simple") -> str:
+        self.calls.append((result, detail_level))
+        return "Formatted output"
+
 
-    # Mock classification result
+@pytest.fixture
+def classifier_service():
+    """Stub classifier service."""
     email = Email(text="Test email")
     spam_pred = SinglePrediction("SPAM", 0.85, "spam_detector", "20260105_194125")
     phish_pred = SinglePrediction("PHISHING", 0.92, "phishing_detector", "20260105_195830")
@@ -28,74 +64,294 @@ def mock_classifier_service():
         phishing_prediction=phish_pred,
         execution_time_ms=45.3,
     )
-
-    service.classify.return_value = result
-    return service
+    return StubClassifierService(result)
 
 
 @pytest.fixture
-def mock_formatter():
-    """Mock output formatter."""
-    formatter = Mock()
-    formatter.format.return_value = "Formatted output"
-    return formatter
+def formatter():
+    """Stub output formatter."""
+    return StubFormatter()
 
 
 @pytest.fixture
-def use_case(mock_classifier_service, mock_formatter):
-    """ClassifyEmailUseCase with mocks."""
-    return ClassifyEmailUseCase(
-        classifier_service=mock_classifier_service, formatter=mock_formatter
-    )
+def use_case(classifier_service, formatter):
+    """ClassifyEmailUseCase with stubs."""
+    return ClassifyEmailUseCase(classifier_service=classifier_service, formatter=formatter)
 
 
 class TestClassifyEmailUseCase:
     """Test ClassifyEmailUseCase."""
 
-    def test_execute_calls_classifier(self, use_case, mock_classifier_service):
+    def test_execute_calls_classifier(self, use_case, classifier_service):
         """Should call classifier service with Email entity."""
         use_case.execute("Test email text")
 
-        mock_classifier_service.classify.assert_called_once()
-        call_args = mock_classifier_service.classify.call_args[0][0]
-        assert isinstance(call_args, Email)
-        assert call_args.text == "Test email text"
+        assert len(classifier_service.calls) == 1
+        email = classifier_service.calls[0]
+        assert isinstance(email, Email)
+        assert email.text == "Test email text"
 
-    def test_execute_calls_formatter(self, use_case, mock_formatter):
+    def test_execute_calls_formatter(self, use_case, formatter):
         """Should call formatter with result and detail level."""
         use_case.execute("Test", detail_level="detailed")
 
-        mock_formatter.format.assert_called_once()
-        args = mock_formatter.format.call_args
-        assert isinstance(args[0][0], ClassificationResult)
-        assert args[1]["detail_level"] == "detailed"
+        assert len(formatter.calls) == 1
+        result, detail_level = formatter.calls[0]
+        assert isinstance(result, ClassificationResult)
+        assert detail_level == "detailed"
 
     def test_execute_returns_formatted_output(self, use_case):
         """Should return formatted string from formatter."""
         result = use_case.execute("Test")
         assert result == "Formatted output"
 
-    def test_execute_with_subject_and_sender(self, use_case, mock_classifier_service):
+    def test_execute_with_subject_and_sender(self, use_case, classifier_service):
         """Should pass subject and sender to Email entity."""
         use_case.execute(email_text="Test", subject="Test Subject", sender="test@example.com")
 
-        call_args = mock_classifier_service.classify.call_args[0][0]
-        assert call_args.subject == "Test Subject"
-        assert call_args.sender == "test@example.com"
+        email = classifier_service.calls[-1]
+        assert email.subject == "Test Subject"
+        assert email.sender == "test@example.com"
 
     def test_execute_with_empty_text_raises_error(self, use_case):
         """Should raise ValueError for empty email text."""
         with pytest.raises(ValueError, match="cannot be empty"):
             use_case.execute("")
 
-    def test_execute_raw_returns_classification_result(self, use_case, mock_classifier_service):
+    def test_execute_raw_returns_classification_result(self, use_case, classifier_service):
         """Should return raw ClassificationResult without formatting."""
         result = use_case.execute_raw("Test email")
 
         assert isinstance(result, ClassificationResult)
-        mock_classifier_service.classify.assert_called_once()
+        assert len(classifier_service.calls) == 1
 
-    def test_execute_raw_does_not_call_formatter(self, use_case, mock_formatter):
+    def test_execute_raw_does_not_call_formatter(self, use_case, formatter):
         """execute_raw should not call formatter."""
         use_case.execute_raw("Test")
-        mock_formatter.format.assert_not_called()
+        assert formatter.calls == []
+
+    def test_execute_raw_async_returns_classification_result(
+        self, use_case, classifier_service, formatter
+    ):
+        """Should await the async classifier path without formatting."""
+        result = asyncio.run(use_case.execute_raw_async("Test email", sender="a@b.c"))
+
+        assert isinstance(result, ClassificationResult)
+        email = classifier_service.async_calls[-1]
+        assert email.text == "Test email"
+        assert email.sender == "a@b.c"
+        assert formatter.calls == []
+
+    def test_execute_raw_batch_builds_emails(self, use_case, classifier_service):
+        """Should build one Email per tuple and classify them in one call."""
+        classifier_service.batch_results = ["r1", "r2"]
+
+        results = use_case.execute_raw_batch([("First", None, None), ("Second", "Subj", "a@b.c")])
+
+        assert results == ["r1", "r2"]
+        emails = classifier_service.batch_calls[-1]
+        assert [e.text for e in emails] == ["First", "Second"]
+        assert emails[1].subject == "Subj"
+        assert emails[1].sender == "a@b.c"
+
+    def test_execute_raw_batch_with_empty_text_raises_error(self, use_case):
+        """Should raise ValueError if any email text is empty."""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            use_case.execute_raw_batch([("Valid", None, None), ("", None, None)])
+
+
+class TestClassifyEmailUseCaseCache:
+    """Test result caching in ClassifyEmailUseCase."""
+
+    @pytest.fixture
+    def cached_use_case(self, classifier_service, formatter):
+        """ClassifyEmailUseCase with a result cache."""
+        return ClassifyEmailUseCase(
+            classifier_service=classifier_service,
+            formatter=formatter,
+            result_cache=ClassificationCache(maxsize=8),
+        )
+
+    def test_repeated_email_is_classified_once(self, cached_use_case, classifier_service):
+        """Should serve repeated emails from cache with zero execution time."""
+        first = cached_use_case.execute_raw("Test email")
+        second = cached_use_case.execute_raw("Test email")
+
+        assert len(classifier_service.calls) == 1
+        assert second.final_verdict == first.final_verdict
+        assert second.execution_time_ms == 0.0
+
+    def test_hit_carries_the_new_email(self, cached_use_case, classifier_service):
+        """An exact hit should be rebound to the caller's Email, timestamp included."""
+        first = Email(text="Test email", timestamp=datetime(2020, 1, 1))
+        second = Email(text="Test email", timestamp=datetime(2026, 1, 1))
+
+        cached_use_case.execute_raw_email(first)
+        result = cached_use_case.execute_raw_email(second)
+
+        assert len(classifier_service.calls) == 1
+        assert result.email is second
+
+    def test_different_sender_is_not_a_hit(self, cached_use_case, classifier_service):
+        """Should key cache on sender and subject too."""
+        cached_use_case.execute_raw("Test email")
+        cached_use_case.execute_raw("Test email", sender="other@example.com")
+
+        assert len(classifier_service.calls) == 2
+
+    def test_execute_uses_cache(self, cached_use_case, classifier_service, formatter):
+        """Formatted execution should also be served from cache."""
+        cached_use_case.execute("Test email")
+        cached_use_case.execute("Test email")
+
+        assert len(classifier_service.calls) == 1
+        assert len(formatter.calls) == 2
+
+    def test_execute_raw_async_uses_cache(self, cached_use_case, classifier_service):
+        """Async path should share the cache with the sync path."""
+        cached_use_case.execute_raw("Test email")
+
+        result = asyncio.run(cached_use_case.execute_raw_async("Test email"))
+
+        assert classifier_service.async_calls == []
+        assert result.execution_time_ms == 0.0
+
+    def test_execute_raw_batch_classifies_only_misses(self, cached_use_case, classifier_service):
+        """Should batch-classify only emails missing from cache."""
+        cached_use_case.execute_raw("Test email")
+
+        results = cached_use_case.execute_raw_batch(
+            [("Test email", None, None), ("New", None, None)]
+        )
+
+        emails = classifier_service.batch_calls[-1]
+        assert [e.text for e in emails] == ["New"]
+        assert results[0].execution_time_ms == 0.0
+        assert len(results) == 2
+
+    def test_cache_clear_forces_reclassification(self, cached_use_case, classifier_service):
+        """Should expose cache stats and reclassify after cache_clear()."""
+        cached_use_case.execute_raw("Test email")
+        cached_use_case.execute_raw("Test email")
+        assert cached_use_case.cache_info().hits == 1
+
+        cached_use_case.cache_clear()
+        cached_use_case.execute_raw("Test email")
+
+        assert len(classifier_service.calls) == 2
+
+    def test_cache_info_without_cache_is_none(self, use_case):
+        """Should report no stats when caching is disabled."""
+        assert use_case.cache_info() is None
+
+
+class FakeSemanticCache:
+    """Semantic cache double that treats every lookup after the first add as a hit."""
+
+    def __init__(self) -> None:
+        self.result: ClassificationResult | None = None
+        self.added: list[str] = []
+        self.lookups: list[str] = []
+
+    def lookup(self, email_text: str) -> ClassificationResult | None:
+        self.lookups.append(email_text)
+        return self.result
+
+    def add(self, email_text: str, result: ClassificationResult) -> None:
+        self.added.append(email_text)
+        self.result = result
+
+
+class TestClassifyEmailUseCaseSemanticCache:
+    """Test near-duplicate caching in ClassifyEmailUseCase."""
+
+    @pytest.fixture
+    def semantic_use_case(self, classifier_service, formatter):
+        """ClassifyEmailUseCase with exact and semantic caches."""
+        return ClassifyEmailUseCase(
+            classifier_service=classifier_service,
+            formatter=formatter,
+            result_cache=ClassificationCache(maxsize=8),
+            semantic_cache=FakeSemanticCache(),
+        )
+
+    def test_near_duplicate_is_served_from_cache(self, semantic_use_case, classifier_service):
+        """Should return the similar email's verdict, bound to the new email."""
+        semantic_use_case.execute_raw("WINNER! Click http://a.tk")
+
+        result = semantic_use_case.execute_raw("WINNER! Click http://b.tk", sender="x@y.tk")
+
+        assert len(classifier_service.calls) == 1
+        assert result.email.text == "WINNER! Click http://b.tk"
+        assert result.email.sender == "x@y.tk"
+        assert result.execution_time_ms == 0.0
+
+    def test_exact_cache_is_checked_first(self, classifier_service, formatter):
+        """Exact repeats should not reach the semantic cache."""
+        semantic_cache = FakeSemanticCache()
+        use_case = ClassifyEmailUseCase(
+            classifier_service=classifier_service,
+            formatter=formatter,
+            result_cache=ClassificationCache(maxsize=8),
+            semantic_cache=semantic_cache,
+        )
+
+        use_case.execute_raw("Test email")
+        use_case.execute_raw("Test email")
+
+        assert semantic_cache.lookups == ["Test email"]
+
+    def test_empty_text_still_raises(self, semantic_use_case):
+        """Cache hits must not bypass Email validation."""
+        semantic_use_case.execute_raw("Test email")
+
+        with pytest.raises(ValueError):
+            semantic_use_case.execute_raw("   ")
+
+
+class TestClassifyEmailUseCaseEmailEntryPoints:
+    """Test entry points that take an already-built Email."""
+
+    def test_execute_raw_email_passes_entity_through(self, use_case, classifier_service):
+        """Should classify the given Email without rebuilding it."""
+        email = Email(text="Test email", subject="Hi")
+
+        use_case.execute_raw_email(email)
+
+        assert classifier_service.calls[-1] is email
+
+    def test_execute_email_formats(self, use_case, formatter):
+        """Should format the result with the requested detail level."""
+        output = use_case.execute_email(Email(text="Test email"), detail_level="debug")
+
+        assert output == "Formatted output"
+        assert formatter.calls[-1][1] == "debug"
+
+    def test_execute_batch_formats_each_result(self, use_case, classifier_service, formatter):
+        """Should format every batch result with the requested detail level."""
+        classifier_service.batch_results = ["r1", "r2"]
+
+        outputs = use_case.execute_batch(
+            [Email(text="First"), Email(text="Second")], detail_level="detailed"
+        )
+
+        assert outputs == ["Formatted output", "Formatted output"]
+        assert formatter.calls == [("r1", "detailed"), ("r2", "detailed")]
+
+    def test_execute_raw_email_async_passes_entity_through(self, use_case, classifier_service):
+        """Async variant should await the service with the same Email."""
+        email = Email(text="Test email")
+
+        asyncio.run(use_case.execute_raw_email_async(email))
+
+        assert classifier_service.async_calls == [email]
+
+    def test_execute_raw_email_batch_passes_entities_through(self, use_case, classifier_service):
+        """Batch variant should forward the Email list unchanged."""
+        emails = [Email(text="First"), Email(text="Second")]
+        classifier_service.batch_results = ["r1", "r2"]
+
+        results = use_case.execute_raw_email_batch(emails)
+
+        assert classifier_service.batch_calls == [emails]
+        assert results == ["r1", "r2"]
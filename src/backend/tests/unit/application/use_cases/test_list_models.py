@@ -1,17 +1,27 @@
 """Unit tests for ListModelsUseCase."""
 
-from unittest.mock import Mock
+import pytest
 
 from spam_detector.application.use_cases import ListModelsUseCase
 from spam_detector.domain.entities import ModelMetadata
-import pytest
 
-@pytest.fixture
-def mock_model_loader():
-    """Mock model loader."""
-    loader = Mock()
 
-    # Mock available models
+class FakeModelLoader:
+    """Model loader double serving a fixed model list and recording calls."""
+
+    def __init__(self, models: list[ModelMetadata]) -> None:
+        self.models = models
+        self.list_calls: list[str] = []
+
+    def list_available(self, model_name: str) -> list[ModelMetadata]:
+        self.list_calls.append(model_name)
+        return self.models
+
+
+@pytest.fixture
+def model_loader():
+    """Fake model loader."""
+    # Available models
     models = [
         ModelMetadata(
             name="spam_detector",
@@ -31,24 +41,23 @@ def mock_model_loader():
         ),
     ]
 
-    loader.list_available.return_value = models
-    return loader
+    return FakeModelLoader(models)
 
 
 @pytest.fixture
-def use_case(mock_model_loader):
-    """ListModelsUseCase with mock loader."""
-    return ListModelsUseCase(model_loader=mock_model_loader)
+def use_case(model_loader):
+    """ListModelsUseCase with fake loader."""
+    return ListModelsUseCase(model_loader=model_loader)
 
 
 class TestListModelsUseCase:
     """Test ListModelsUseCase."""
 
-    def test_execute_calls_loader(self, use_case, mock_model_loader):
+    def test_execute_calls_loader(self, use_case, model_loader):
         """Should call loader.list_available."""
         use_case.execute("spam_detector")
 
-        mock_model_loader.list_available.assert_called_once_with("spam_detector")
+        assert model_loader.list_calls == ["spam_detector"]
 
     def test_execute_returns_model_list(self, use_case):
         """Should return list of ModelMetadata."""
@@ -65,10 +74,9 @@ class TestListModelsUseCase:
         assert latest is not None
         assert latest.timestamp == "20260105_194125"
 
-    def test_get_latest_with_empty_list_returns_none(self, mock_model_loader):
+    def test_get_latest_with_empty_list_returns_none(self):
         """Should return None if no models available."""
-        mock_model_loader.list_available.return_value = []
-        use_case = ListModelsUseCase(mock_model_loader)
+        use_case = ListModelsUseCase(FakeModelLoader([]))
 
         latest = use_case.get_latest("spam_detector")
 
@@ -84,10 +92,21 @@ class TestListModelsUseCase:
         assert "(latest)" in summary
         assert "97.40%" in summary
 
-    def test_format_summary_with_no_models(self, mock_model_loader):
+    def test_format_summary_exact_layout(self, use_case):
+        """Should render a header, a blank line, then one line per version."""
+        summary = use_case.format_summary("spam_detector")
+
+        assert summary == (
+            "Available models for 'spam_detector':\n"
+            "Total versions: 2\n"
+            "\n"
+            "1. 20260105_194125 (latest) - Accuracy: 97.40% - Size: 0.14MB\n"
+            "2. 20260104_120000 - Accuracy: 96.80% - Size: 0.12MB"
+        )
+
+    def test_format_summary_with_no_models(self):
         """Should handle case with no models."""
-        mock_model_loader.list_available.return_value = []
-        use_case = ListModelsUseCase(mock_model_loader)
+        use_case = ListModelsUseCase(FakeModelLoader([]))
 
         summary = use_case.format_summary("spam_detector")
 
@@ -46,6 +46,18 @@ class TestModelMetadataCreation:
         with pytest.raises(AttributeError):
             meta.accuracy = 0.99  # type: ignore
 
+    def test_metadata_uses_slots(self):
+        """Should not carry a per-instance __dict__."""
+        meta = ModelMetadata(
+            name="spam_detector",
+            timestamp="20260105_194125",
+            accuracy=0.974,
+            train_samples=4457,
+            vocabulary_size=3000,
+            file_size_mb=0.135,
+        )
+        assert not hasattr(meta, "__dict__")
+
 
 class TestModelMetadataValidation:
     """Test ModelMetadata validation."""
@@ -113,6 +125,7 @@ class TestModelMetadataProperties:
             file_size_mb=0.135,
         )
         assert abs(meta.accuracy_percent - 97.4) < 0.001
+        assert "accuracy_percent" not in repr(meta)
 
     def test_display_name_spam(self):
         """Should return human-readable name for spam detector."""
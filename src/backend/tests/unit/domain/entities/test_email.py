@@ -36,6 +36,11 @@ class TestEmailCreation:
         with pytest.raises(AttributeError):
             email.text = "Modified"  # type: ignore
 
+    def test_email_uses_slots(self):
+        """Should not carry a per-instance __dict__."""
+        email = Email(text="Hello world")
+        assert not hasattr(email, "__dict__")
+
 
 class TestEmailValidation:
     """Test Email validation."""
@@ -50,6 +55,16 @@ class TestEmailValidation:
         with pytest.raises(ValueError, match="cannot be empty"):
             Email(text="   \n\t  ")
 
+    def test_long_whitespace_only_text_raises_error(self):
+        """Should scan the whole text, not just a prefix, before rejecting it."""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            Email(text="\u00a0\n" * 5000)
+
+    def test_long_leading_whitespace_is_valid(self):
+        """Should accept text whose content starts after long whitespace."""
+        email = Email(text=" " * 1000 + "Hello")
+        assert email.word_count == 1
+
 
 class TestEmailProperties:
     """Test Email computed properties."""
@@ -72,7 +87,21 @@ class TestEmailProperties:
         email = Email(text="This is a test message")
         assert email.word_count == 5
 
+    def test_word_count_splits_on_unicode_whitespace(self):
+        """Should treat any Unicode whitespace (not just ASCII) as a separator."""
+        email = Email(text="one\u00a0two\u2003three\tfour\nfive")
+        assert email.word_count == 5
+
     def test_char_count(self):
         """Should count characters correctly."""
         email = Email(text="Hello")
         assert email.char_count == 5
+
+    def test_derived_values_are_cached(self):
+        """Should compute derived values once without affecting equality."""
+        email = Email(text="This is a test message")
+
+        assert email.word_count == email.word_count == 5
+        assert email.preview is email.preview
+        assert email == Email(text="This is a test message")
+        assert hash(email) == hash(Email(text="This is a test message"))
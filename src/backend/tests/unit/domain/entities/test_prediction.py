@@ -1,5 +1,8 @@
 """Unit tests for Prediction entities."""
 
+import pickle
+from dataclasses import replace
+
 import pytest
 
 from spam_detector.domain.entities import (
@@ -45,6 +48,20 @@ class TestSinglePrediction:
         )
         assert pred.probability_percent == 85.3
 
+    def test_is_positive_is_derived(self):
+        """is_positive is computed from the label and not part of equality."""
+        pred = SinglePrediction("PHISHING", 0.7, "phishing_detector", "20260105_195830")
+
+        assert pred.is_positive is True
+        assert pred == SinglePrediction("PHISHING", 0.7, "phishing_detector", "20260105_195830")
+        assert "is_positive" not in repr(pred)
+
+    def test_probability_percent_follows_replace(self):
+        """Derived percentage should be recomputed for a replaced probability."""
+        pred = SinglePrediction("SPAM", 0.5, "spam_detector", "20260105_194125")
+
+        assert replace(pred, probability=0.25).probability_percent == 25.0
+
     def test_invalid_probability_raises_error(self):
         """Should raise ValueError for probability > 1."""
         with pytest.raises(ValueError, match="between 0 and 1"):
@@ -157,3 +174,59 @@ class TestClassificationResult:
         models = spam_result.models_used
         assert models["spam"] == "20260105_194125"
         assert models["phishing"] == "20260105_195830"
+
+    def test_models_used_is_cached_and_read_only(self, spam_result):
+        """Should return the same read-only mapping on every access."""
+        assert spam_result.models_used is spam_result.models_used
+        with pytest.raises(TypeError):
+            spam_result.models_used["spam"] = "other"  # type: ignore[index]
+
+    def test_result_survives_pickling(self, spam_result):
+        """Should round-trip through pickle with derived values rebuilt."""
+        restored = pickle.loads(pickle.dumps(spam_result))
+
+        assert restored == spam_result
+        assert restored.models_used == spam_result.models_used
+        assert restored.risk_level == spam_result.risk_level
+
+    @pytest.mark.parametrize(
+        ("spam", "phishing", "verdict", "risk_level"),
+        [
+            (("HAM", 0.92), ("LEGIT", 0.88), "HAM", "LOW"),
+            (("HAM", 0.60), ("LEGIT", 0.55), "HAM", "MEDIUM"),
+            (("HAM", 0.80), ("LEGIT", 0.80), "HAM", "MEDIUM"),  # Threshold is exclusive
+            (("SPAM", 0.85), ("LEGIT", 0.65), "SPAM", "HIGH"),
+            (("SPAM", 0.60), ("LEGIT", 0.55), "SPAM", "MEDIUM"),
+            (("HAM", 0.75), ("PHISHING", 0.92), "PHISHING", "HIGH"),
+            (("HAM", 0.60), ("PHISHING", 0.65), "PHISHING", "MEDIUM"),
+            (("SPAM", 0.51), ("PHISHING", 0.52), "SPAM+PHISHING", "CRITICAL"),
+        ],
+    )
+    def test_verdict_and_risk_level_table(self, sample_email, spam, phishing, verdict, risk_level):
+        """Should map every verdict/confidence band to the expected risk level."""
+        result = ClassificationResult(
+            email=sample_email,
+            spam_prediction=SinglePrediction(spam[0], spam[1], "spam_detector", "ts"),
+            phishing_prediction=SinglePrediction(
+                phishing[0], phishing[1], "phishing_detector", "ts"
+            ),
+            execution_time_ms=1.0,
+        )
+
+        assert result.final_verdict == verdict
+        assert result.risk_level == risk_level
+        assert result.is_malicious is (verdict != "HAM")
+
+    def test_entities_use_slots(self, spam_result):
+        """Results are built per request, so they should not carry a __dict__."""
+        assert not hasattr(spam_result, "__dict__")
+        assert not hasattr(spam_result.spam_prediction, "__dict__")
+
+    def test_replace_recomputes_derived_values(self, spam_result):
+        """dataclasses.replace should rerun the precomputation for the new predictions."""
+        phishing = SinglePrediction("PHISHING", 0.99, "phishing_detector", "ts")
+
+        result = replace(spam_result, phishing_prediction=phishing)
+
+        assert result.final_verdict == "SPAM+PHISHING"
+        assert result.max_confidence == 0.99
@@ -0,0 +1,61 @@
+"""Unit tests for threat report entities."""
+
+import pytest
+
+from spam_detector.domain.entities.threat_report import (
+    IOC,
+    ThreatReport,
+    ThreatVector,
+    TriggerWord,
+)
+
+
+class TestThreatReportEntities:
+    """Test IOC, ThreatVector and TriggerWord."""
+
+    @pytest.mark.parametrize(
+        "entity",
+        [
+            IOC(type="url", severity="high", value="http://a.tk", description="URL"),
+            ThreatVector(name="Phishing Attack", description="Phishing", confidence=0.9),
+            TriggerWord(word="winner", contribution=0.4, category="spam"),
+        ],
+    )
+    def test_entities_use_slots(self, entity):
+        """Entities are created per IOC/word, so they should not carry a __dict__."""
+        assert not hasattr(entity, "__dict__")
+
+    @pytest.mark.parametrize(
+        ("contribution", "suspicious"), [(0.4, True), (0.0, False), (-0.2, False)]
+    )
+    def test_trigger_word_is_suspicious(self, contribution, suspicious):
+        """Only positive contributions push towards a malicious verdict."""
+        assert TriggerWord("w", contribution, "spam").is_suspicious is suspicious
+
+    def test_ioc_rejects_invalid_type(self):
+        """Should validate IOC type."""
+        with pytest.raises(ValueError, match="Invalid IOC type"):
+            IOC(type="bogus", severity="high", value="x", description="x")
+
+    def test_threat_vector_rejects_invalid_confidence(self):
+        """Should validate confidence range."""
+        with pytest.raises(ValueError, match="Confidence"):
+            ThreatVector(name="x", description="x", confidence=1.5)
+
+
+class TestThreatReport:
+    """Test ThreatReport derived values."""
+
+    def test_top_suspicious_words(self):
+        """Should return the ten strongest positive contributors, strongest first."""
+        spam = [TriggerWord(f"s{i}", i / 100, "spam") for i in range(8)]
+        phishing = [TriggerWord(f"p{i}", i / 50, "phishing") for i in range(8)]
+        legit = [TriggerWord("meeting", -0.9, "spam")]
+
+        report = ThreatReport(
+            risk_score=50, spam_trigger_words=spam + legit, phishing_trigger_words=phishing
+        )
+
+        # Ties (s6/p3, s4/p2) keep spam-before-phishing order
+        expected = "p7 p6 p5 p4 s7 s6 p3 s5 s4 p2".split()
+        assert report.top_suspicious_words == expected
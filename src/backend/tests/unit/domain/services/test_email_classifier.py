@@ -1,57 +1,101 @@
 """Unit tests for EmailClassifierService."""
 
-from unittest.mock import Mock
+import asyncio
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from spam_detector.domain.entities import Email, SinglePrediction
+from spam_detector.domain.entities import Email, ModelMetadata, SinglePrediction
+from spam_detector.domain.ports import IPredictor
 from spam_detector.domain.services import EmailClassifierService
 
 
+class FakePredictor:
+    """Predictor double returning fixed predictions and recording calls."""
+
+    def __init__(
+        self,
+        prediction: SinglePrediction,
+        overrides: dict[str, SinglePrediction] | None = None,
+    ) -> None:
+        self.prediction = prediction
+        self.overrides = overrides or {}
+        self.metadata = ModelMetadata(
+            name=prediction.model_name,
+            timestamp=prediction.model_timestamp,
+            accuracy=0.97,
+            train_samples=1000,
+            vocabulary_size=3000,
+            file_size_mb=0.1,
+        )
+        self.calls: list[Email] = []
+        self.batch_calls: list[Sequence[Email]] = []
+
+    def predict(self, email: Email) -> SinglePrediction:
+        self.calls.append(email)
+        return self.overrides.get(email.text, self.prediction)
+
+    def predict_batch(self, emails: Sequence[Email]) -> list[SinglePrediction]:
+        self.batch_calls.append(emails)
+        return [self.overrides.get(email.text, self.prediction) for email in emails]
+
+
+class SingleOnlyPredictor(IPredictor):
+    """Predictor implementing only predict(), relying on the port's batch default."""
+
+    def __init__(self, prediction: SinglePrediction) -> None:
+        self.prediction = prediction
+        self.calls: list[Email] = []
+
+    def predict(self, email: Email) -> SinglePrediction:
+        self.calls.append(email)
+        return self.prediction
+
+
 class TestEmailClassifierService:
     """Test EmailClassifierService domain service."""
 
     @pytest.fixture
-    def mock_spam_predictor(self):
-        """Mock spam predictor."""
-        predictor = Mock()
-        predictor.predict.return_value = SinglePrediction(
-            label="SPAM",
-            probability=0.85,
-            model_name="spam_detector",
-            model_timestamp="20260105_194125",
+    def spam_predictor(self):
+        """Fake spam predictor."""
+        return FakePredictor(
+            SinglePrediction(
+                label="SPAM",
+                probability=0.85,
+                model_name="spam_detector",
+                model_timestamp="20260105_194125",
+            )
         )
-        return predictor
 
     @pytest.fixture
-    def mock_phishing_predictor(self):
-        """Mock phishing predictor."""
-        predictor = Mock()
-        predictor.predict.return_value = SinglePrediction(
-            label="PHISHING",
-            probability=0.92,
-            model_name="phishing_detector",
-            model_timestamp="20260105_195830",
+    def phishing_predictor(self):
+        """Fake phishing predictor."""
+        return FakePredictor(
+            SinglePrediction(
+                label="PHISHING",
+                probability=0.92,
+                model_name="phishing_detector",
+                model_timestamp="20260105_195830",
+            )
         )
-        return predictor
 
     @pytest.fixture
-    def service(self, mock_spam_predictor, mock_phishing_predictor):
-        """Service with mocked predictors."""
+    def service(self, spam_predictor, phishing_predictor):
+        """Service with fake predictors."""
         return EmailClassifierService(
-            spam_predictor=mock_spam_predictor, phishing_predictor=mock_phishing_predictor
+            spam_predictor=spam_predictor, phishing_predictor=phishing_predictor
         )
 
-    def test_classify_calls_both_predictors(
-        self, service, mock_spam_predictor, mock_phishing_predictor
-    ):
+    def test_classify_calls_both_predictors(self, service, spam_predictor, phishing_predictor):
         """Should call both spam and phishing predictors."""
         email = Email(text="Test email")
 
-        result = service.classify(email)
+        service.classify(email)
 
-        mock_spam_predictor.predict.assert_called_once_with(email)
-        mock_phishing_predictor.predict.assert_called_once_with(email)
+        assert spam_predictor.calls == [email]
+        assert phishing_predictor.calls == [email]
 
     def test_classify_returns_classification_result(self, service):
         """Should return ClassificationResult with both predictions."""
@@ -82,3 +126,163 @@ class TestEmailClassifierService:
         assert result.email is email
         assert result.email.subject == "Subject"
         assert result.email.sender == "sender@test.com"
+
+    def test_classify_shared_predictor_predicts_once(self, spam_predictor):
+        """Should call a shared predictor only once (fallback wiring)."""
+        service = EmailClassifierService(
+            spam_predictor=spam_predictor, phishing_predictor=spam_predictor
+        )
+        email = Email(text="Test email")
+
+        result = service.classify(email)
+
+        assert spam_predictor.calls == [email]
+        assert result.phishing_prediction is result.spam_prediction
+
+    def test_classify_runs_predictors_concurrently(self, spam_predictor, phishing_predictor):
+        """Both models should be inside predict() at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class MeetingPredictor(FakePredictor):
+            def predict(self, email: Email) -> SinglePrediction:
+                barrier.wait()  # Breaks (and raises) if the other model never arrives
+                return super().predict(email)
+
+        spam = MeetingPredictor(spam_predictor.prediction)
+        phishing = MeetingPredictor(phishing_predictor.prediction)
+        service = EmailClassifierService(spam_predictor=spam, phishing_predictor=phishing)
+
+        result = service.classify(Email(text="Test email"))
+
+        assert result.final_verdict == "SPAM+PHISHING"
+
+    def test_classify_batch_returns_result_per_email(
+        self, service, spam_predictor, phishing_predictor
+    ):
+        """Should call each predictor once and zip results in input order."""
+        emails = [Email(text="First"), Email(text="Second")]
+
+        results = service.classify_batch(emails)
+
+        assert spam_predictor.batch_calls == [emails]
+        assert phishing_predictor.batch_calls == [emails]
+        assert [r.email for r in results] == emails
+        assert all(r.final_verdict == "SPAM+PHISHING" for r in results)
+
+    def test_classify_batch_empty(self, service, spam_predictor):
+        """Should return empty list without calling predictors."""
+        assert service.classify_batch([]) == []
+        assert spam_predictor.batch_calls == []
+
+    def test_classify_batch_uses_port_default(self, spam_predictor):
+        """Predictors without predict_batch should fall back to per-email predict."""
+        phishing_predictor = SingleOnlyPredictor(spam_predictor.prediction)
+        service = EmailClassifierService(
+            spam_predictor=spam_predictor, phishing_predictor=phishing_predictor
+        )
+        emails = [Email(text="First"), Email(text="Second")]
+
+        results = service.classify_batch(emails)
+
+        assert phishing_predictor.calls == emails
+        assert len(results) == 2
+
+    def test_classify_async_matches_classify(self, service, spam_predictor, phishing_predictor):
+        """Async path should call both predictors and return the same verdict."""
+        email = Email(text="WINNER! Click here NOW!")
+
+        result = asyncio.run(service.classify_async(email))
+
+        assert spam_predictor.calls == [email]
+        assert phishing_predictor.calls == [email]
+        assert result.email is email
+        assert result.final_verdict == "SPAM+PHISHING"
+        assert result.execution_time_ms > 0
+
+
+class TestEmailClassifierServiceGate:
+    """Test skipping the phishing predictor for confidently-HAM emails."""
+
+    @pytest.fixture
+    def ham_predictor(self):
+        """Fake spam predictor: confident HAM, except for one spammy text."""
+        return FakePredictor(
+            SinglePrediction("HAM", 0.99, "spam_detector", "20260105_194125"),
+            overrides={
+                "WINNER!": SinglePrediction("SPAM", 0.9, "spam_detector", "20260105_194125")
+            },
+        )
+
+    @pytest.fixture
+    def phishing_predictor(self):
+        """Fake phishing predictor."""
+        return FakePredictor(
+            SinglePrediction("PHISHING", 0.92, "phishing_detector", "20260105_195830")
+        )
+
+    @pytest.fixture
+    def service(self, ham_predictor, phishing_predictor):
+        """Service with the gate enabled."""
+        return EmailClassifierService(
+            spam_predictor=ham_predictor,
+            phishing_predictor=phishing_predictor,
+            phishing_skip_threshold=0.98,
+        )
+
+    def test_confident_ham_skips_phishing(self, service, phishing_predictor):
+        """Should synthesize LEGIT from the phishing model's metadata."""
+        result = service.classify(Email(text="See you at lunch"))
+
+        assert phishing_predictor.calls == []
+        assert result.phishing_prediction.label == "LEGIT"
+        assert result.phishing_prediction.probability == 0.99
+        assert result.phishing_prediction.model_name == "phishing_detector"
+        assert result.final_verdict == "HAM"
+        assert service.phishing_skipped == 1
+
+    def test_spam_runs_phishing(self, service, phishing_predictor):
+        """Should run phishing when spam isn't confidently HAM."""
+        email = Email(text="WINNER!")
+
+        result = service.classify(email)
+
+        assert phishing_predictor.calls == [email]
+        assert result.final_verdict == "SPAM+PHISHING"
+        assert service.phishing_skipped == 0
+
+    def test_below_threshold_runs_phishing(self, ham_predictor, phishing_predictor):
+        """Should run phishing when HAM confidence is under the threshold."""
+        service = EmailClassifierService(
+            spam_predictor=ham_predictor,
+            phishing_predictor=phishing_predictor,
+            phishing_skip_threshold=0.995,
+        )
+
+        service.classify(Email(text="See you at lunch"))
+
+        assert len(phishing_predictor.calls) == 1
+
+    def test_classify_batch_runs_phishing_on_pending_only(self, service, phishing_predictor):
+        """Batch path should only send non-skipped emails to phishing."""
+        emails = [Email(text="See you at lunch"), Email(text="WINNER!")]
+
+        results = service.classify_batch(emails)
+
+        assert [list(batch) for batch in phishing_predictor.batch_calls] == [[emails[1]]]
+        assert [r.final_verdict for r in results] == ["HAM", "SPAM+PHISHING"]
+
+    def test_classify_async_skips_phishing(self, service, phishing_predictor):
+        """Async path should honour the gate too."""
+        result = asyncio.run(service.classify_async(Email(text="See you at lunch")))
+
+        assert phishing_predictor.calls == []
+        assert result.phishing_prediction.label == "LEGIT"
+
+    def test_skip_count_is_exact_under_concurrency(self, service):
+        """Concurrent worker threads should not lose skip counts."""
+        emails = [Email(text=f"See you at lunch {i}") for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(service.classify, emails))
+
+        assert service.phishing_skipped == len(emails)
@@ -0,0 +1,140 @@
+"""Unit tests for FeatureExplainer."""
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from spam_detector.domain.services.feature_explainer import FeatureExplainer
+
+
+@pytest.fixture(scope="module")
+def fitted_model() -> tuple[TfidfVectorizer, LogisticRegression]:
+    """Tiny TF-IDF + LogisticRegression pair."""
+    texts = [
+        "win a free prize now",
+        "claim your free cash prize",
+        "meeting moved to monday",
+        "see you at lunch monday",
+    ]
+    vectorizer = TfidfVectorizer()
+    features = vectorizer.fit_transform(texts)
+    model = LogisticRegression().fit(features, [1, 1, 0, 0])
+    return vectorizer, model
+
+
+class TestExplainPrediction:
+    """Test per-email feature contributions."""
+
+    def test_matches_dense_computation(self, fitted_model):
+        """Should equal TF-IDF * coefficient for present words, by absolute value."""
+        vectorizer, model = fitted_model
+        text = "free prize at the monday meeting"
+
+        dense = vectorizer.transform([text]).toarray()[0]
+        names = vectorizer.get_feature_names_out()
+        expected = sorted(
+            ((names[i], dense[i] * model.coef_[0][i]) for i in np.flatnonzero(dense)),
+            key=lambda item: abs(item[1]),
+            reverse=True,
+        )
+
+        assert FeatureExplainer().explain_prediction(text, vectorizer, model) == expected
+
+    def test_respects_top_n(self, fitted_model):
+        """Should return at most top_n contributions."""
+        vectorizer, model = fitted_model
+
+        result = FeatureExplainer().explain_prediction(
+            "win free cash prize monday", vectorizer, model, top_n=2
+        )
+
+        assert len(result) == 2
+        assert abs(result[0][1]) >= abs(result[1][1])
+
+    def test_unknown_words_give_no_contributions(self, fitted_model):
+        """Text with no vocabulary words should explain nothing."""
+        vectorizer, model = fitted_model
+
+        assert FeatureExplainer().explain_prediction("zzz qqq", vectorizer, model) == []
+
+
+class TestGlobalIndicators:
+    """Test model-wide spam/ham indicators."""
+
+    def test_top_indicators_follow_coefficients(self, fitted_model):
+        """Spam indicators are the largest coefficients, ham the smallest."""
+        vectorizer, model = fitted_model
+        coefficients = model.coef_[0]
+        explainer = FeatureExplainer()
+
+        spam = explainer.get_top_spam_indicators(vectorizer, model, top_n=3)
+        ham = explainer.get_top_ham_indicators(vectorizer, model, top_n=3)
+
+        assert [c for _, c in spam] == sorted(coefficients, reverse=True)[:3]
+        assert [c for _, c in ham] == sorted(coefficients)[:3]
+
+    def test_coefficient_order_is_computed_once_per_model(self, fitted_model):
+        """Repeated calls should reuse the cached argsort."""
+        vectorizer, model = fitted_model
+        explainer = FeatureExplainer()
+
+        explainer.get_top_spam_indicators(vectorizer, model)
+        order = explainer._coefficient_orders[model]
+        explainer.get_top_ham_indicators(vectorizer, model)
+
+        assert explainer._coefficient_orders[model] is order
+
+    def test_feature_names_are_built_once_per_vectorizer(self, fitted_model):
+        """Explanations and indicators should share one feature-name array."""
+        vectorizer, model = fitted_model
+        explainer = FeatureExplainer()
+
+        explainer.explain_prediction("free prize", vectorizer, model)
+        feature_names = explainer._feature_names[vectorizer]
+        explainer.get_top_spam_indicators(vectorizer, model)
+
+        assert explainer._feature_names[vectorizer] is feature_names
+
+
+class TestFormatExplanation:
+    """Test human-readable explanation formatting."""
+
+    def test_splits_by_sign_and_drops_small_contributions(self):
+        """Should keep order within each side and skip values under the threshold."""
+        contributions = [("prize", 0.4), ("meeting", -0.2), ("free", 0.05), ("the", 0.001)]
+
+        explanation = FeatureExplainer().format_explanation(contributions)
+
+        assert explanation == {
+            "positive": ["prize (+0.400)", "free (+0.050)"],
+            "negative": ["meeting (-0.200)"],
+        }
+
+
+class TestExtractTriggeredWords:
+    """Test matching contributions back to words in the email."""
+
+    def test_matches_whole_words_only(self):
+        """Should keep strong features that appear as whole words, in order."""
+        contributions = [("prize", 0.4), ("win", 0.3), ("free", 0.2), ("cash", 0.01)]
+
+        triggered = FeatureExplainer().extract_triggered_words(
+            "WIN a FREE cash prize! Winners only", contributions
+        )
+
+        assert triggered == ["prize", "win", "free"]
+
+    def test_substring_is_not_a_match(self):
+        """A feature inside a longer word should not count."""
+        triggered = FeatureExplainer().extract_triggered_words("Winners", [("win", 0.5)])
+
+        assert triggered == []
+
+    def test_multi_word_feature(self):
+        """N-gram features should match across the space between words."""
+        triggered = FeatureExplainer().extract_triggered_words(
+            "Claim your free prize now", [("free prize", 0.5), ("prize now", 0.5)]
+        )
+
+        assert triggered == ["free prize", "prize now"]
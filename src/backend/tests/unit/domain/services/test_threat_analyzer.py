@@ -0,0 +1,319 @@
+"""Unit tests for ThreatAnalyzer."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from spam_detector.domain.entities import Email, SinglePrediction
+from spam_detector.domain.services.threat_analyzer import MAX_PATTERN_MATCHES, ThreatAnalyzer
+
+PHISHING_TEXT = (
+    "URGENT!!! Your bank account expires today. Verify your password now at "
+    "http://secure-login.tk or click here: https://example.com/verify"
+)
+
+
+@pytest.fixture
+def analyzer():
+    """ThreatAnalyzer instance."""
+    return ThreatAnalyzer()
+
+
+def _predictions(spam: float, phishing: float) -> tuple[SinglePrediction, SinglePrediction]:
+    return (
+        SinglePrediction(
+            "SPAM" if spam >= 0.5 else "HAM", spam, "spam_detector", "20260105_194125"
+        ),
+        SinglePrediction(
+            "PHISHING" if phishing >= 0.5 else "LEGIT",
+            phishing,
+            "phishing_detector",
+            "20260105_195830",
+        ),
+    )
+
+
+class TestThreatAnalyzerIOCs:
+    """Test IOC extraction."""
+
+    def test_extracts_urls_with_severity(self, analyzer):
+        """Risky TLD is critical, plain HTTPS is medium."""
+        report = analyzer.analyze(Email(text=PHISHING_TEXT), *_predictions(0.8, 0.9))
+
+        urls = {ioc.value: ioc.severity for ioc in report.iocs if ioc.type == "url"}
+        assert urls == {
+            "http://secure-login.tk": "critical",
+            "https://example.com/verify": "medium",
+        }
+
+    def test_http_url_is_high(self, analyzer):
+        """Non-HTTPS URL without risky TLD should be high severity."""
+        report = analyzer.analyze(Email(text="See http://example.com"), *_predictions(0.1, 0.1))
+
+        (url,) = [ioc for ioc in report.iocs if ioc.type == "url"]
+        assert url.severity == "high"
+
+    def test_url_ends_at_unicode_whitespace(self, analyzer):
+        """URLs should stop at non-ASCII whitespace such as a non-breaking space."""
+        text = "Login at HTTPS://bank.example.com/Login\u00a0today or https://a.tk\u2003now"
+        report = analyzer.analyze(Email(text=text), *_predictions(0.1, 0.1))
+
+        urls = [ioc.value for ioc in report.iocs if ioc.type == "url"]
+        assert urls == ["HTTPS://bank.example.com/Login", "https://a.tk"]
+
+    def test_detects_urgency_keywords(self, analyzer):
+        """Should count urgency keyword occurrences."""
+        report = analyzer.analyze(Email(text=PHISHING_TEXT), *_predictions(0.8, 0.9))
+
+        (urgency,) = [ioc for ioc in report.iocs if ioc.type == "keyword_urgency"]
+        assert "urgent (1x)" in urgency.value
+        assert urgency.count >= 3
+
+    def test_nested_keywords_are_counted_separately(self, analyzer):
+        """A keyword inside a longer keyword should still be counted."""
+        hits = analyzer._scan_keywords("act now, act now")
+
+        assert dict(hits["urgency"]) == {"act now": 2, "now": 2}
+        assert hits["financial"] == []
+
+    def test_financial_keywords_are_counted(self, analyzer):
+        """Financial hits should carry their occurrence count from the shared scan."""
+        hits = analyzer._scan_keywords("bank details: bank, bank")
+
+        assert dict(hits["financial"]) == {"bank": 3}
+
+    def test_detects_financial_keywords(self, analyzer):
+        """Should report distinct financial keywords as critical."""
+        report = analyzer.analyze(Email(text=PHISHING_TEXT), *_predictions(0.8, 0.9))
+
+        (financial,) = [ioc for ioc in report.iocs if ioc.type == "keyword_financial"]
+        assert financial.severity == "critical"
+        assert {"bank", "account", "password", "verify"} <= set(financial.value.split(", "))
+
+    def test_detects_suspicious_patterns(self, analyzer):
+        """Should report exclamation marks and generic link text."""
+        report = analyzer.analyze(Email(text=PHISHING_TEXT), *_predictions(0.8, 0.9))
+
+        patterns = {ioc.description: ioc for ioc in report.iocs if ioc.type == "pattern"}
+        assert patterns["Excessive exclamation marks"].value == "!!!"
+        assert patterns["Generic link text (case insensitive)"].value == "click here"
+        assert patterns["Non-HTTPS URL"].value == "http://secure-login.tk"
+
+    def test_uppercase_text_passes_literal_prefilter(self, analyzer):
+        """Prefilter literals are checked on lowercased text, so case is ignored."""
+        report = analyzer.analyze(
+            Email(text="CLICK HERE: HTTP://EXAMPLE.COM"), *_predictions(0.1, 0.1)
+        )
+
+        descriptions = {ioc.description for ioc in report.iocs if ioc.type == "pattern"}
+        assert {"Generic link text (case insensitive)", "Non-HTTPS URL"} <= descriptions
+        assert [ioc.value for ioc in report.iocs if ioc.type == "url"] == ["HTTP://EXAMPLE.COM"]
+
+    def test_lowercase_scan_reports_original_case(self, analyzer):
+        """Patterns scanned on the lowercased body should still report original text."""
+        report = analyzer.analyze(
+            Email(text="Please Click  Here: http://Example.com/Path"), *_predictions(0.1, 0.1)
+        )
+
+        patterns = {ioc.description: ioc.value for ioc in report.iocs if ioc.type == "pattern"}
+        assert patterns["Generic link text (case insensitive)"] == "Click  Here"
+        assert patterns["Non-HTTPS URL"] == "http://Example.com/Path"
+
+    def test_length_changing_lowercase_reports_original_case(self, analyzer):
+        """Characters that grow when lowercased ("İ") must not lowercase reported URLs."""
+        report = analyzer.analyze(
+            Email(text="İstanbul office, Click Here: http://Evil.ru/Reset?Token=AbC"),
+            *_predictions(0.1, 0.1),
+        )
+
+        patterns = {ioc.description: ioc.value for ioc in report.iocs if ioc.type == "pattern"}
+        assert patterns["Generic link text (case insensitive)"] == "Click Here"
+        assert patterns["Non-HTTPS URL"] == "http://Evil.ru/Reset?Token=AbC"
+        assert [ioc.value for ioc in report.iocs if ioc.type == "url"] == [
+            "http://Evil.ru/Reset?Token=AbC"
+        ]
+
+    def test_capitalization_pattern_is_case_sensitive(self, analyzer):
+        """Long lowercase words are not excessive capitalization."""
+        report = analyzer.analyze(
+            Email(text="Important information about CONGRATULATIONS"), *_predictions(0.1, 0.1)
+        )
+
+        patterns = {ioc.description: ioc.value for ioc in report.iocs if ioc.type == "pattern"}
+        assert patterns == {"Excessive capitalization": "CONGRATULATIONS"}
+
+    def test_pattern_count_is_capped(self, analyzer):
+        """Pathological inputs should stop counting at MAX_PATTERN_MATCHES."""
+        report = analyzer.analyze(
+            Email(text="$1 " * (MAX_PATTERN_MATCHES + 50)), *_predictions(0.1, 0.1)
+        )
+
+        money = next(ioc for ioc in report.iocs if ioc.description == "Money amounts")
+        assert money.count == MAX_PATTERN_MATCHES
+        assert money.value == "$1, $1, $1"
+
+    def test_risky_sender_domain(self, analyzer):
+        """Should flag senders on high-risk TLDs."""
+        report = analyzer.analyze(
+            Email(text="Hello", sender="admin@bank-support.ru"), *_predictions(0.1, 0.1)
+        )
+
+        (sender,) = [ioc for ioc in report.iocs if ioc.type == "sender"]
+        assert sender.value == "bank-support.ru"
+
+    def test_clean_email_has_no_iocs(self, analyzer):
+        """Plain email should produce no IOCs."""
+        report = analyzer.analyze(Email(text="See you at lunch"), *_predictions(0.1, 0.1))
+
+        assert report.iocs == []
+
+
+class TestThreatAnalyzerReport:
+    """Test risk score, vectors and recommendations."""
+
+    def test_risk_score_weights_phishing(self, analyzer):
+        """Phishing should weigh 0.7 and spam 0.3."""
+        report = analyzer.analyze(Email(text="Hello"), *_predictions(0.5, 1.0))
+
+        assert report.risk_score == 85
+
+    def test_threat_vectors(self, analyzer):
+        """Should identify social engineering, credential harvesting and phishing."""
+        report = analyzer.analyze(Email(text=PHISHING_TEXT), *_predictions(0.8, 0.9))
+
+        names = [vector.name for vector in report.threat_vectors]
+        assert names == [
+            "Social Engineering",
+            "Credential Harvesting",
+            "Phishing Attack",
+            "Spam Campaign",
+        ]
+
+    def test_recommendations_for_dangerous_email(self, analyzer):
+        """High-risk email should be quarantined and links blocked."""
+        report = analyzer.analyze(Email(text=PHISHING_TEXT), *_predictions(0.8, 0.9))
+
+        assert "🚫 Quarantine this email immediately" in report.recommendations
+        assert "🛡️  Add URLs to blocklist" in report.recommendations
+
+    def test_recommendations_for_safe_email(self, analyzer):
+        """Low-risk email should be marked as safe."""
+        report = analyzer.analyze(Email(text="See you at lunch"), *_predictions(0.1, 0.1))
+
+        assert report.recommendations == ["✅ Email appears legitimate, safe to process"]
+
+
+class TestThreatAnalyzerTriggerWords:
+    """Test trigger word extraction gating."""
+
+    @pytest.fixture
+    def explainer(self):
+        """Feature explainer double returning one contribution."""
+        explainer = Mock()
+        explainer.explain_prediction.return_value = [("winner", 0.4)]
+        return explainer
+
+    def _analyze(self, analyzer, explainer, spam_prediction, phishing_prediction):
+        return analyzer.analyze(
+            Email(text="WINNER"),
+            spam_prediction,
+            phishing_prediction,
+            spam_model=object(),
+            spam_vectorizer=object(),
+            phishing_model=object(),
+            phishing_vectorizer=object(),
+            feature_explainer=explainer,
+        )
+
+    def test_positive_predictions_are_explained(self, analyzer, explainer):
+        """Both models should be explained when both are likely positive."""
+        report = self._analyze(analyzer, explainer, *_predictions(0.8, 0.6))
+
+        assert [tw.word for tw in report.spam_trigger_words] == ["winner"]
+        assert [tw.category for tw in report.phishing_trigger_words] == ["phishing"]
+
+    def test_confident_negatives_are_skipped(self, analyzer, explainer):
+        """HAM/LEGIT at >70% confidence has a positive probability below the threshold."""
+        # spam: HAM at 0.9 -> P(SPAM)=0.1; phishing: LEGIT at 0.6 -> P(PHISHING)=0.4
+        spam_prediction = SinglePrediction("HAM", 0.9, "spam_detector", "20260105_194125")
+        phishing_prediction = SinglePrediction("LEGIT", 0.6, "phishing_detector", "20260105_195830")
+
+        report = self._analyze(analyzer, explainer, spam_prediction, phishing_prediction)
+
+        assert report.spam_trigger_words == []
+        assert len(report.phishing_trigger_words) == 1
+        explainer.explain_prediction.assert_called_once()
+
+
+class TestThreatAnalyzerBatch:
+    """Test batch analysis."""
+
+    def test_batch_matches_single_analysis(self, analyzer):
+        """Each batch report should equal the per-email report (minus trigger words)."""
+        emails = [Email(text=PHISHING_TEXT), Email(text="See you at lunch")]
+        predictions = [_predictions(0.8, 0.9), _predictions(0.1, 0.1)]
+
+        reports = analyzer.analyze_batch(
+            emails, [p[0] for p in predictions], [p[1] for p in predictions]
+        )
+
+        assert reports == [
+            analyzer.analyze(email, *preds)
+            for email, preds in zip(emails, predictions, strict=True)
+        ]
+
+    def test_batch_risk_scores(self, analyzer):
+        """Batch risk scores should use the same weighting as analyze()."""
+        spam, phishing = zip(_predictions(0.5, 1.0), _predictions(0.0, 0.0), strict=True)
+
+        reports = analyzer.analyze_batch([Email(text="Hello"), Email(text="Hi")], spam, phishing)
+
+        assert [report.risk_score for report in reports] == [85, 0]
+
+    def test_batch_length_mismatch_raises(self, analyzer):
+        """Should reject misaligned inputs."""
+        spam, phishing = _predictions(0.5, 0.5)
+
+        with pytest.raises(ValueError, match="same length"):
+            analyzer.analyze_batch([Email(text="Hello")], [spam, spam], [phishing])
+
+
+class TestThreatAnalyzerIOCCache:
+    """Test IOC memoization."""
+
+    def test_repeated_email_hits_cache(self, analyzer):
+        """Second analysis of the same email should reuse extracted IOCs."""
+        first = analyzer.analyze(Email(text=PHISHING_TEXT), *_predictions(0.8, 0.9))
+        second = analyzer.analyze(Email(text=PHISHING_TEXT), *_predictions(0.2, 0.3))
+
+        assert second.iocs == first.iocs
+        assert second.iocs is not first.iocs
+        assert second.risk_score != first.risk_score
+        assert (analyzer.ioc_cache_hits, analyzer.ioc_cache_misses) == (1, 1)
+
+    def test_sender_is_part_of_key(self, analyzer):
+        """Different senders should not share cached IOCs."""
+        analyzer.analyze(Email(text="Hello", sender="a@example.com"), *_predictions(0.1, 0.1))
+        report = analyzer.analyze(
+            Email(text="Hello", sender="a@example.ru"), *_predictions(0.1, 0.1)
+        )
+
+        assert [ioc.type for ioc in report.iocs] == ["sender"]
+        assert analyzer.ioc_cache_hits == 0
+
+    def test_cache_is_bounded(self):
+        """Least recently used emails should be evicted."""
+        analyzer = ThreatAnalyzer(ioc_cache_size=1)
+        analyzer.analyze(Email(text="first"), *_predictions(0.1, 0.1))
+        analyzer.analyze(Email(text="second"), *_predictions(0.1, 0.1))
+        analyzer.analyze(Email(text="first"), *_predictions(0.1, 0.1))
+
+        assert analyzer.ioc_cache_hits == 0
+
+    def test_cache_disabled(self):
+        """Size 0 should always extract."""
+        analyzer = ThreatAnalyzer(ioc_cache_size=0)
+        analyzer.analyze(Email(text="first"), *_predictions(0.1, 0.1))
+        analyzer.analyze(Email(text="first"), *_predictions(0.1, 0.1))
+
+        assert analyzer.ioc_cache_hits == 0